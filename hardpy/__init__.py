@@ -3,8 +3,10 @@
 
 from hardpy.common.stand_cloud import StandCloudConnector, StandCloudError
 from hardpy.pytest_hardpy.db import (
+    AttachmentStore,
     Chart,
     Instrument,
+    MeasurementBatch,
     NumericMeasurement,
     StringMeasurement,
     SubUnit,
@@ -14,11 +16,13 @@ from hardpy.pytest_hardpy.pytest_call import (
     clear_operator_message,
     get_current_attempt,
     get_current_report,
+    instrument_lock,
     run_dialog_box,
     set_batch_serial_number,
     set_case_artifact,
     set_case_chart,
     set_case_measurement,
+    set_case_measurements,
     set_driver_info,
     set_dut_info,
     set_dut_name,
@@ -45,11 +49,13 @@ from hardpy.pytest_hardpy.pytest_call import (
 from hardpy.pytest_hardpy.result import (
     CouchdbLoader,
     StandCloudLoader,
+    StandCloudOutbox,
     StandCloudReader,
 )
 from hardpy.pytest_hardpy.result.couchdb_config import CouchdbConfig
 from hardpy.pytest_hardpy.utils import (
     BaseWidget,
+    ChartDecimation,
     ChartType,
     CheckboxWidget,
     ComparisonOperation,
@@ -58,6 +64,7 @@ from hardpy.pytest_hardpy.utils import (
     Group,
     HTMLComponent,
     ImageComponent,
+    InstrumentLockTimeoutError,
     MultistepWidget,
     NumericInputWidget,
     RadiobuttonWidget,
@@ -67,8 +74,10 @@ from hardpy.pytest_hardpy.utils import (
 )
 
 __all__ = [
+    "AttachmentStore",
     "BaseWidget",
     "Chart",
+    "ChartDecimation",
     "ChartType",
     "CheckboxWidget",
     "ComparisonOperation",
@@ -81,6 +90,8 @@ __all__ = [
     "HTMLComponent",
     "ImageComponent",
     "Instrument",
+    "InstrumentLockTimeoutError",
+    "MeasurementBatch",
     "MultistepWidget",
     "NumericInputWidget",
     "NumericMeasurement",
@@ -88,6 +99,7 @@ __all__ = [
     "StandCloudConnector",
     "StandCloudError",
     "StandCloudLoader",
+    "StandCloudOutbox",
     "StandCloudReader",
     "StepWidget",
     "StringMeasurement",
@@ -97,11 +109,13 @@ __all__ = [
     "clear_operator_message",
     "get_current_attempt",
     "get_current_report",
+    "instrument_lock",
     "run_dialog_box",
     "set_batch_serial_number",
     "set_case_artifact",
     "set_case_chart",
     "set_case_measurement",
+    "set_case_measurements",
     "set_driver_info",
     "set_dut",
     "set_dut_info",
@@ -2,6 +2,7 @@
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 from __future__ import annotations
 
+import json
 import socket
 import sys
 import urllib
@@ -10,6 +11,7 @@ from typing import Annotated, Optional
 
 import requests
 import typer
+from pydantic import ValidationError
 from uvicorn import run as uvicorn_run
 
 from hardpy.cli.template import TemplateGenerator
@@ -20,6 +22,9 @@ from hardpy.common.stand_cloud import (
     login as auth_login,
     logout as auth_logout,
 )
+from hardpy.pytest_hardpy.db.schema import ResultRunStore
+from hardpy.pytest_hardpy.result import CouchdbLoader
+from hardpy.pytest_hardpy.result.couchdb_config import CouchdbConfig
 
 if __debug__:
     from urllib3 import disable_warnings
@@ -259,6 +264,56 @@ def sc_logout(address: Annotated[str, typer.Argument()]) -> None:
         print(f"HardPy logout failed from {address}")
 
 
+@cli.command()
+def import_reports(
+    reports_dir: Annotated[str, typer.Argument()],
+    tests_dir: str | None = typer.Option(
+        None,
+        help="Test directory with the hardpy.toml. Current directory by default.",
+    ),
+    batch_size: int = typer.Option(
+        500,
+        min=1,
+        help="Number of reports saved by one request.",
+    ),
+    workers: int = typer.Option(
+        4,
+        min=1,
+        help="Number of concurrent requests.",
+    ),
+) -> None:
+    """Import JSON reports to the CouchDB report database.
+
+    Each JSON file of the reports directory contains one report document,
+    for example, a report exported from the report database of another test stand.
+
+    Args:
+        reports_dir (str): Directory with the JSON reports
+        tests_dir (str | None): Test directory. Current directory by default
+        batch_size (int): Number of reports saved by one request
+        workers (int): Number of concurrent requests
+    """
+    config = _get_config(tests_dir)
+    reports: list[ResultRunStore] = []
+    for report_path in sorted(Path(reports_dir).glob("*.json")):
+        try:
+            report_data = json.loads(report_path.read_text(encoding="utf-8"))
+            reports.append(ResultRunStore.model_validate(report_data))
+        except (OSError, ValueError, ValidationError) as exc:  # noqa: PERF203
+            print(f"Report {report_path.name} is skipped: {exc}")
+
+    couchdb_config = CouchdbConfig(
+        user=config.database.user,
+        password=config.database.password,
+        host=config.database.host,
+        port=config.database.port,
+    )
+    errors = CouchdbLoader(couchdb_config).load_many(reports, batch_size, workers)
+    for report_id, error in errors.items():
+        print(f"Report {report_id} is not imported: {error}")
+    print(f"Imported {len(reports) - len(errors)} of {len(reports)} reports.")
+
+
 def _get_config(tests_dir: str | None = None, validate: bool = False) -> HardpyConfig:
     dir_path = Path.cwd() / tests_dir if tests_dir else Path.cwd()
     config_manager = ConfigManager()
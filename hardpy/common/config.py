@@ -19,10 +19,15 @@ class DatabaseConfig(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
+    backend: str = "couchdb"
     user: str = "dev"
     password: str = "dev"
     host: str = "localhost"
     port: int = 5984
+    flush_interval_ms: int = 50
+    partial_update: bool = False
+    pool_size: int = 10
+    sqlite_path: str = ".hardpy/database.sqlite3"
     doc_id: str = Field(exclude=True, default="")
     url: str = Field(exclude=True, default="")
 
@@ -49,6 +54,8 @@ class FrontendConfig(BaseModel):
     host: str = "localhost"
     port: int = 8000
     language: str = "en"
+    warm_runner: bool = False
+    slots: int = 1
 
 
 class StandCloudConfig(BaseModel):
@@ -75,9 +82,17 @@ class HardpyConfig(BaseModel, extra="allow"):
         """Get database document name."""
         self.database.doc_id = self.get_doc_id()
 
-    def get_doc_id(self) -> str:
-        """Update database document name."""
-        return f"{self.frontend.host}_{self.frontend.port}"
+    def get_doc_id(self, slot: str | None = None) -> str:
+        """Update database document name.
+
+        Args:
+            slot (str | None): DUT slot in the multi-slot mode
+
+        Returns:
+            str: database document name
+        """
+        doc_id = f"{self.frontend.host}_{self.frontend.port}"
+        return f"{doc_id}_{slot}" if slot else doc_id
 
 
 class ConfigManager(metaclass=SingletonMeta):
@@ -85,7 +100,7 @@ class ConfigManager(metaclass=SingletonMeta):
 
     def __init__(self) -> None:
         self._config = HardpyConfig()
-        self._test_path = Path.cwd()
+        self._tests_path = Path.cwd()
 
     @property
     def config(self) -> HardpyConfig:
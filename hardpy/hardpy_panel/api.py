@@ -2,21 +2,42 @@
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 from __future__ import annotations
 
+import asyncio
+import json
 import os
 import re
 from enum import Enum
 from pathlib import Path
+from time import monotonic
 from typing import Annotated
 from urllib.parse import unquote
 
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from pycouchdb.exceptions import NotFound
 
 from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy.db import AttachmentStore
+from hardpy.pytest_hardpy.db.backend import SqliteBackend
 from hardpy.pytest_hardpy.pytest_wrapper import PyTestWrapper
+from hardpy.pytest_hardpy.result import StandCloudOutbox, StandCloudUploader
 
 app = FastAPI()
 app.state.pytest_wrp = PyTestWrapper()
+app.state.sqlite_backends = {}
+app.state.sc_uploader = None
+if ConfigManager().config.stand_cloud.address:
+    # the reports of the StandCloud outbox are uploaded between the test runs
+    app.state.sc_uploader = StandCloudUploader(StandCloudOutbox())
+    app.state.sc_uploader.start()
+
+# maximum duration of the changes feed request in seconds
+_CHANGES_FEED_TIMEOUT = 10
+# interval of the database checks while waiting for changes in seconds
+_CHANGES_FEED_POLL_INTERVAL = 0.05
+# attachments are addressed by the data hash and never change
+_ATTACHMENT_CACHE_CONTROL = "public, max-age=31536000, immutable"
 
 
 class Status(str, Enum):
@@ -30,6 +51,7 @@ class Status(str, Enum):
     COLLECTED = "collected"
     BUSY = "busy"
     READY = "ready"
+    QUEUED = "queued"
     ERROR = "error"
 
 
@@ -44,33 +66,97 @@ def hardpy_config() -> dict:
 
 
 @app.get("/api/start")
-def start_pytest(args: Annotated[list[str] | None, Query()] = None) -> dict:
+def start_pytest(
+    args: Annotated[list[str] | None, Query()] = None,
+    slot: str | None = None,
+) -> dict:
     """Start pytest subprocess.
 
     Args:
         args: List of arguments in key=value format
+        slot: DUT slot, all free slots if not specified
 
     Returns:
         dict[str, RunStatus]: run status
     """
+    _check_slot(slot)
     if args is None:
         args_dict = []
     else:
         args_dict = dict(arg.split("=", 1) for arg in args if "=" in arg)
 
-    if app.state.pytest_wrp.start(start_args=args_dict):
+    if app.state.pytest_wrp.start(start_args=args_dict, slot=slot):
         return {"status": Status.STARTED}
     return {"status": Status.BUSY}
 
 
+@app.post("/api/queue")
+def enqueue_pytest(
+    args: Annotated[list[str] | None, Query()] = None,
+    slot: str | None = None,
+) -> dict:
+    """Add test run to the run queue.
+
+    The run is started as soon as the DUT slot is free.
+
+    Args:
+        args: List of arguments in key=value format
+        slot: DUT slot, any free slot if not specified
+
+    Returns:
+        dict: run status, run id and queue depth
+    """
+    _check_slot(slot)
+    args_dict = {}
+    if args is not None:
+        args_dict = dict(arg.split("=", 1) for arg in args if "=" in arg)
+
+    pytest_wrp = app.state.pytest_wrp
+    run_id = pytest_wrp.enqueue(start_args=args_dict, slot=slot)
+    return {
+        "status": Status.QUEUED,
+        "run_id": run_id,
+        "queue_depth": pytest_wrp.queue_depth,
+    }
+
+
+@app.get("/api/queue")
+def run_queue() -> dict:
+    """Get the run queue.
+
+    Returns:
+        dict: queue depth, queued runs and the last runs
+            with the waiting and execution times in seconds
+    """
+    return app.state.pytest_wrp.get_queue_info()
+
+
+@app.delete("/api/queue")
+def clear_run_queue(slot: str | None = None) -> dict:
+    """Remove the queued test runs.
+
+    Args:
+        slot: DUT slot, all runs if not specified
+
+    Returns:
+        dict: run status and number of removed runs
+    """
+    _check_slot(slot)
+    return {"status": Status.READY, "removed": app.state.pytest_wrp.clear_queue(slot)}
+
+
 @app.get("/api/stop")
-def stop_pytest() -> dict:
-    """Stop pytest subprocess.
+def stop_pytest(slot: str | None = None) -> dict:
+    """Stop pytest subprocess and remove the queued runs of the slot.
+
+    Args:
+        slot: DUT slot, all slots if not specified
 
     Returns:
         dict[str, RunStatus]: run status
     """
-    if app.state.pytest_wrp.stop():
+    _check_slot(slot)
+    if app.state.pytest_wrp.stop(slot):
         return {"status": Status.STOPPED}
     return {"status": Status.READY}
 
@@ -89,25 +175,62 @@ def collect_pytest() -> dict:
 
 
 @app.get("/api/status")
-def status() -> dict:
+def status(slot: str | None = None) -> dict:
     """Get pytest subprocess status.
 
+    The response contains the run queue depth. In the multi-slot mode
+    the response contains the status of each slot.
+
+    Args:
+        slot: DUT slot, any slot if not specified
+
     Returns:
         dict[str, RunStatus]: run status
     """
-    is_running = app.state.pytest_wrp.is_running()
+    _check_slot(slot)
+    pytest_wrp = app.state.pytest_wrp
+    is_running = pytest_wrp.is_running(slot)
     status = Status.BUSY if is_running else Status.READY
-    return {"status": status}
+    response: dict = {
+        "status": status,
+        "queue_depth": pytest_wrp.queue_depth,
+    }
+    slots = [slot_id for slot_id in pytest_wrp.slots if slot_id is not None]
+    if slot is None and slots:
+        response["slots"] = {
+            slot_id: Status.BUSY if pytest_wrp.is_running(slot_id) else Status.READY
+            for slot_id in slots
+        }
+    return response
+
+
+@app.get("/api/stand_cloud_outbox")
+def stand_cloud_outbox() -> dict:
+    """Get StandCloud outbox status.
+
+    Returns:
+        dict: number of reports waiting for upload, number of rejected reports
+            and the last upload error
+    """
+    if app.state.sc_uploader is not None:
+        return app.state.sc_uploader.status
+    outbox = StandCloudOutbox()
+    return {"backlog": outbox.backlog, "rejected": outbox.rejected, "last_error": None}
 
 
 @app.get("/api/couch")
-def couch_connection() -> dict:
+def couch_connection(request: Request) -> dict:
     """Get couchdb connection string.
 
+    With the SQLite database backend, the connection string points to
+    the CouchDB compatible API of the operator panel.
+
     Returns:
         dict[str, str]: couchdb connection string
     """
     config_manager = ConfigManager()
+    if config_manager.config.database.backend == "sqlite":
+        return {"connection_str": f"{request.base_url}api/db"}
 
     return {
         "connection_str": config_manager.config.database.url,
@@ -115,22 +238,26 @@ def couch_connection() -> dict:
 
 
 @app.get("/api/database_document_id")
-def database_document_id() -> dict:
+def database_document_id(slot: str | None = None) -> dict:
     """Get couchdb syncronized document name.
 
+    Args:
+        slot: DUT slot, the first slot if not specified
+
     Returns:
         dict[str, str]: couchdb connection string
     """
-    config_manager = ConfigManager()
-    return {"document_id": config_manager.config.database.doc_id}
+    _check_slot(slot)
+    return {"document_id": app.state.pytest_wrp.get_doc_id(slot)}
 
 
 @app.post("/api/confirm_dialog_box/{dialog_box_output}")
-def confirm_dialog_box(dialog_box_output: str) -> dict:
+def confirm_dialog_box(dialog_box_output: str, slot: str | None = None) -> dict:
     """Confirm dialog box.
 
     Args:
         dialog_box_output (str): output data from dialog box.
+        slot (str | None): DUT slot
 
     Returns:
         dict[str, RunStatus]: run status
@@ -143,26 +270,188 @@ def confirm_dialog_box(dialog_box_output: str) -> dict:
         unquoted_string,
     )
 
-    if app.state.pytest_wrp.send_data(str(decoded_string)):
+    _check_slot(slot)
+    if app.state.pytest_wrp.send_data(str(decoded_string), slot):
         return {"status": Status.BUSY}
     return {"status": Status.ERROR}
 
 
 @app.post("/api/confirm_operator_msg/{is_msg_visible}")
-def confirm_operator_msg(is_msg_visible: str) -> dict:
+def confirm_operator_msg(is_msg_visible: str, slot: str | None = None) -> dict:
     """Confirm operator msg.
 
     Args:
         is_msg_visible (bool): is operator message is visible
+        slot (str | None): DUT slot
 
     Returns:
         dict[str, RunStatus]: run status
     """
-    if app.state.pytest_wrp.send_data(str(is_msg_visible)):
+    _check_slot(slot)
+    if app.state.pytest_wrp.send_data(str(is_msg_visible), slot):
         return {"status": Status.BUSY}
     return {"status": Status.ERROR}
 
 
+@app.get("/api/attachment/{attachment_id}")
+def attachment(request: Request, attachment_id: str) -> Response:
+    """Stream attachment of the attachments database.
+
+    The attachment id is the hash of the attachment data,
+    so the response is cached by the browser without revalidation.
+    The repeated request with the attachment id in the `If-None-Match`
+    header is answered without the attachment data.
+
+    Args:
+        request (Request): request with the optional `If-None-Match` header
+        attachment_id (str): attachment id
+
+    Returns:
+        Response: attachment data
+    """
+    etag = f'"{attachment_id}"'
+    headers = {"Cache-Control": _ATTACHMENT_CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers=headers)
+    try:
+        chunks, content_type = AttachmentStore().get(attachment_id)
+    except NotFound as exc:
+        raise HTTPException(status_code=404, detail="missing") from exc
+    return StreamingResponse(chunks, media_type=content_type, headers=headers)
+
+
+@app.get("/api/db/{db_name}")
+@app.get("/api/db/{db_name}/")
+def database_info(db_name: str) -> dict:
+    """Get SQLite database info in the CouchDB format.
+
+    Args:
+        db_name (str): database name
+
+    Returns:
+        dict: database info
+    """
+    backend = _get_sqlite_backend(db_name)
+    return {
+        "db_name": db_name,
+        "doc_count": len(backend.get_all_docs()),
+        "update_seq": backend.get_update_seq(),
+    }
+
+
+@app.get("/api/db/{db_name}/_all_docs")
+def database_all_docs(db_name: str, include_docs: bool = False) -> dict:
+    """Get all SQLite database documents in the CouchDB format.
+
+    Args:
+        db_name (str): database name
+        include_docs (bool): include documents in the rows
+
+    Returns:
+        dict: database documents
+    """
+    backend = _get_sqlite_backend(db_name)
+    rows = []
+    for doc in backend.get_all_docs():
+        row = {"id": doc["_id"], "key": doc["_id"], "value": {"rev": doc["_rev"]}}
+        if include_docs:
+            row["doc"] = doc
+        rows.append(row)
+    return {"total_rows": len(rows), "offset": 0, "rows": rows}
+
+
+@app.get("/api/db/{db_name}/_changes")
+@app.post("/api/db/{db_name}/_changes")
+async def database_changes(  # noqa: PLR0913, PLR0917
+    request: Request,
+    db_name: str,
+    since: str = "0",
+    feed: str = "normal",
+    timeout: int | None = None,
+    heartbeat: int | None = None,
+    include_docs: bool = False,
+    doc_ids: str | None = None,
+) -> dict:
+    """Get SQLite database changes in the CouchDB changes feed format.
+
+    The longpoll feed waits for changes, other feeds return immediately.
+
+    Args:
+        request (Request): request with the optional `doc_ids` body
+        db_name (str): database name
+        since (str): database update sequence or `now`
+        feed (str): feed type
+        timeout (int | None): longpoll timeout in milliseconds
+        heartbeat (int | None): heartbeat interval in milliseconds
+        include_docs (bool): include documents in the results
+        doc_ids (str | None): JSON list of document ids
+
+    Returns:
+        dict: database changes
+    """
+    backend = _get_sqlite_backend(db_name)
+    ids = json.loads(doc_ids) if doc_ids else None
+    if request.method == "POST":
+        body = await request.body()
+        ids = json.loads(body).get("doc_ids", ids) if body else ids
+    if since == "now":
+        since = backend.get_update_seq()
+
+    wait_ms = min(filter(None, (timeout, heartbeat)), default=None)
+    wait_time = _CHANGES_FEED_TIMEOUT if wait_ms is None else wait_ms / 1000
+    deadline = monotonic() + min(wait_time, _CHANGES_FEED_TIMEOUT)
+    results = backend.get_changes(since, ids)
+    while feed == "longpoll" and not results and monotonic() < deadline:
+        await asyncio.sleep(_CHANGES_FEED_POLL_INTERVAL)
+        results = backend.get_changes(since, ids)
+
+    if include_docs:
+        docs = {doc["_id"]: doc for doc in backend.get_all_docs()}
+        for result in results:
+            if result["id"] in docs:
+                result["doc"] = docs[result["id"]]
+    last_seq = results[-1]["seq"] if results else since
+    return {"results": results, "last_seq": last_seq, "pending": 0}
+
+
+@app.get("/api/db/{db_name}/{doc_id}")
+def database_document(db_name: str, doc_id: str) -> dict:
+    """Get SQLite database document.
+
+    Args:
+        db_name (str): database name
+        doc_id (str): document id
+
+    Returns:
+        dict: document
+    """
+    backend = _get_sqlite_backend(db_name)
+    try:
+        return backend.get(doc_id)
+    except NotFound as exc:
+        raise HTTPException(status_code=404, detail="missing") from exc
+
+
+def _check_slot(slot: str | None) -> None:
+    if slot is not None and slot not in app.state.pytest_wrp.slots:
+        raise HTTPException(status_code=404, detail=f"Unknown DUT slot: {slot}")
+
+
+def _get_sqlite_backend(db_name: str) -> SqliteBackend:
+    config_manager = ConfigManager()
+    config = config_manager.config
+    if config.database.backend != "sqlite" or db_name not in {
+        "statestore",
+        "runstore",
+    }:
+        raise HTTPException(status_code=404, detail="Database does not exist.")
+    backends = app.state.sqlite_backends
+    if db_name not in backends:
+        sqlite_path = config_manager.tests_path / config.database.sqlite_path
+        backends[db_name] = SqliteBackend(sqlite_path, db_name)
+    return backends[db_name]
+
+
 if "DEBUG_FRONTEND" not in os.environ:
     app.mount(
         "/",
@@ -5,6 +5,8 @@ import * as React from "react";
 import { AnchorButton, AnchorButtonProps } from "@blueprintjs/core";
 import { withTranslation, WithTranslation } from "react-i18next";
 
+import { withSlot } from "../slot/Slot";
+
 type Props = { testing_status: string } & WithTranslation;
 
 type State = {
@@ -53,7 +55,7 @@ class StartStopButton extends React.Component<Props, State> {
    * @private
    */
   private hardpy_start(): void {
-    this.hardpy_call("api/start");
+    this.hardpy_call(withSlot("api/start"));
   }
 
   /**
@@ -64,7 +66,7 @@ class StartStopButton extends React.Component<Props, State> {
     if (this.state.isStopButtonDisabled) {
       return;
     }
-    this.hardpy_call("api/stop");
+    this.hardpy_call(withSlot("api/stop"));
 
     // Disable the stop button for some time
     this.setState({ isStopButtonDisabled: true });
@@ -27,6 +27,9 @@ import {
 } from "./DialogUtils";
 import { useTranslation } from "react-i18next";
 
+import { withSlot } from "../slot/Slot";
+import { getImageSource, loadImage, onImageLoad } from "./ImageSource";
+
 const HEX_BASE = 16;
 const screenWidth = window.screen.width;
 const screenHeight = window.screen.height;
@@ -40,7 +43,7 @@ interface Props {
   width?: string;
   widget_type?: WidgetType;
   widget_info?: WidgetInfo;
-  image_base64?: string;
+  image_src?: string;
   image_width?: number;
   image_border?: number;
   is_visible?: boolean;
@@ -64,6 +67,7 @@ export enum WidgetType {
 
 interface ImageComponent {
   base64?: string;
+  attachment_id?: string;
   width?: number;
   border?: number;
 }
@@ -408,7 +412,7 @@ const renderMultistep = (
               ))}
               {step.info.image && (
                 <img
-                  src={`data:image/image;base64,${step.info.image?.base64}`}
+                  src={getImageSource(step.info.image)}
                   alt={""}
                   style={{
                     maxWidth: `${Math.min(
@@ -512,7 +516,7 @@ export function StartConfirmationDialog(props: Readonly<Props>): JSX.Element {
    */
   const handleClose = () => {
     setDialogOpen(false);
-    fetch("api/stop")
+    fetch(withSlot("api/stop"))
       .then((response) => {
         if (response.ok) {
           return response.text();
@@ -609,7 +613,7 @@ export function StartConfirmationDialog(props: Readonly<Props>): JSX.Element {
 
     try {
       const response = await axios.post(
-        `/api/confirm_dialog_box/${textToSend}`
+        withSlot(`/api/confirm_dialog_box/${textToSend}`)
       );
       console.log(response.data);
     } catch (error) {
@@ -828,16 +832,14 @@ export function StartConfirmationDialog(props: Readonly<Props>): JSX.Element {
       };
 
       props.widget_info?.steps?.forEach((step) => {
-        if (step.info.image) {
-          const base64Src = `data:image/image;base64,${step.info.image?.base64}`;
-
-          const image = new Image();
-          image.src = base64Src;
-          image.onload = () =>
+        const image = loadImage(step.info.image);
+        if (image) {
+          onImageLoad(image, (loadedImage) =>
             handleStepImageLoad(
-              image,
+              loadedImage,
               step.info.image?.width ?? IMAGE_SCALE_FACTOR
-            );
+            )
+          );
         }
         if (step.info.html?.code_or_url) {
           htmlFound = true;
@@ -912,10 +914,10 @@ export function StartConfirmationDialog(props: Readonly<Props>): JSX.Element {
             t
           )}
         <p> </p>
-        {props.image_base64 && (
+        {props.image_src && (
           <div className="image-container">
             <img
-              src={`data:image/image;base64,${props.image_base64}`}
+              src={props.image_src}
               alt={""}
               onLoad={handleImageLoad}
               style={{
@@ -0,0 +1,86 @@
+// Copyright (c) 2025 Everypin
+// GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+export interface ImageSourceInfo {
+  base64?: string;
+  attachment_id?: string;
+}
+
+// maximum number of the loaded attachment images kept by the panel
+const IMAGE_CACHE_SIZE = 64;
+
+// loaded attachment images by the attachment id, the oldest image is the first
+const imageCache = new Map<string, HTMLImageElement>();
+
+/**
+ * Gets the image source of the dialog box or operator message image.
+ * The image stored in the attachments database is loaded from the HardPy API,
+ * the inline image is loaded from its base64 data.
+ * @param {ImageSourceInfo | undefined} image - The image info.
+ * @returns {string | undefined} The image source, or undefined if there is no image data.
+ */
+export function getImageSource(image?: ImageSourceInfo): string | undefined {
+  if (image?.attachment_id) {
+    return `/api/attachment/${encodeURIComponent(image.attachment_id)}`;
+  }
+  if (image?.base64) {
+    return `data:image/image;base64,${image.base64}`;
+  }
+  return undefined;
+}
+
+/**
+ * Loads the dialog box or operator message image.
+ * The attachment images are kept by the attachment id, so the same image
+ * of the next dialog box is not requested and decoded again.
+ * @param {ImageSourceInfo | undefined} image - The image info.
+ * @returns {HTMLImageElement | undefined} The loading or loaded image, or undefined if there is no image data.
+ */
+export function loadImage(
+  image?: ImageSourceInfo
+): HTMLImageElement | undefined {
+  const src = getImageSource(image);
+  if (src === undefined) {
+    return undefined;
+  }
+  const attachmentId = image?.attachment_id;
+  if (!attachmentId) {
+    const inlineImage = new Image();
+    inlineImage.src = src;
+    return inlineImage;
+  }
+
+  let cachedImage = imageCache.get(attachmentId);
+  if (cachedImage) {
+    // the recently used image is moved to the end of the cache
+    imageCache.delete(attachmentId);
+  } else {
+    cachedImage = new Image();
+    cachedImage.src = src;
+  }
+  imageCache.set(attachmentId, cachedImage);
+  if (imageCache.size > IMAGE_CACHE_SIZE) {
+    const oldestId = imageCache.keys().next().value;
+    if (oldestId !== undefined) {
+      imageCache.delete(oldestId);
+    }
+  }
+  return cachedImage;
+}
+
+/**
+ * Calls the handler when the image is loaded,
+ * immediately if the image is already loaded.
+ * @param {HTMLImageElement} image - The image.
+ * @param {function} onLoad - The handler of the loaded image.
+ */
+export function onImageLoad(
+  image: HTMLImageElement,
+  onLoad: (image: HTMLImageElement) => void
+): void {
+  if (image.complete && image.naturalWidth > 0) {
+    onLoad(image);
+    return;
+  }
+  image.addEventListener("load", () => onLoad(image), { once: true });
+}
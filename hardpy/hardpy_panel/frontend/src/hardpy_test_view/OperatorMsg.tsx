@@ -19,10 +19,12 @@ import {
 } from "./DialogUtils";
 import { useTranslation } from "react-i18next";
 
+import { withSlot } from "../slot/Slot";
+
 interface StartOperatorMsgDialogProps {
   title?: string;
   msg: string;
-  image_base64?: string;
+  image_src?: string;
   image_width?: number;
   image_border?: number;
   is_visible?: boolean;
@@ -167,7 +169,9 @@ export function StartOperatorMsgDialog(
 
     try {
       const response = await axios.post(
-        `/api/confirm_operator_msg/${JSON.stringify(operatorMessageOpen)}`
+        withSlot(
+          `/api/confirm_operator_msg/${JSON.stringify(operatorMessageOpen)}`
+        )
       );
       console.log(response.data);
     } catch (error) {
@@ -345,10 +349,10 @@ export function StartOperatorMsgDialog(
             {line}
           </p>
         ))}
-        {props.image_base64 && (
+        {props.image_src && (
           <div className="image-container">
             <img
-              src={`data:image/image;base64,${props.image_base64}`}
+              src={props.image_src}
               alt={""} // Use a more descriptive text or an empty string if not available
               onLoad={handleImageLoad}
               style={{
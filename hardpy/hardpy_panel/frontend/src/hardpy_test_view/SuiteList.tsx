@@ -8,6 +8,7 @@ import { withTranslation, WithTranslation } from "react-i18next";
 
 import { TestItem, TestSuiteComponent } from "./TestSuite";
 import { StartOperatorMsgDialog, CLOSED_MESSAGES_KEY } from "./OperatorMsg";
+import { getImageSource } from "./ImageSource";
 
 /**
  * Set of suites
@@ -42,6 +43,7 @@ type Modules = Dictionary<TestItem>;
 
 interface ImageInfo {
   base64?: string;
+  attachment_id?: string;
   format?: string;
   width?: number;
   border?: number;
@@ -222,7 +224,9 @@ export class SuiteList extends React.Component<
                   this.props.db_state.operator_msg?.title ??
                   t("operatorDialog.defaultTitle")
                 }
-                image_base64={this.props.db_state.operator_msg?.image?.base64}
+                image_src={getImageSource(
+                  this.props.db_state.operator_msg?.image
+                )}
                 image_width={this.props.db_state.operator_msg?.image?.width}
                 image_border={this.props.db_state.operator_msg?.image?.border}
                 is_visible={this.props.db_state.operator_msg?.visible}
@@ -15,6 +15,7 @@ import _, { Dictionary } from "lodash";
 import DataTable, { TableColumn } from "react-data-table-component";
 import { LoadingOutlined } from "@ant-design/icons";
 import { StartConfirmationDialog, WidgetType } from "./DialogBox";
+import { getImageSource } from "./ImageSource";
 import { withTranslation, WithTranslation } from "react-i18next";
 
 import { TestNumber } from "./TestNumber";
@@ -33,6 +34,7 @@ interface WidgetDescription {
 
 interface ImageInfo {
   base64?: string;
+  attachment_id?: string;
   format?: string;
   width?: number;
   border?: number;
@@ -396,11 +398,8 @@ export class TestSuite extends React.Component<Props, State> {
     const test = test_topics[rowIndex];
     const { info: widget_info, type: widget_type } =
       test.dialog_box.widget || {};
-    const {
-      base64: image_base64,
-      width: image_width,
-      border: image_border,
-    } = test.dialog_box.image || {};
+    const { width: image_width, border: image_border } =
+      test.dialog_box.image || {};
 
     return this.commonCellRender(
       <div style={{ marginTop: "0.2em", marginBottom: "0.2em" }}>
@@ -413,7 +412,7 @@ export class TestSuite extends React.Component<Props, State> {
               dialog_text={test.dialog_box.dialog_text}
               widget_info={widget_info}
               widget_type={widget_type}
-              image_base64={image_base64}
+              image_src={getImageSource(test.dialog_box.image)}
               image_width={image_width}
               image_border={image_border}
               is_visible={test.dialog_box.visible}
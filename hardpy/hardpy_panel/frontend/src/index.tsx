@@ -14,6 +14,7 @@ import "@blueprintjs/icons/lib/css/blueprint-icons.css";
 import "./i18n";
 import App from "./App";
 import reportWebVitals from "./reportWebVitals";
+import { withSlot } from "./slot/Slot";
 
 function ErrorMessage() {
   const { t } = useTranslation();
@@ -50,7 +51,7 @@ async function getSyncURL(): Promise<string | undefined> {
  */
 async function getDatabaseDocumentId(): Promise<string> {
   try {
-    const response = await fetch("/api/database_document_id");
+    const response = await fetch(withSlot("/api/database_document_id"));
     const data = await response.json();
     return data.document_id;
   } catch (error) {
@@ -0,0 +1,24 @@
+// Copyright (c) 2025 Everypin
+// GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+/**
+ * Gets the DUT slot of the operator panel page from the `slot` URL parameter.
+ * @returns {string | null} The DUT slot, or null if the parameter is not set.
+ */
+export function getSlot(): string | null {
+  return new URLSearchParams(window.location.search).get("slot");
+}
+
+/**
+ * Adds the DUT slot of the operator panel page to the API URL.
+ * @param {string} url - The API URL.
+ * @returns {string} The API URL with the slot parameter.
+ */
+export function withSlot(url: string): string {
+  const slot = getSlot();
+  if (slot === null) {
+    return url;
+  }
+  const separator = url.includes("?") ? "&" : "?";
+  return `${url}${separator}slot=${encodeURIComponent(slot)}`;
+}
@@ -0,0 +1,70 @@
+// Copyright (c) 2025 Everypin
+// GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+import * as React from "react";
+import { AnchorButton, ButtonGroup, Intent } from "@blueprintjs/core";
+
+import { getSlot } from "./Slot";
+
+const STATUS_POLL_INTERVAL_MS = 1000;
+
+/**
+ * Renders the DUT slot buttons in the multi-slot mode.
+ * Each button opens the operator panel page of the slot,
+ * the slots with a running test are highlighted.
+ * @returns {JSX.Element | null} The slot buttons, or null in the single-slot mode.
+ */
+function SlotSelector(): JSX.Element | null {
+  const [slots, setSlots] = React.useState<Record<string, string>>({});
+  const currentSlot = getSlot();
+
+  React.useEffect(() => {
+    let id: NodeJS.Timeout | null = null;
+
+    const updateSlots = () => {
+      fetch("/api/status")
+        .then((response) => response.json())
+        .then((data) => setSlots(data.slots ?? {}))
+        .catch((error) => console.error(error));
+    };
+
+    // the slot status is polled only in the multi-slot mode
+    fetch("/api/hardpy_config")
+      .then((response) => response.json())
+      .then((config) => {
+        if ((config.frontend?.slots ?? 1) > 1) {
+          updateSlots();
+          id = setInterval(updateSlots, STATUS_POLL_INTERVAL_MS);
+        }
+      })
+      .catch((error) => console.error(error));
+
+    return () => {
+      if (id) {
+        clearInterval(id);
+      }
+    };
+  }, []);
+
+  const slotIds = Object.keys(slots);
+  if (slotIds.length === 0) {
+    return null;
+  }
+
+  return (
+    <ButtonGroup>
+      {slotIds.map((slot) => (
+        <AnchorButton
+          key={slot}
+          href={`?slot=${encodeURIComponent(slot)}`}
+          icon="layout-grid"
+          text={slot}
+          active={slot === (currentSlot ?? slotIds[0])}
+          intent={slots[slot] === "busy" ? Intent.PRIMARY : Intent.NONE}
+        />
+      ))}
+    </ButtonGroup>
+  );
+}
+
+export default SlotSelector;
@@ -1,6 +1,7 @@
 # Copyright (c) 2024 Everypin
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 
+from hardpy.pytest_hardpy.db.attachment_store import AttachmentStore
 from hardpy.pytest_hardpy.db.base_store import BaseStore
 from hardpy.pytest_hardpy.db.const import DatabaseField
 from hardpy.pytest_hardpy.db.runstore import RunStore
@@ -8,6 +9,7 @@ from hardpy.pytest_hardpy.db.schema import ResultRunStore, ResultStateStore
 from hardpy.pytest_hardpy.db.stand_type import (
     Chart,
     Instrument,
+    MeasurementBatch,
     NumericMeasurement,
     StringMeasurement,
     SubUnit,
@@ -15,10 +17,12 @@ from hardpy.pytest_hardpy.db.stand_type import (
 from hardpy.pytest_hardpy.db.statestore import StateStore
 
 __all__ = [
+    "AttachmentStore",
     "BaseStore",
     "Chart",
     "DatabaseField",
     "Instrument",
+    "MeasurementBatch",
     "NumericMeasurement",
     "ResultRunStore",
     "ResultStateStore",
@@ -0,0 +1,76 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from hashlib import sha256
+from typing import TYPE_CHECKING
+
+from hardpy.common.singleton import SingletonMeta
+from hardpy.pytest_hardpy.db.base_store import create_backend
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# MIME type of the attachment with unknown content
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+
+class AttachmentStore(metaclass=SingletonMeta):
+    """HardPy attachment storage interface.
+
+    Images and binary artifacts are stored in the separate `attachments`
+    database and are referenced by the attachment id from the statestore
+    and runstore documents. The attachment id is the SHA-256 hash of the data,
+    so the same data is stored only once. The stored attachment ids
+    are not cached, the backend checks them on each put,
+    so the cleared attachments database is filled again.
+
+    The attachments database is not synchronized with the operator panel,
+    the panel gets attachments through the `/api/attachment` endpoint.
+    """
+
+    def __init__(self) -> None:
+        self._db = create_backend("attachments")
+
+    def put(self, data: bytes, content_type: str = DEFAULT_CONTENT_TYPE) -> str:
+        """Store attachment.
+
+        Args:
+            data (bytes): attachment data
+            content_type (str): attachment MIME type
+
+        Returns:
+            str: attachment id
+        """
+        attachment_id = sha256(data).hexdigest()
+        self._db.put_attachment(attachment_id, data, content_type)
+        return attachment_id
+
+    def get(self, attachment_id: str) -> tuple[Iterator[bytes], str]:
+        """Get attachment data by chunks.
+
+        Args:
+            attachment_id (str): attachment id
+
+        Returns:
+            tuple[Iterator[bytes], str]: attachment data chunks and MIME type
+
+        Raises:
+            NotFound: if the attachment is not found
+        """
+        return self._db.get_attachment(attachment_id)
+
+    def read(self, attachment_id: str) -> bytes:
+        """Read attachment data.
+
+        Args:
+            attachment_id (str): attachment id
+
+        Returns:
+            bytes: attachment data
+
+        Raises:
+            NotFound: if the attachment is not found
+        """
+        chunks, _ = self.get(attachment_id)
+        return b"".join(chunks)
@@ -0,0 +1,18 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from hardpy.pytest_hardpy.db.backend.base_backend import IStoreBackend
+from hardpy.pytest_hardpy.db.backend.couchdb_backend import CouchdbBackend
+from hardpy.pytest_hardpy.db.backend.couchdb_connection import (
+    CouchdbConnectionManager,
+)
+from hardpy.pytest_hardpy.db.backend.memory_backend import MemoryBackend
+from hardpy.pytest_hardpy.db.backend.sqlite_backend import SqliteBackend
+
+__all__ = [
+    "CouchdbBackend",
+    "CouchdbConnectionManager",
+    "IStoreBackend",
+    "MemoryBackend",
+    "SqliteBackend",
+]
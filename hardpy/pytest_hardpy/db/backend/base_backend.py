@@ -0,0 +1,137 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class IStoreBackend(ABC):
+    """Storage backend interface of the HardPy database.
+
+    The backend stores JSON documents with revisions in the CouchDB manner
+    and binary attachments by attachment id.
+    Missing documents and attachments raise `pycouchdb.exceptions.NotFound`,
+    revision mismatches raise `pycouchdb.exceptions.Conflict`.
+    """
+
+    @abstractmethod
+    def get(self, doc_id: str) -> dict:
+        """Get document.
+
+        Args:
+            doc_id (str): document id
+
+        Returns:
+            dict: document
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_if_modified(self, doc_id: str, rev: str) -> dict | None:
+        """Get document if its revision differs from the given one.
+
+        Args:
+            doc_id (str): document id
+            rev (str): known document revision
+
+        Returns:
+            dict | None: document, or None if the document is not modified
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, doc: dict) -> dict:
+        """Save document.
+
+        Args:
+            doc (dict): document with the `_id` and the current `_rev` fields
+
+        Returns:
+            dict: saved document with the new revision
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def patch(self, doc_id: str, changes: dict) -> tuple[str, str]:
+        """Apply changes to the latest document revision.
+
+        Args:
+            doc_id (str): document id
+            changes (dict): new values by document keys with dots
+
+        Returns:
+            tuple[str, str]: revision before the changes and the new revision
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, doc_id: str) -> None:
+        """Delete document.
+
+        Args:
+            doc_id (str): document id
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def compact(self) -> None:
+        """Compact database."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_update_seq(self) -> str:
+        """Get the current update sequence of the database.
+
+        Returns:
+            str: database update sequence
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def wait_doc_change(self, doc_id: str, since: str, timeout: float) -> str:
+        """Wait for the document change after the update sequence.
+
+        Args:
+            doc_id (str): document id
+            since (str): database update sequence
+            timeout (float): maximum waiting time in seconds
+
+        Returns:
+            str: last database update sequence
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def put_attachment(
+        self,
+        attachment_id: str,
+        data: bytes,
+        content_type: str,
+    ) -> bool:
+        """Store attachment if the attachment id is not stored yet.
+
+        Args:
+            attachment_id (str): attachment id
+            data (bytes): attachment data
+            content_type (str): attachment MIME type
+
+        Returns:
+            bool: True if the attachment is stored, False if it already exists
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_attachment(self, attachment_id: str) -> tuple[Iterator[bytes], str]:
+        """Get attachment.
+
+        Args:
+            attachment_id (str): attachment id
+
+        Returns:
+            tuple[Iterator[bytes], str]: attachment data chunks and MIME type
+        """
+        raise NotImplementedError
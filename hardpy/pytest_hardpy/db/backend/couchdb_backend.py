@@ -0,0 +1,272 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import json
+from http import HTTPStatus
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from pycouchdb.exceptions import Conflict, GenericError, NotFound
+from requests.exceptions import ConnectionError  # noqa: A004
+
+from hardpy.pytest_hardpy.db.backend.base_backend import IStoreBackend
+from hardpy.pytest_hardpy.db.backend.couchdb_connection import (
+    CouchdbConnectionManager,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pycouchdb.client import Database
+
+# name of the attachment of the attachment document
+_ATTACHMENT_NAME = "data"
+# size of the attachment chunks read from the database in bytes
+_ATTACHMENT_CHUNK_SIZE = 64 * 1024
+
+# CouchDB update handler applies the changed document keys
+# to the latest document revision on the database side
+# and returns the revision the changes were applied to.
+_PATCH_DESIGN_DOC = "hardpy"
+_PATCH_HANDLER = "patch"
+_PATCH_FUNCTION = """function (doc, req) {
+  if (!doc) {
+    return [null, {code: 404, json: {error: "not_found", reason: "missing"}}];
+  }
+  var changes = JSON.parse(req.body);
+  for (var key in changes) {
+    var path = key.split(".");
+    var node = doc;
+    for (var i = 0; i < path.length - 1; i++) {
+      if (typeof node[path[i]] !== "object" || node[path[i]] === null) {
+        node[path[i]] = {};
+      }
+      node = node[path[i]];
+    }
+    node[path[path.length - 1]] = changes[key];
+  }
+  return [doc, {json: {ok: true, rev: doc._rev}}];
+}"""
+
+
+class CouchdbBackend(IStoreBackend):
+    """CouchDB storage backend.
+
+    Args:
+        url (str): CouchDB server url
+        db_name (str): database name
+        is_partial_update (bool): install the update handler for partial updates
+    """
+
+    def __init__(self, url: str, db_name: str, is_partial_update: bool) -> None:
+        self._log = getLogger(__name__)
+        self._db_srv = CouchdbConnectionManager().get_server(url)
+        self._db_name = db_name
+        self._db = self._init_db()
+        if is_partial_update:
+            self._init_patch_handler()
+
+    def get(self, doc_id: str) -> dict:
+        """Get document.
+
+        Args:
+            doc_id (str): document id
+
+        Returns:
+            dict: document
+        """
+        return self._db.get(doc_id)
+
+    def get_if_modified(self, doc_id: str, rev: str) -> dict | None:
+        """Get document if its revision differs from the given one.
+
+        The request contains the revision in the `If-None-Match` header,
+        so the unchanged document is not transferred again.
+
+        Args:
+            doc_id (str): document id
+            rev (str): known document revision
+
+        Returns:
+            dict | None: document, or None if the document is not modified
+        """
+        resource = self._db.resource(doc_id)
+        response = resource.session.get(
+            resource.base_url,
+            headers={"Accept": "application/json", "If-None-Match": f'"{rev}"'},
+            timeout=resource.timeout,
+        )
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return None
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            raise NotFound(response.json())
+        if response.status_code != HTTPStatus.OK:
+            raise GenericError(response.text)
+        return response.json()
+
+    def save(self, doc: dict) -> dict:
+        """Save document.
+
+        Args:
+            doc (dict): document with the `_id` and the current `_rev` fields
+
+        Returns:
+            dict: saved document with the new revision
+        """
+        return self._db.save(doc)
+
+    def patch(self, doc_id: str, changes: dict) -> tuple[str, str]:
+        """Apply changes to the latest document revision by the update handler.
+
+        Args:
+            doc_id (str): document id
+            changes (dict): new values by document keys with dots
+
+        Returns:
+            tuple[str, str]: revision before the changes and the new revision
+        """
+        response, result = self._db.resource(
+            "_design",
+            _PATCH_DESIGN_DOC,
+            "_update",
+            _PATCH_HANDLER,
+            doc_id,
+        ).put(data=json.dumps(changes).encode("utf-8"))
+        return result.get("rev"), response.headers["X-Couch-Update-NewRev"]
+
+    def delete(self, doc_id: str) -> None:
+        """Delete document.
+
+        Args:
+            doc_id (str): document id
+        """
+        self._db.delete(doc_id)
+
+    def compact(self) -> None:
+        """Compact database."""
+        self._db.compact()
+
+    def get_update_seq(self) -> str:
+        """Get the current update sequence of the database.
+
+        Returns:
+            str: database update sequence
+        """
+        return self._db.config()["update_seq"]
+
+    def wait_doc_change(self, doc_id: str, since: str, timeout: float) -> str:
+        """Wait for the document change after the update sequence.
+
+        The CouchDB changes feed in the longpoll mode returns
+        as soon as the document is changed after the `since` sequence
+        or when the timeout expires.
+
+        Args:
+            doc_id (str): document id
+            since (str): database update sequence
+            timeout (float): maximum waiting time in seconds
+
+        Returns:
+            str: last database update sequence
+        """
+        last_seq, _ = self._db.changes_list(
+            feed="longpoll",
+            filter="_doc_ids",
+            doc_ids=json.dumps([doc_id]),
+            since=since,
+            timeout=max(1, int(timeout * 1000)),
+        )
+        return last_seq
+
+    def put_attachment(
+        self,
+        attachment_id: str,
+        data: bytes,
+        content_type: str,
+    ) -> bool:
+        """Store attachment if the attachment id is not stored yet.
+
+        The attachment is stored as the CouchDB attachment
+        of the document with the attachment id.
+
+        Args:
+            attachment_id (str): attachment id
+            data (bytes): attachment data
+            content_type (str): attachment MIME type
+
+        Returns:
+            bool: True if the attachment is stored, False if it already exists
+        """
+        resource = self._db.resource(attachment_id)
+        response = resource.session.head(resource.base_url, timeout=resource.timeout)
+        if response.status_code == HTTPStatus.OK:
+            return False
+        resource = self._db.resource(attachment_id, _ATTACHMENT_NAME)
+        response = resource.session.put(
+            resource.base_url,
+            data=data,
+            headers={"Content-Type": content_type},
+            timeout=resource.timeout,
+        )
+        if response.status_code == HTTPStatus.CONFLICT:
+            # attachment is stored by another HardPy process
+            return False
+        if response.status_code not in {HTTPStatus.CREATED, HTTPStatus.ACCEPTED}:
+            raise GenericError(response.text)
+        return True
+
+    def get_attachment(self, attachment_id: str) -> tuple[Iterator[bytes], str]:
+        """Get attachment.
+
+        The attachment data is streamed from the database by chunks.
+
+        Args:
+            attachment_id (str): attachment id
+
+        Returns:
+            tuple[Iterator[bytes], str]: attachment data chunks and MIME type
+        """
+        resource = self._db.resource(attachment_id, _ATTACHMENT_NAME)
+        response = resource.session.get(
+            resource.base_url,
+            stream=True,
+            timeout=resource.timeout,
+        )
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            response.close()
+            msg = f"Attachment {attachment_id} not found"
+            raise NotFound(msg)
+        if response.status_code != HTTPStatus.OK:
+            response.close()
+            raise GenericError(response.text)
+        content_type = response.headers.get("Content-Type", "application/octet-stream")
+        return response.iter_content(_ATTACHMENT_CHUNK_SIZE), content_type
+
+    def _init_db(self) -> Database:
+        try:
+            return self._db_srv.create(self._db_name)  # type: ignore
+        except Conflict:
+            # database is already created
+            return self._db_srv.database(self._db_name)
+        except GenericError as exc:
+            msg = f"Error initializing database {exc}"
+            raise RuntimeError(msg) from exc
+        except ConnectionError as exc:
+            msg = f"Error initializing database: {exc}"
+            raise RuntimeError(msg) from exc
+
+    def _init_patch_handler(self) -> None:
+        design_doc_id = f"_design/{_PATCH_DESIGN_DOC}"
+        try:
+            design_doc = self._db.get(design_doc_id)
+        except NotFound:
+            design_doc = {"_id": design_doc_id}
+        if design_doc.get("updates", {}).get(_PATCH_HANDLER) == _PATCH_FUNCTION:
+            return
+        design_doc["updates"] = {_PATCH_HANDLER: _PATCH_FUNCTION}
+        try:
+            self._db.save(design_doc)
+        except Conflict:
+            # handler is installed by another HardPy process
+            self._log.debug("Database update handler is already installed")
@@ -0,0 +1,111 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from pycouchdb import Server as DbServer
+from requests.adapters import HTTPAdapter
+
+from hardpy.common.singleton import SingletonMeta
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# default number of the kept-alive connections to one CouchDB server
+DEFAULT_POOL_SIZE = 10
+
+
+class CouchdbConnectionManager(metaclass=SingletonMeta):
+    """Shared CouchDB connections of the process.
+
+    CouchDB clients with the same connection url use one `pycouchdb.Server`,
+    its `requests` session keeps up to `pool_size` connections alive,
+    so the stores, loaders and readers do not open a new connection
+    for every request. The protocol of the CouchDB server is detected
+    once for each host and port.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._pool_size = DEFAULT_POOL_SIZE
+        self._servers: dict[str, DbServer] = {}
+        self._protocols: dict[tuple[str, int], str] = {}
+
+    @property
+    def pool_size(self) -> int:
+        """Get number of the kept-alive connections to one CouchDB server.
+
+        Returns:
+            int: connection pool size
+        """
+        return self._pool_size
+
+    def set_pool_size(self, pool_size: int) -> None:
+        """Set number of the kept-alive connections to one CouchDB server.
+
+        Args:
+            pool_size (int): connection pool size
+        """
+        with self._lock:
+            if pool_size == self._pool_size:
+                return
+            self._pool_size = pool_size
+            for server in self._servers.values():
+                self._mount_adapter(server)
+
+    def get_server(self, url: str) -> DbServer:
+        """Get CouchDB server with the pooled session.
+
+        Args:
+            url (str): CouchDB server url with the credentials
+
+        Returns:
+            DbServer: CouchDB server
+        """
+        with self._lock:
+            server = self._servers.get(url)
+            if server is None:
+                server = DbServer(url)
+                self._mount_adapter(server)
+                self._servers[url] = server
+            return server
+
+    def get_protocol(self, host: str, port: int, detect: Callable[[], str]) -> str:
+        """Get protocol of the CouchDB server.
+
+        Args:
+            host (str): CouchDB host
+            port (int): CouchDB port
+            detect (Callable[[], str]): protocol detection function,
+                called if the protocol of the host is unknown
+
+        Returns:
+            str: `http` or `https`
+        """
+        key = (host, port)
+        with self._lock:
+            protocol = self._protocols.get(key)
+        if protocol is None:
+            protocol = detect()
+            with self._lock:
+                self._protocols[key] = protocol
+        return protocol
+
+    def close(self) -> None:
+        """Close the pooled connections and forget the detected protocols."""
+        with self._lock:
+            for server in self._servers.values():
+                server.resource.session.close()
+            self._servers.clear()
+            self._protocols.clear()
+
+    def _mount_adapter(self, server: DbServer) -> None:
+        session = server.resource.session
+        for prefix in ("http://", "https://"):
+            adapter = HTTPAdapter(
+                pool_connections=self._pool_size,
+                pool_maxsize=self._pool_size,
+            )
+            session.mount(prefix, adapter)
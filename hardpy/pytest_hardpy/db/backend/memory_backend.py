@@ -0,0 +1,220 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import json
+from threading import Condition, Lock
+from time import monotonic
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from glom import assign
+from pycouchdb.exceptions import Conflict, NotFound
+
+from hardpy.pytest_hardpy.db.backend.base_backend import IStoreBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class _MemoryDatabase:
+    """Documents of one in-memory database.
+
+    Documents are stored serialized to JSON like in a database,
+    so the stored documents are not changed through the returned ones.
+    """
+
+    def __init__(self) -> None:
+        self.docs: dict[str, str] = {}
+        self.revs: dict[str, str] = {}
+        self.doc_seqs: dict[str, int] = {}
+        self.attachments: dict[str, tuple[bytes, str]] = {}
+        self.update_seq = 0
+        self.changed = Condition()
+
+
+# databases are shared by all stores of the process
+_databases: dict[str, _MemoryDatabase] = {}
+_databases_lock = Lock()
+
+
+class MemoryBackend(IStoreBackend):
+    """In-memory storage backend.
+
+    Documents are stored in the memory of the test process and are not
+    available to the operator panel. The backend is intended for runs
+    without the operator panel, such as CI or batch runs.
+
+    Args:
+        db_name (str): database name
+    """
+
+    def __init__(self, db_name: str) -> None:
+        with _databases_lock:
+            self._db = _databases.setdefault(db_name, _MemoryDatabase())
+
+    def get(self, doc_id: str) -> dict:
+        """Get document.
+
+        Args:
+            doc_id (str): document id
+
+        Returns:
+            dict: document
+        """
+        with self._db.changed:
+            return json.loads(self._get_doc(doc_id))
+
+    def get_if_modified(self, doc_id: str, rev: str) -> dict | None:
+        """Get document if its revision differs from the given one.
+
+        Args:
+            doc_id (str): document id
+            rev (str): known document revision
+
+        Returns:
+            dict | None: document, or None if the document is not modified
+        """
+        with self._db.changed:
+            doc = self._get_doc(doc_id)
+            return None if self._db.revs[doc_id] == rev else json.loads(doc)
+
+    def save(self, doc: dict) -> dict:
+        """Save document.
+
+        Args:
+            doc (dict): document with the `_id` and the current `_rev` fields
+
+        Returns:
+            dict: saved document with the new revision
+        """
+        with self._db.changed:
+            if doc.get("_rev") != self._db.revs.get(doc["_id"]):
+                msg = "Document update conflict."
+                raise Conflict(msg)
+            doc = {**doc}
+            self._store(doc)
+            return doc
+
+    def patch(self, doc_id: str, changes: dict) -> tuple[str, str]:
+        """Apply changes to the latest document revision.
+
+        Args:
+            doc_id (str): document id
+            changes (dict): new values by document keys with dots
+
+        Returns:
+            tuple[str, str]: revision before the changes and the new revision
+        """
+        with self._db.changed:
+            doc = json.loads(self._get_doc(doc_id))
+            base_rev = doc["_rev"]
+            for key, value in changes.items():
+                assign(doc, key, value, missing=dict)
+            self._store(doc)
+            return base_rev, doc["_rev"]
+
+    def delete(self, doc_id: str) -> None:
+        """Delete document.
+
+        Args:
+            doc_id (str): document id
+        """
+        with self._db.changed:
+            self._get_doc(doc_id)
+            del self._db.docs[doc_id]
+            del self._db.revs[doc_id]
+            self._notify(doc_id)
+
+    def compact(self) -> None:
+        """Compact database.
+
+        The in-memory database has no old revisions to compact.
+        """
+
+    def get_update_seq(self) -> str:
+        """Get the current update sequence of the database.
+
+        Returns:
+            str: database update sequence
+        """
+        with self._db.changed:
+            return str(self._db.update_seq)
+
+    def wait_doc_change(self, doc_id: str, since: str, timeout: float) -> str:
+        """Wait for the document change after the update sequence.
+
+        Args:
+            doc_id (str): document id
+            since (str): database update sequence
+            timeout (float): maximum waiting time in seconds
+
+        Returns:
+            str: last database update sequence
+        """
+        deadline = monotonic() + timeout
+        with self._db.changed:
+            while self._db.doc_seqs.get(doc_id, 0) <= int(since):
+                wait_time = deadline - monotonic()
+                if wait_time <= 0:
+                    break
+                self._db.changed.wait(wait_time)
+            return str(self._db.update_seq)
+
+    def put_attachment(
+        self,
+        attachment_id: str,
+        data: bytes,
+        content_type: str,
+    ) -> bool:
+        """Store attachment if the attachment id is not stored yet.
+
+        Args:
+            attachment_id (str): attachment id
+            data (bytes): attachment data
+            content_type (str): attachment MIME type
+
+        Returns:
+            bool: True if the attachment is stored, False if it already exists
+        """
+        with self._db.changed:
+            if attachment_id in self._db.attachments:
+                return False
+            self._db.attachments[attachment_id] = (bytes(data), content_type)
+            return True
+
+    def get_attachment(self, attachment_id: str) -> tuple[Iterator[bytes], str]:
+        """Get attachment.
+
+        Args:
+            attachment_id (str): attachment id
+
+        Returns:
+            tuple[Iterator[bytes], str]: attachment data chunks and MIME type
+        """
+        with self._db.changed:
+            try:
+                data, content_type = self._db.attachments[attachment_id]
+            except KeyError as exc:
+                msg = f"Attachment {attachment_id} not found"
+                raise NotFound(msg) from exc
+        return iter([data]), content_type
+
+    def _get_doc(self, doc_id: str) -> str:
+        try:
+            return self._db.docs[doc_id]
+        except KeyError as exc:
+            msg = f"Document {doc_id} not found"
+            raise NotFound(msg) from exc
+
+    def _store(self, doc: dict) -> None:
+        rev_number = int(doc["_rev"].split("-")[0]) if "_rev" in doc else 0
+        doc["_rev"] = f"{rev_number + 1}-{uuid4().hex}"
+        self._db.docs[doc["_id"]] = json.dumps(doc)
+        self._db.revs[doc["_id"]] = doc["_rev"]
+        self._notify(doc["_id"])
+
+    def _notify(self, doc_id: str) -> None:
+        self._db.update_seq += 1
+        self._db.doc_seqs[doc_id] = self._db.update_seq
+        self._db.changed.notify_all()
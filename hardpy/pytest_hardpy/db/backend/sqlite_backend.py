@@ -0,0 +1,345 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import json
+import sqlite3
+from threading import Lock
+from time import monotonic, sleep
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from glom import assign
+from pycouchdb.exceptions import Conflict, NotFound
+
+from hardpy.pytest_hardpy.db.backend.base_backend import IStoreBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+# interval of the database checks while waiting for document changes
+_POLL_INTERVAL = 0.05
+
+# The documents table contains the latest document revisions.
+# The revisions table is an append-only log of the document revisions,
+# its sequence numbers are the database update sequence
+# like in the CouchDB changes feed.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    db_name TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    rev TEXT NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (db_name, doc_id)
+);
+CREATE TABLE IF NOT EXISTS revisions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    db_name TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    rev TEXT NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS revisions_doc ON revisions (db_name, doc_id, seq);
+CREATE TABLE IF NOT EXISTS attachments (
+    db_name TEXT NOT NULL,
+    attachment_id TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (db_name, attachment_id)
+);
+"""
+# size of the attachment chunks read from the database in bytes
+_ATTACHMENT_CHUNK_SIZE = 64 * 1024
+
+
+class SqliteBackend(IStoreBackend):
+    """SQLite storage backend.
+
+    The database file is opened in the WAL mode, so the test process
+    writes documents while the operator panel process reads them.
+
+    Args:
+        path (Path): database file path
+        db_name (str): database name
+    """
+
+    def __init__(self, path: Path, db_name: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db_name = db_name
+        self._lock = Lock()
+        self._conn = sqlite3.connect(
+            path,
+            timeout=10,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+
+    def get(self, doc_id: str) -> dict:
+        """Get document.
+
+        Args:
+            doc_id (str): document id
+
+        Returns:
+            dict: document
+        """
+        row = self._fetch_one(
+            "SELECT body FROM documents WHERE db_name = ? AND doc_id = ?",
+            (self._db_name, doc_id),
+        )
+        if row is None:
+            msg = f"Document {doc_id} not found"
+            raise NotFound(msg)
+        return json.loads(row[0])
+
+    def get_if_modified(self, doc_id: str, rev: str) -> dict | None:
+        """Get document if its revision differs from the given one.
+
+        Args:
+            doc_id (str): document id
+            rev (str): known document revision
+
+        Returns:
+            dict | None: document, or None if the document is not modified
+        """
+        row = self._fetch_one(
+            "SELECT rev, CASE WHEN rev = ? THEN NULL ELSE body END "
+            "FROM documents WHERE db_name = ? AND doc_id = ?",
+            (rev, self._db_name, doc_id),
+        )
+        if row is None:
+            msg = f"Document {doc_id} not found"
+            raise NotFound(msg)
+        return None if row[1] is None else json.loads(row[1])
+
+    def save(self, doc: dict) -> dict:
+        """Save document.
+
+        Args:
+            doc (dict): document with the `_id` and the current `_rev` fields
+
+        Returns:
+            dict: saved document with the new revision
+        """
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            stored_rev = self._get_rev(doc["_id"])
+            if doc.get("_rev") != stored_rev:
+                msg = "Document update conflict."
+                raise Conflict(msg)
+            doc = {**doc, "_rev": self._next_rev(stored_rev)}
+            self._store(doc)
+        return doc
+
+    def patch(self, doc_id: str, changes: dict) -> tuple[str, str]:
+        """Apply changes to the latest document revision.
+
+        Args:
+            doc_id (str): document id
+            changes (dict): new values by document keys with dots
+
+        Returns:
+            tuple[str, str]: revision before the changes and the new revision
+        """
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            row = self._conn.execute(
+                "SELECT body FROM documents WHERE db_name = ? AND doc_id = ?",
+                (self._db_name, doc_id),
+            ).fetchone()
+            if row is None:
+                msg = f"Document {doc_id} not found"
+                raise NotFound(msg)
+            doc = json.loads(row[0])
+            base_rev = doc["_rev"]
+            for key, value in changes.items():
+                assign(doc, key, value, missing=dict)
+            doc["_rev"] = self._next_rev(base_rev)
+            self._store(doc)
+        return base_rev, doc["_rev"]
+
+    def delete(self, doc_id: str) -> None:
+        """Delete document.
+
+        Args:
+            doc_id (str): document id
+        """
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            rev = self._get_rev(doc_id)
+            if rev is None:
+                msg = f"Document {doc_id} not found"
+                raise NotFound(msg)
+            self._conn.execute(
+                "DELETE FROM documents WHERE db_name = ? AND doc_id = ?",
+                (self._db_name, doc_id),
+            )
+            self._conn.execute(
+                "INSERT INTO revisions (db_name, doc_id, rev, deleted) "
+                "VALUES (?, ?, ?, 1)",
+                (self._db_name, doc_id, self._next_rev(rev)),
+            )
+
+    def compact(self) -> None:
+        """Compact database.
+
+        Remove the old revisions from the revision log
+        and keep the latest revision of each document.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM revisions WHERE db_name = ? AND seq NOT IN "
+                "(SELECT MAX(seq) FROM revisions WHERE db_name = ? GROUP BY doc_id)",
+                (self._db_name, self._db_name),
+            )
+
+    def get_update_seq(self) -> str:
+        """Get the current update sequence of the database.
+
+        Returns:
+            str: database update sequence
+        """
+        row = self._fetch_one(
+            "SELECT COALESCE(MAX(seq), 0) FROM revisions WHERE db_name = ?",
+            (self._db_name,),
+        )
+        return str(row[0])  # type: ignore
+
+    def wait_doc_change(self, doc_id: str, since: str, timeout: float) -> str:
+        """Wait for the document change after the update sequence.
+
+        Args:
+            doc_id (str): document id
+            since (str): database update sequence
+            timeout (float): maximum waiting time in seconds
+
+        Returns:
+            str: last database update sequence
+        """
+        deadline = monotonic() + timeout
+        while monotonic() < deadline:
+            if self.get_changes(since, [doc_id]):
+                break
+            sleep(_POLL_INTERVAL)
+        return self.get_update_seq()
+
+    def put_attachment(
+        self,
+        attachment_id: str,
+        data: bytes,
+        content_type: str,
+    ) -> bool:
+        """Store attachment if the attachment id is not stored yet.
+
+        Args:
+            attachment_id (str): attachment id
+            data (bytes): attachment data
+            content_type (str): attachment MIME type
+
+        Returns:
+            bool: True if the attachment is stored, False if it already exists
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO attachments "
+                "(db_name, attachment_id, content_type, data) VALUES (?, ?, ?, ?)",
+                (self._db_name, attachment_id, content_type, data),
+            )
+        return cursor.rowcount == 1
+
+    def get_attachment(self, attachment_id: str) -> tuple[Iterator[bytes], str]:
+        """Get attachment.
+
+        Args:
+            attachment_id (str): attachment id
+
+        Returns:
+            tuple[Iterator[bytes], str]: attachment data chunks and MIME type
+        """
+        row = self._fetch_one(
+            "SELECT data, content_type FROM attachments "
+            "WHERE db_name = ? AND attachment_id = ?",
+            (self._db_name, attachment_id),
+        )
+        if row is None:
+            msg = f"Attachment {attachment_id} not found"
+            raise NotFound(msg)
+        data = bytes(row[0])
+        chunks = (
+            data[i : i + _ATTACHMENT_CHUNK_SIZE]
+            for i in range(0, len(data), _ATTACHMENT_CHUNK_SIZE)
+        )
+        return chunks, row[1]
+
+    def get_all_docs(self) -> list[dict]:
+        """Get all documents of the database.
+
+        Returns:
+            list[dict]: documents sorted by id
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT body FROM documents WHERE db_name = ? ORDER BY doc_id",
+                (self._db_name,),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_changes(self, since: str, doc_ids: list[str] | None = None) -> list[dict]:
+        """Get the latest revisions of the documents changed after the sequence.
+
+        Args:
+            since (str): database update sequence
+            doc_ids (list[str] | None): document ids, all documents if None
+
+        Returns:
+            list[dict]: changes in the CouchDB changes feed format
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT doc_id, rev, seq, deleted FROM revisions AS r "
+                "WHERE db_name = ? AND seq > ? AND seq = (SELECT MAX(seq) "
+                "FROM revisions WHERE db_name = r.db_name AND doc_id = r.doc_id) "
+                "ORDER BY seq",
+                (self._db_name, int(since)),
+            ).fetchall()
+        changes = []
+        for doc_id, rev, seq, deleted in rows:
+            if doc_ids is not None and doc_id not in doc_ids:
+                continue
+            change = {"id": doc_id, "seq": str(seq), "changes": [{"rev": rev}]}
+            if deleted:
+                change["deleted"] = True
+            changes.append(change)
+        return changes
+
+    def _fetch_one(self, query: str, params: tuple) -> tuple | None:
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()
+
+    def _get_rev(self, doc_id: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT rev FROM documents WHERE db_name = ? AND doc_id = ?",
+            (self._db_name, doc_id),
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _next_rev(self, rev: str | None) -> str:
+        rev_number = int(rev.split("-")[0]) if rev else 0
+        return f"{rev_number + 1}-{uuid4().hex}"
+
+    def _store(self, doc: dict) -> None:
+        body = json.dumps(doc)
+        self._conn.execute(
+            "INSERT INTO revisions (db_name, doc_id, rev) VALUES (?, ?, ?)",
+            (self._db_name, doc["_id"], doc["_rev"]),
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO documents (db_name, doc_id, rev, body) "
+            "VALUES (?, ?, ?, ?)",
+            (self._db_name, doc["_id"], doc["_rev"], body),
+        )
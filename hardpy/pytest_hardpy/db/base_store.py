@@ -2,33 +2,108 @@
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 
 from logging import getLogger
+from threading import RLock, Timer
 from typing import Any
 
 from glom import assign, glom
-from pycouchdb import Server as DbServer
-from pycouchdb.client import Database
-from pycouchdb.exceptions import Conflict, GenericError, NotFound
+from pycouchdb.exceptions import Conflict, NotFound
 from pydantic._internal._model_construction import ModelMetaclass
-from requests.exceptions import ConnectionError  # noqa: A004
 
 from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy.db.backend import (
+    CouchdbBackend,
+    CouchdbConnectionManager,
+    IStoreBackend,
+    MemoryBackend,
+    SqliteBackend,
+)
 from hardpy.pytest_hardpy.db.const import DatabaseField as DF  # noqa: N817
 
+# maximum number of document writes after a revision conflict
+_CONFLICT_RETRIES = 5
+
+
+def create_backend(db_name: str, is_partial_update: bool = False) -> IStoreBackend:
+    """Create the storage backend selected in the HardPy config.
+
+    Args:
+        db_name (str): database name
+        is_partial_update (bool): send only the changed document keys
+
+    Returns:
+        IStoreBackend: storage backend
+
+    Raises:
+        RuntimeError: if the database backend is unknown
+    """
+    config_manager = ConfigManager()
+    config = config_manager.config
+    backend = config.database.backend
+    if backend == "couchdb":
+        CouchdbConnectionManager().set_pool_size(config.database.pool_size)
+        return CouchdbBackend(config.database.url, db_name, is_partial_update)
+    if backend == "memory":
+        return MemoryBackend(db_name)
+    if backend == "sqlite":
+        sqlite_path = config_manager.tests_path / config.database.sqlite_path
+        return SqliteBackend(sqlite_path, db_name)
+    msg = f"Unknown database backend: {backend}"
+    raise RuntimeError(msg)
+
 
 class BaseStore:
-    """HardPy base storage interface for CouchDB."""
+    """HardPy base storage interface.
+
+    Documents are stored by the storage backend selected
+    in the `database` section of the HardPy config: CouchDB, SQLite or memory.
 
-    def __init__(self, db_name: str) -> None:
+    Database writes are coalesced: `update_db` only marks the document
+    as dirty, and the document is written once per flush interval
+    by a background timer. Use `flush` to write the document immediately.
+
+    In the partial update mode only the changed document keys are sent
+    to the database.
+
+    On a revision conflict the changed document keys are applied
+    to the latest document revision and the write is repeated.
+
+    Args:
+        db_name (str): database name
+        doc_id (str | None): document id, the HardPy config document id if None
+    """
+
+    def __init__(self, db_name: str, doc_id: str | None = None) -> None:
         config_manager = ConfigManager()
         config = config_manager.config
-        self._db_srv = DbServer(config.database.url)
-        self._db_name = db_name
-        self._db = self._init_db()
-        self._doc_id = config.database.doc_id
         self._log = getLogger(__name__)
+        self._is_partial_update = config.database.partial_update
+        self._db_name = db_name
+        self._db = create_backend(db_name, self._is_partial_update)
+        self._doc_id = doc_id or config.database.doc_id
+        self._doc_lock = RLock()
+        self._flush_interval = config.database.flush_interval_ms / 1000
+        self._flush_timer: Timer | None = None
+        self._is_dirty = False
+        self._dirty_keys: set[str] = set()
+        # the local document matches the database document revision
+        self._is_doc_synced = False
+        self._stats = {"conflicts": 0, "retries": 0, "not_modified": 0}
         self._doc: dict = self._init_doc()
         self._schema: ModelMetaclass
 
+    @property
+    def stats(self) -> dict[str, int]:
+        """Database request counters for diagnostics.
+
+        - conflicts: number of document revision conflicts
+        - retries: number of document writes repeated after a conflict
+        - not_modified: number of document reads without changes
+
+        Returns:
+            dict[str, int]: counter names and values
+        """
+        return dict(self._stats)
+
     def compact(self) -> None:
         """Compact database."""
         self._db.compact()
@@ -42,7 +117,8 @@ class BaseStore:
         Returns:
             Any: field value
         """
-        return glom(self._doc, key)
+        with self._doc_lock:
+            return glom(self._doc, key)
 
     def update_doc_value(self, key: str, value: Any) -> None:  # noqa: ANN401
         """Update document value.
@@ -55,23 +131,76 @@ class BaseStore:
             key (str): document key
             value: document value
         """
-        if "." in key:
-            assign(self._doc, key, value)
-        else:
-            self._doc[key] = value
+        with self._doc_lock:
+            if "." in key:
+                assign(self._doc, key, value)
+            else:
+                self._doc[key] = value
+            self._dirty_keys.add(key)
+            self._is_dirty = True
 
     def update_db(self) -> None:
-        """Update database by current document."""
-        try:
-            self._doc = self._db.save(self._doc)
-        except Conflict:
-            self._doc["_rev"] = self._db.get(self._doc_id)["_rev"]
-            self._doc = self._db.save(self._doc)
+        """Update database by current document.
+
+        The document is marked as dirty and written to the database
+        at the end of the flush interval together with all other changes
+        made during this interval. A zero flush interval writes immediately.
+        """
+        with self._doc_lock:
+            self._is_dirty = True
+            if self._flush_interval <= 0:
+                self.flush()
+                return
+            if self._flush_timer is None:
+                self._flush_timer = Timer(self._flush_interval, self._flush_by_timer)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write the pending document changes to the database immediately."""
+        with self._doc_lock:
+            self._cancel_flush_timer()
+            if not self._is_dirty:
+                return
+            # a new document is always written completely
+            if self._is_partial_update and "_rev" in self._doc:
+                try:
+                    self._patch_db()
+                except (Conflict, NotFound):
+                    self._save_db()
+            else:
+                self._save_db()
+            self._dirty_keys.clear()
+            self._is_dirty = False
+
+    def get_update_seq(self) -> str:
+        """Get the current update sequence of the database.
+
+        Returns:
+            str: database update sequence
+        """
+        return self._db.get_update_seq()
+
+    def wait_doc_change(self, since: str, timeout: float) -> str:
+        """Wait for the document change in the database.
+
+        The function returns as soon as the document is changed
+        after the `since` sequence or when the timeout expires.
+
+        Args:
+            since (str): database update sequence
+            timeout (float): maximum waiting time in seconds
+
+        Returns:
+            str: last database update sequence
+        """
+        return self._db.wait_doc_change(self._doc_id, since, timeout)
 
     def update_doc(self) -> None:
         """Update current document by database."""
-        self._doc["_rev"] = self._db.get(self._doc_id)["_rev"]
-        self._doc = self._db.get(self._doc_id)
+        with self._doc_lock:
+            self.flush()
+            self._read_db()
 
     def get_document(self) -> ModelMetaclass:
         """Get document by schema.
@@ -79,30 +208,115 @@ class BaseStore:
         Returns:
             ModelMetaclass: document by schema
         """
-        self._doc = self._db.get(self._doc_id)
-        return self._schema(**self._doc)
+        with self._doc_lock:
+            self.flush()
+            self._read_db()
+            return self._schema(**self._doc)
+
+    def get_doc_fields(self) -> dict:
+        """Get document fields without the document id and revision.
+
+        Returns:
+            dict: document fields
+        """
+        with self._doc_lock:
+            return {
+                key: value
+                for key, value in self._doc.items()
+                if key not in {"_id", "_rev"}
+            }
 
     def clear(self) -> None:
         """Clear database."""
-        try:
-            # Clear statestore and runstore databases before each launch
-            self._db.delete(self._doc_id)
-        except (Conflict, NotFound):
-            self._log.debug("Database will be created for the first time")
-        self._doc: dict = self._init_doc()
+        with self._doc_lock:
+            self._cancel_flush_timer()
+            self._is_dirty = False
+            self._dirty_keys.clear()
+            self._is_doc_synced = False
+            try:
+                # Clear statestore and runstore databases before each launch
+                self._db.delete(self._doc_id)
+            except (Conflict, NotFound):
+                self._log.debug("Database will be created for the first time")
+            self._doc: dict = self._init_doc()
+
+    def _read_db(self) -> None:
+        """Read the document from the database.
+
+        The unchanged document is not transferred again.
+
+        Raises:
+            NotFound: if the document is not found
+        """
+        if not self._is_doc_synced or "_rev" not in self._doc:
+            self._doc = self._db.get(self._doc_id)
+            self._is_doc_synced = True
+            return
+        doc = self._db.get_if_modified(self._doc_id, self._doc["_rev"])
+        if doc is None:
+            self._stats["not_modified"] += 1
+            return
+        self._doc = doc
+
+    def _save_db(self) -> None:
+        for attempt in range(_CONFLICT_RETRIES + 1):
+            try:
+                self._doc = self._db.save(self._doc)
+            except Conflict:  # noqa: PERF203
+                self._stats["conflicts"] += 1
+                if attempt == _CONFLICT_RETRIES:
+                    self._is_doc_synced = False
+                    raise
+                self._stats["retries"] += 1
+                self._merge_db_doc()
+            else:
+                self._is_doc_synced = True
+                return
+
+    def _merge_db_doc(self) -> None:
+        """Apply the changed document keys to the latest database revision."""
+        db_doc = self._db.get(self._doc_id)
+        if "_rev" not in self._doc:
+            # the new document replaces the document created by another process
+            self._doc["_rev"] = db_doc["_rev"]
+            return
+        for key in self._get_changed_keys():
+            assign(db_doc, key, glom(self._doc, key), missing=dict)
+        self._doc = db_doc
 
-    def _init_db(self) -> Database:
+    def _patch_db(self) -> None:
+        changes = {key: glom(self._doc, key) for key in self._get_changed_keys()}
+        base_rev, new_rev = self._db.patch(self._doc_id, changes)
+        # the database document contains changes of another process
+        if base_rev != self._doc["_rev"]:
+            self._is_doc_synced = False
+        self._doc["_rev"] = new_rev
+
+    def _get_changed_keys(self) -> list[str]:
+        """Get changed document keys without keys nested in other changed keys.
+
+        Returns:
+            list[str]: document keys
+        """
+        changed_keys = []
+        for key in sorted(self._dirty_keys):
+            path = key.split(".")
+            parents = {".".join(path[:i]) for i in range(1, len(path))}
+            if parents.isdisjoint(self._dirty_keys):
+                changed_keys.append(key)
+        return changed_keys
+
+    def _flush_by_timer(self) -> None:
         try:
-            return self._db_srv.create(self._db_name)  # type: ignore
-        except Conflict:
-            # database is already created
-            return self._db_srv.database(self._db_name)
-        except GenericError as exc:
-            msg = f"Error initializing database {exc}"
-            raise RuntimeError(msg) from exc
-        except ConnectionError as exc:
-            msg = f"Error initializing database: {exc}"
-            raise RuntimeError(msg) from exc
+            self.flush()
+        except Exception as exc:  # noqa: BLE001
+            # the document stays dirty and will be written by the next flush
+            self._log.error(f"Error writing document {self._doc_id}: {exc}")
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
 
     def _init_doc(self) -> dict:
         try:
@@ -141,6 +355,7 @@ class BaseStore:
         # init document
         if DF.MODULES not in doc:
             doc[DF.MODULES] = {}
+            self._dirty_keys.add(DF.MODULES)
 
         doc[DF.DUT] = {
             DF.TYPE: None,
@@ -169,5 +384,6 @@ class BaseStore:
             DF.NUMBER: None,
             DF.INFO: {},
         }
+        self._dirty_keys.update((DF.DUT, DF.TEST_STAND, DF.PROCESS))
 
         return doc
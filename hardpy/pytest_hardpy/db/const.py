@@ -32,6 +32,8 @@ class DatabaseField(str, Enum):
     DRIVERS = "drivers"
     TYPE = "type"
     CHART = "chart"
+    X_DATA = "x_data"
+    Y_DATA = "y_data"
 
     # table name
     DUT = "dut"
@@ -57,6 +59,14 @@ class DatabaseField(str, Enum):
     IMAGE = "image"
     HTML = "html"
     ID = "id"
+    ADDRESS = "address"
+    BASE64 = "base64"
+    ATTACHMENT_ID = "attachment_id"
 
     # runstore
     ARTIFACT = "artifact"
+    CONTENT_TYPE = "content_type"
+    SIZE = "size"
+    SUMMARY = "summary"
+    FIRST_FAILED_CASE_ID = "first_failed_case_id"
+    FIRST_FAILED_CASE_NAME = "first_failed_case_name"
@@ -1,7 +1,8 @@
 # Copyright (c) 2024 Everypin
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 
-from hardpy.pytest_hardpy.db.schema.v1 import ResultRunStore, ResultStateStore
+from hardpy.pytest_hardpy.db.schema.v1 import ResultStateStore
+from hardpy.pytest_hardpy.db.schema.v2 import ResultRunStore
 
 __all__ = [
     "ResultRunStore",
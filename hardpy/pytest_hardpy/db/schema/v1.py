@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from abc import ABC
 from collections.abc import Mapping  # noqa: TC003
-from typing import ClassVar
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from hardpy.pytest_hardpy.utils.const import (
     ChartType,
@@ -15,6 +15,17 @@ from hardpy.pytest_hardpy.utils.const import (
     MeasurementType,
     TestStatus as Status,
 )
+from hardpy.pytest_hardpy.utils.measurement_column import (
+    decode_column,
+    expand_measurements,
+)
+
+
+def _expand_case_measurements(data: Any) -> Any:  # noqa: ANN401
+    # the measurement series are stored as single entries with packed values
+    if isinstance(data, dict) and data.get("measurements"):
+        data = {**data, "measurements": expand_measurements(data["measurements"])}
+    return data
 
 
 class IBaseResult(BaseModel):
@@ -39,6 +50,11 @@ class CaseStateStore(IBaseResult):
     group: Group
     dialog_box: dict = {}
 
+    @model_validator(mode="before")
+    @classmethod
+    def _expand_measurements(cls, data: Any) -> Any:  # noqa: ANN401
+        return _expand_case_measurements(data)
+
 
 class CaseRunStore(IBaseResult):
     """Test case description with artifact."""
@@ -51,6 +67,11 @@ class CaseRunStore(IBaseResult):
     group: Group
     artifact: dict = {}
 
+    @model_validator(mode="before")
+    @classmethod
+    def _expand_measurements(cls, data: Any) -> Any:  # noqa: ANN401
+        return _expand_case_measurements(data)
+
 
 class ModuleStateStore(IBaseResult):
     """Test module description."""
@@ -185,6 +206,22 @@ class Chart(BaseModel):
     x_data: list[list[int | float]] = Field(default_factory=lambda: [])  # noqa: PIE807
     y_data: list[list[int | float]] = Field(default_factory=lambda: [])  # noqa: PIE807
 
+    @model_validator(mode="before")
+    @classmethod
+    def _decode_data(cls, data: Any) -> Any:  # noqa: ANN401
+        # the runstore data series are stored as the packed columns
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
+        for key in ("x_data", "y_data"):
+            series = data.get(key)
+            if series:
+                data[key] = [
+                    decode_column(values) if isinstance(values, dict) else values
+                    for values in series
+                ]
+        return data
+
 
 class OperatorData(BaseModel):
     """Operator data from operator panel."""
@@ -0,0 +1,89 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from collections.abc import Mapping  # noqa: TC003
+from typing import ClassVar
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from hardpy.pytest_hardpy.db.schema.v1 import (
+    ModuleRunStore,
+    ResultRunStore as ResultRunStoreV1,
+)
+from hardpy.pytest_hardpy.utils.const import TestStatus as Status
+
+
+class ReportSummary(BaseModel):
+    """Test run summary.
+
+    The summary is calculated from the test modules of the report,
+    so the report readers do not traverse the test modules.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    first_failed_module_id: str | None = None
+    first_failed_case_id: str | None = None
+    first_failed_case_name: str | None = None
+    case_count: dict[str, int] = {}
+    duration: int | None = None
+    measurement_count: int = 0
+    failed_measurement_count: int = 0
+
+    @classmethod
+    def from_modules(
+        cls,
+        modules: Mapping[str, ModuleRunStore],
+        start_time: int | None,
+        stop_time: int | None,
+    ) -> ReportSummary:
+        """Calculate summary of the test run.
+
+        Args:
+            modules (Mapping[str, ModuleRunStore]): test modules in the run order
+            start_time (int | None): test run start time
+            stop_time (int | None): test run stop time
+
+        Returns:
+            ReportSummary: test run summary
+        """
+        summary = cls()
+        if start_time is not None and stop_time is not None:
+            summary.duration = stop_time - start_time
+        for module_id, module in modules.items():
+            for case_id, case in module.cases.items():
+                status = case.status.value
+                summary.case_count[status] = summary.case_count.get(status, 0) + 1
+                is_first_failed = summary.first_failed_case_id is None
+                if case.status == Status.FAILED and is_first_failed:
+                    summary.first_failed_module_id = module_id
+                    summary.first_failed_case_id = case_id
+                    summary.first_failed_case_name = case.name
+                summary.measurement_count += len(case.measurements)
+                summary.failed_measurement_count += sum(
+                    1
+                    for measurement in case.measurements
+                    if measurement.result is False
+                )
+        return summary
+
+
+class ResultRunStore(ResultRunStoreV1):
+    """Test run description with the test run summary."""
+
+    # Create the new schema class with version update
+    # when you change this class or fields in this class.
+    __version__: ClassVar[int] = 2
+
+    summary: ReportSummary | None = None
+
+    @model_validator(mode="after")
+    def _fill_summary(self) -> ResultRunStore:
+        if self.summary is None:
+            self.summary = ReportSummary.from_modules(
+                self.modules,
+                self.start_time,
+                self.stop_time,
+            )
+        return self
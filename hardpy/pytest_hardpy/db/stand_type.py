@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from pydantic import model_validator
 
 from hardpy.pytest_hardpy.db.schema.v1 import (
@@ -12,7 +14,27 @@ from hardpy.pytest_hardpy.db.schema.v1 import (
     StringMeasurement as StringMeasurementModel,
     SubUnit as SubUnitModel,
 )
-from hardpy.pytest_hardpy.utils.const import ComparisonOperation as CompOp
+from hardpy.pytest_hardpy.utils.chart_decimation import to_series
+from hardpy.pytest_hardpy.utils.const import (
+    ComparisonOperation as CompOp,
+    MeasurementType,
+)
+from hardpy.pytest_hardpy.utils.measurement_column import (
+    RESULTS_KEY,
+    VALUES_KEY,
+    all_results,
+    check_condition,
+    check_conditions,
+    check_operation_requirements,
+    encode_column,
+    encode_results,
+    join_values,
+    to_list,
+    to_values,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
 
 
 class Instrument(InstrumentModel):
@@ -39,65 +61,194 @@ class NumericMeasurement(NumericMeasurementModel):
     @model_validator(mode="after")
     def validate_operation_requirements(self) -> NumericMeasurement:
         """Validate field requirements based on selected operation."""
-        if (
-            self.operation
-            in (CompOp.EQ, CompOp.NE, CompOp.GT, CompOp.LT, CompOp.GE, CompOp.LE)
-            and self.comparison_value is None
-        ):
-            msg = f"Comparison_value required for {self.operation} operation"
-            raise ValueError(msg)
-
-        if self.operation in (
-            CompOp.GTLT,
-            CompOp.GELE,
-            CompOp.GELT,
-            CompOp.GTLE,
-            CompOp.LTGT,
-            CompOp.LEGE,
-            CompOp.LEGT,
-            CompOp.LTGE,
-        ) and (self.lower_limit is None or self.upper_limit is None):
-            msg = "lower_limit and upper_limit required for range operations"
-            raise ValueError(msg)
+        check_operation_requirements(
+            self.operation,
+            self.comparison_value,
+            self.lower_limit,
+            self.upper_limit,
+        )
 
         if self.operation:
-            self.result = self._check_condition()
+            self.result = check_condition(
+                self.value,
+                self.operation,
+                self.comparison_value,
+                self.lower_limit,
+                self.upper_limit,
+            )
 
         return self
 
-    def _check_condition(self) -> bool:  # noqa: C901,PLR0912
-        """Evaluate the measurement based on the selected operation."""
-        res = False
-        match self.operation:
-            case CompOp.EQ:
-                res = self.value == self.comparison_value
-            case CompOp.NE:
-                res = self.value != self.comparison_value
-            case CompOp.GT:
-                res = self.value > self.comparison_value
-            case CompOp.LT:
-                res = self.value < self.comparison_value
-            case CompOp.GE:
-                res = self.value >= self.comparison_value
-            case CompOp.LE:
-                res = self.value <= self.comparison_value
-            case CompOp.GTLT:
-                res = self.value > self.lower_limit and self.value < self.upper_limit
-            case CompOp.GELE:
-                res = self.value >= self.lower_limit and self.value <= self.upper_limit
-            case CompOp.GELT:
-                res = self.value >= self.lower_limit and self.value < self.upper_limit
-            case CompOp.GTLE:
-                res = self.value > self.lower_limit and self.value <= self.upper_limit
-            case CompOp.LTGT:
-                res = self.value < self.lower_limit or self.value > self.upper_limit
-            case CompOp.LEGE:
-                res = self.value <= self.lower_limit or self.value >= self.upper_limit
-            case CompOp.LEGT:
-                res = self.value <= self.lower_limit or self.value > self.upper_limit
-            case CompOp.LTGE:
-                res = self.value < self.lower_limit or self.value >= self.upper_limit
-        return res
+
+class MeasurementBatch:
+    """Represents a series of numeric measurements with the same description.
+
+    The series is stored in the case measurements as a single entry:
+    the name, unit and limits are stored once, the values and results are packed
+    to the compressed columns. The report exposes each value of the series
+    as a separate numeric measurement.
+
+    The values are kept in the NumPy array if NumPy is installed.
+
+    Args:
+        name (str | None): The name of the measurements.
+        unit (str | None): The unit of the measurements.
+        operation (CompOp | None): The comparison operation to apply.
+        comparison_value (int | float | None): The value to compare against.
+        lower_limit (int | float | None): The lower limit for range operations.
+        upper_limit (int | float | None): The upper limit for range operations.
+        values (Iterable[int | float]): The values of the measurements.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str | None = None,
+        unit: str | None = None,
+        *,
+        operation: CompOp | None = None,
+        comparison_value: float | None = None,
+        lower_limit: float | None = None,
+        upper_limit: float | None = None,
+        values: Iterable[float] = (),
+    ) -> None:
+        if operation is not None:
+            operation = CompOp(operation)
+        check_operation_requirements(
+            operation,
+            comparison_value,
+            lower_limit,
+            upper_limit,
+        )
+        self.name = name
+        self.unit = unit
+        self.operation = operation
+        self.comparison_value = comparison_value
+        self.lower_limit = lower_limit
+        self.upper_limit = upper_limit
+        self._values: Sequence[float] = to_values(())
+        # values added after the values column is joined
+        self._chunks: list[Sequence[float]] = []
+        # results of the first values, checked with the operation and limits
+        self._results: Sequence[bool] = join_values(())
+        self._results_key: tuple | None = None
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return len(self._values) + sum(len(chunk) for chunk in self._chunks)
+
+    @property
+    def values(self) -> list[float]:
+        """Get values of the measurements.
+
+        Returns:
+            list[int | float]: measurement values
+        """
+        return to_list(self._get_values())
+
+    @property
+    def results(self) -> list[bool] | None:
+        """Get result of each measurement.
+
+        The values are checked in one pass over the NumPy array
+        if NumPy is installed. Only the values added after
+        the previous check are checked.
+
+        Returns:
+            list[bool] | None: measurement results, None if the operation is not set
+        """
+        results = self._get_results()
+        if results is None:
+            return None
+        return to_list(results)
+
+    @property
+    def result(self) -> bool | None:
+        """Get result of the series.
+
+        Returns:
+            bool | None: True if all measurements pass,
+                None if the operation is not set
+        """
+        results = self._get_results()
+        if results is None:
+            return None
+        return all_results(results)
+
+    def append(self, value: float) -> None:
+        """Add measurement value to the series.
+
+        Args:
+            value (int | float): measurement value
+
+        Raises:
+            ValueError: if the value is not a number
+        """
+        self.extend((value,))
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Add measurement values to the series.
+
+        Args:
+            values (Iterable[int | float]): measurement values or NumPy array
+
+        Raises:
+            ValueError: if any value is not a number
+        """
+        values = to_values(values)
+        if len(values):
+            self._chunks.append(values)
+
+    def to_dict(self) -> dict:
+        """Get the series entry of the case measurements.
+
+        Returns:
+            dict: measurement series with the packed values and results
+        """
+        results = self._get_results()
+        series = {
+            "type": MeasurementType.NUMERIC,
+            "name": self.name,
+            "unit": self.unit,
+            "operation": self.operation,
+            "comparison_value": self.comparison_value,
+            "lower_limit": self.lower_limit,
+            "upper_limit": self.upper_limit,
+            "result": None if results is None else all_results(results),
+            VALUES_KEY: encode_column(self._get_values()),
+            RESULTS_KEY: None if results is None else encode_results(results),
+        }
+        return {k: v for k, v in series.items() if v is not None}
+
+    def _get_values(self) -> Sequence[float]:
+        # the added values are joined once before they are read
+        if self._chunks:
+            self._values = join_values([self._values, *self._chunks])
+            self._chunks = []
+        return self._values
+
+    def _get_results(self) -> Sequence[bool] | None:
+        if self.operation is None:
+            return None
+        results_key = (
+            self.operation,
+            self.comparison_value,
+            self.lower_limit,
+            self.upper_limit,
+        )
+        if results_key != self._results_key:
+            self._results = join_values(())
+            self._results_key = results_key
+        values = self._get_values()
+        if len(self._results) < len(values):
+            results = check_conditions(
+                values[len(self._results) :],
+                self.operation,
+                self.comparison_value,
+                self.lower_limit,
+                self.upper_limit,
+            )
+            self._results = join_values([self._results, results])
+        return self._results
 
 
 class StringMeasurement(StringMeasurementModel):
@@ -147,6 +298,8 @@ class StringMeasurement(StringMeasurementModel):
 class Chart(ChartModel):
     """Represents a chart with data and labels.
 
+    The data series can be set by the NumPy arrays.
+
     Args:
         type (ChartType | None): chart type.
         title (str | None): chart title.
@@ -154,6 +307,18 @@ class Chart(ChartModel):
         y_label (str | None): Y label.
     """
 
+    @model_validator(mode="before")
+    @classmethod
+    def convert_series(cls, data: Any) -> Any:  # noqa: ANN401
+        """Convert NumPy arrays of the data series to lists."""
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
+        for key in ("x_data", "y_data"):
+            if isinstance(data.get(key), list):
+                data[key] = [to_series(series) for series in data[key]]
+        return data
+
     @model_validator(mode="after")
     def validate_lines(self) -> Chart:
         """Validate field requirements based on selected operation."""
@@ -170,17 +335,19 @@ class Chart(ChartModel):
 
     def add_series(
         self,
-        x_data: list[int | float],
-        y_data: list[int | float],
+        x_data: Sequence[int | float],
+        y_data: Sequence[int | float],
         marker_name: str | None = None,
     ) -> None:
         """Add data series to chart.
 
         Args:
-            x_data (list[int | float]): X data.
-            y_data (list[int | float]): Y data.
+            x_data (Sequence[int | float]): X data, list or NumPy array.
+            y_data (Sequence[int | float]): Y data, list or NumPy array.
             marker_name (str | None): series marker name.
         """
+        x_data = to_series(x_data)
+        y_data = to_series(y_data)
         self._diff_list_len_validator(x_data, y_data)
         self._empty_list_validator(x_data)
         self.x_data.append(x_data)
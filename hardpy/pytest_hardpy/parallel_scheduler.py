@@ -0,0 +1,275 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from logging import getLogger
+from threading import Condition, Lock, Thread, get_ident, local
+from typing import TYPE_CHECKING
+
+from _pytest.outcomes import Exit
+from _pytest.runner import (
+    SetupState,
+    call_and_report,
+    check_interactive_exception,
+)
+from pytest import CallInfo
+
+from hardpy.pytest_hardpy.utils import Group, NodeInfo
+from hardpy.pytest_hardpy.utils.node_info import TestDependencyInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest import Item, Session
+
+# current test of the worker thread in the PYTEST_CURRENT_TEST format
+_current_test = local()
+
+
+def get_current_test() -> str | None:
+    """Get current test of the scheduler worker thread.
+
+    Returns:
+        str | None: current test in the `PYTEST_CURRENT_TEST` format,
+            or None outside of the worker thread
+    """
+    return getattr(_current_test, "value", None)
+
+
+class _ThreadSetupState:
+    """Pytest setup state with the separate collector stack of each thread."""
+
+    def __init__(self, main_state: SetupState) -> None:
+        self.main_state = main_state
+        self.worker_states: list[SetupState] = []
+        self._main_thread = get_ident()
+        self._local = local()
+        self._lock = Lock()
+
+    @property
+    def stack(self) -> dict:
+        return self._get_state().stack
+
+    def setup(self, item: Item) -> None:
+        self._get_state().setup(item)
+
+    def addfinalizer(self, finalizer: Callable[[], object], node: object) -> None:
+        self._get_state().addfinalizer(finalizer, node)  # type: ignore
+
+    def teardown_exact(self, nextitem: Item | None) -> None:
+        self._get_state().teardown_exact(nextitem)
+
+    def _get_state(self) -> SetupState:
+        if get_ident() == self._main_thread:
+            return self.main_state
+        state = getattr(self._local, "state", None)
+        if state is None:
+            state = SetupState()
+            self._local.state = state
+            with self._lock:
+                self.worker_states.append(state)
+        return state
+
+
+class ParallelScheduler:
+    """Dependency-aware parallel test scheduler.
+
+    Test modules run concurrently in worker threads, the test cases
+    of a module run in the module order by one thread, so the module
+    fixtures are used by a single thread. The scheduler runs the tests in
+    three stages:
+
+    - test cases of the `setup` group run sequentially;
+    - test modules of the `main` group run concurrently. A module starts
+      after the earlier modules it depends on by the `dependency` marker
+      are finished. A module with a critical test case starts after all earlier
+      modules are finished, and the later modules start after it is finished;
+    - test cases of the `teardown` group run sequentially.
+
+    The fixture setup and teardown and the test reports are serialized,
+    only the test calls with attempts run concurrently.
+
+    Args:
+        session (Session): pytest session
+        workers (int): maximum number of concurrently running test modules
+        dependencies (dict[TestDependencyInfo, set[TestDependencyInfo]]):
+            test case dependencies
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        workers: int,
+        dependencies: dict[TestDependencyInfo, set[TestDependencyInfo]],
+    ) -> None:
+        self._log = getLogger(__name__)
+        self._session = session
+        self._workers = workers
+        self._dependencies = dependencies
+        self._lock = Lock()
+        self._condition = Condition()
+        self._finished: set[str] = set()
+        self._running: set[str] = set()
+        self._error: BaseException | None = None
+        self._is_stopped = False
+
+    def run(self) -> None:
+        """Run the session tests.
+
+        Raises:
+            Failed: if the session must fail, for example by the `--maxfail` option
+            Interrupted: if the session must stop
+        """
+        items = self._session.items
+        setup_items: list[Item] = []
+        teardown_items: list[Item] = []
+        modules: dict[str, list[Item]] = {}
+        for item in items:
+            node_info = NodeInfo.from_item(item)
+            groups = {node_info.module_group, node_info.case_group}
+            if Group.SETUP in groups:
+                setup_items.append(item)
+            elif Group.TEARDOWN in groups:
+                teardown_items.append(item)
+            else:
+                modules.setdefault(node_info.module_id, []).append(item)
+
+        setup_state = self._session._setupstate  # noqa: SLF001
+        thread_setup_state = _ThreadSetupState(setup_state)
+        self._session._setupstate = thread_setup_state  # type: ignore # noqa: SLF001
+        try:
+            self._run_items(setup_items, is_last=False)
+            self._run_modules(modules)
+            self._run_items(teardown_items, is_last=True)
+        finally:
+            # the worker threads of the interrupted run are not waited for
+            self._is_stopped = True
+        self._teardown(thread_setup_state)
+        self._session._setupstate = setup_state  # noqa: SLF001
+        self._check_session()
+
+    def _run_modules(self, modules: dict[str, list[Item]]) -> None:
+        module_dependencies = self._get_module_dependencies(modules)
+        pending = list(modules)
+        with self._condition:
+            while pending or self._running:
+                if self._error is not None or self._is_session_stopped():
+                    pending.clear()
+                for module_id in list(pending):
+                    if len(self._running) >= self._workers:
+                        break
+                    if not module_dependencies[module_id] <= self._finished:
+                        continue
+                    pending.remove(module_id)
+                    self._running.add(module_id)
+                    worker = Thread(
+                        target=self._run_module,
+                        args=(module_id, modules[module_id]),
+                        name=f"hardpy-{module_id}",
+                        daemon=True,
+                    )
+                    worker.start()
+                if pending or self._running:
+                    self._condition.wait()
+        if self._error is not None:
+            raise self._error
+
+    def _run_module(self, module_id: str, items: list[Item]) -> None:
+        try:
+            self._run_items(items, is_last=False)
+        except BaseException as exc:  # noqa: BLE001
+            self._error = exc
+            self._is_stopped = True
+        finally:
+            with self._condition:
+                self._running.discard(module_id)
+                self._finished.add(module_id)
+                self._condition.notify_all()
+
+    def _run_items(self, items: list[Item], is_last: bool) -> None:
+        for i, item in enumerate(items):
+            if self._is_stopped or self._is_session_stopped():
+                return
+            nextitem = items[i + 1] if i + 1 < len(items) else None
+            if nextitem is None and not is_last:
+                # the session scope fixtures are shared by the threads
+                nextitem = self._get_outside_item(item)
+            self._run_item(item, nextitem)
+
+    def _run_item(self, item: Item, nextitem: Item | None) -> None:
+        ihook = item.ihook
+        with self._lock:
+            ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+            _current_test.value = f"{item.nodeid} (setup)"
+            report = call_and_report(item, "setup")
+        if report.passed and not item.config.getoption("setuponly", False):
+            _current_test.value = f"{item.nodeid} (call)"
+            reraise: tuple[type[BaseException], ...] = (Exit,)
+            if not item.config.getoption("usepdb", False):
+                reraise += (KeyboardInterrupt,)
+            call = CallInfo.from_call(
+                lambda: ihook.pytest_runtest_call(item=item),
+                when="call",
+                reraise=reraise,
+            )
+            report = ihook.pytest_runtest_makereport(item=item, call=call)
+            with self._lock:
+                ihook.pytest_runtest_logreport(report=report)
+                if check_interactive_exception(call, report):
+                    ihook.pytest_exception_interact(node=item, call=call, report=report)
+        with self._lock:
+            _current_test.value = f"{item.nodeid} (teardown)"
+            call_and_report(item, "teardown", nextitem=nextitem)
+            ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+            _current_test.value = None
+        if hasattr(item, "_request"):
+            item._request = False  # type: ignore # noqa: SLF001
+            item.funcargs = None  # type: ignore
+
+    def _teardown(self, thread_setup_state: _ThreadSetupState) -> None:
+        for state in [*thread_setup_state.worker_states, thread_setup_state.main_state]:
+            try:
+                state.teardown_exact(None)
+            except Exception as exc:  # noqa: BLE001, PERF203
+                self._log.error(f"Error during session fixture teardown: {exc}")
+
+    def _get_module_dependencies(
+        self,
+        modules: dict[str, list[Item]],
+    ) -> dict[str, set[str]]:
+        order = list(modules)
+        module_dependencies: dict[str, set[str]] = {
+            module_id: set() for module_id in order
+        }
+        critical_modules: set[int] = set()
+        for index, module_id in enumerate(order):
+            for item in modules[module_id]:
+                node_info = NodeInfo.from_item(item)
+                if node_info.critical:
+                    critical_modules.add(index)
+                key = TestDependencyInfo(node_info.module_id, node_info.case_id)
+                for dependency in self._dependencies.get(key, set()):
+                    dependency_module = dependency.module_id
+                    # the later modules have not run in the sequential order
+                    if dependency_module in order[:index]:
+                        module_dependencies[module_id].add(dependency_module)
+        for index in sorted(critical_modules):
+            module_dependencies[order[index]].update(order[:index])
+            for later_module in order[index + 1 :]:
+                module_dependencies[later_module].add(order[index])
+        return module_dependencies
+
+    def _get_outside_item(self, item: Item) -> Item | None:
+        for other_item in self._session.items:
+            if other_item.parent is not item.parent:
+                return other_item
+        return None
+
+    def _is_session_stopped(self) -> bool:
+        return bool(self._session.shouldfail or self._session.shouldstop)
+
+    def _check_session(self) -> None:
+        if self._session.shouldfail:
+            raise self._session.Failed(self._session.shouldfail)
+        if self._session.shouldstop:
+            raise self._session.Interrupted(self._session.shouldstop)
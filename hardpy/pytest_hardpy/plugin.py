@@ -34,8 +34,14 @@ from pytest import (
 
 from hardpy.common.config import ConfigManager, HardpyConfig
 from hardpy.common.stand_cloud.connector import StandCloudConnector, StandCloudError
+from hardpy.pytest_hardpy.parallel_scheduler import ParallelScheduler
 from hardpy.pytest_hardpy.reporter import HookReporter
-from hardpy.pytest_hardpy.utils import NodeInfo, ProgressCalculator, TestStatus
+from hardpy.pytest_hardpy.utils import (
+    CollectionCache,
+    NodeInfo,
+    ProgressCalculator,
+    TestStatus,
+)
 from hardpy.pytest_hardpy.utils.node_info import TestDependencyInfo
 
 if __debug__:
@@ -54,6 +60,16 @@ def pytest_addoption(parser: Parser) -> None:
         default=default_config.database.url,
         help="database url",
     )
+    parser.addoption(
+        "--hardpy-db-backend",
+        action="store",
+        help="database backend: couchdb, sqlite or memory",
+    )
+    parser.addoption(
+        "--hardpy-slot",
+        action="store",
+        help="DUT slot in the multi-slot mode",
+    )
     parser.addoption(
         "--hardpy-tests-name",
         action="store",
@@ -77,12 +93,25 @@ def pytest_addoption(parser: Parser) -> None:
         default=False,
         help="clear hardpy local database",
     )
+    parser.addoption(
+        "--hardpy-collection-cache",
+        action="store_true",
+        default=False,
+        help="save collected tests to the collection cache",
+    )
     parser.addoption(
         "--hardpy-pt",
         action="store_true",
         default=False,
         help="enable pytest-hardpy plugin",
     )
+    parser.addoption(
+        "--hardpy-workers",
+        action="store",
+        type=int,
+        default=1,
+        help="number of concurrently running test modules",
+    )
     parser.addoption(
         "--sc-address",
         action="store",
@@ -129,6 +158,9 @@ class HardpyPlugin:
         self._tests_name: str = ""
         self._is_critical_not_passed = False
         self._start_args = {}
+        self._slot: str | None = None
+        self._workers = 1
+        self._collection_cache: CollectionCache | None = None
 
         if system() == "Linux":
             signal.signal(signal.SIGTERM, self._stop_handler)
@@ -144,20 +176,39 @@ class HardpyPlugin:
         hardpy_config = config_manager.read_config(Path(config.rootpath))
 
         if not hardpy_config:
-            hardpy_config = HardpyConfig()
+            hardpy_config = config_manager.config
 
         database_url = config.getoption("--hardpy-db-url")
         if database_url:
             hardpy_config.database.url = str(database_url)  # type: ignore
 
+        database_backend = config.getoption("--hardpy-db-backend")
+        if database_backend:
+            hardpy_config.database.backend = str(database_backend)  # type: ignore
+
+        slot = config.getoption("--hardpy-slot")
+        if slot:
+            self._slot = str(slot)
+            hardpy_config.database.doc_id = hardpy_config.get_doc_id(self._slot)
+
         tests_name = config.getoption("--hardpy-tests-name")
         if tests_name:
             self._tests_name = str(tests_name)
         else:
             self._tests_name = str(PurePath(config.rootpath).name)
 
+        self._workers = max(int(config.getoption("--hardpy-workers")), 1)
+
         is_clear_database = config.getoption("--hardpy-clear-database")
 
+        is_collection_cache = config.getoption("--hardpy-collection-cache")
+        if is_collection_cache and config.option.collectonly:
+            # fingerprint of the collection inputs is calculated before collection
+            self._collection_cache = CollectionCache(
+                config_manager.tests_path,
+                self._slot,
+            )
+
         sc_address = config.getoption("--sc-address")
         if sc_address:
             hardpy_config.stand_cloud.address = str(sc_address)  # type: ignore
@@ -192,7 +243,8 @@ class HardpyPlugin:
         if status == TestStatus.STOPPED:
             self._stop_tests()
         self._reporter.finish(status)
-        self._reporter.update_db_by_doc()
+        self._reporter.flush_db()
+        self._log.debug(f"Database stats: {self._reporter.get_db_stats()}")
         self._reporter.compact_all()
 
         # call post run methods
@@ -212,7 +264,7 @@ class HardpyPlugin:
         self._reporter.init_doc(self._tests_name)
 
         nodes = {}
-        modules = set()
+        nodes_info = []
 
         session.items = natsorted(
             session.items,
@@ -222,7 +274,7 @@ class HardpyPlugin:
             if item.parent is None:
                 continue
             try:
-                node_info = NodeInfo(item)
+                node_info = NodeInfo.from_item(item)
             except ValueError as exc:
                 error_msg = f"Error creating NodeInfo for item: {item}. {exc}"
                 exit(error_msg, ExitCode.NO_TESTS_COLLECTED)
@@ -233,14 +285,14 @@ class HardpyPlugin:
             else:
                 nodes[node_info.module_id].append(node_info.case_id)
 
-            self._reporter.add_case(node_info)
+            nodes_info.append(node_info)
 
             self._add_dependency(node_info, nodes)
-            modules.add(node_info.module_id)
-        for module_id in modules:
-            self._reporter.set_module_status(module_id, TestStatus.READY)
-        self._reporter.update_node_order(nodes)
-        self._reporter.update_db_by_doc()
+        self._reporter.add_cases(nodes_info)
+        self._reporter.flush_db()
+
+        if self._collection_cache is not None and session.testsfailed == 0:
+            self._collection_cache.save(self._reporter.get_statestore_doc())
 
     # Test running (runtest) hooks
 
@@ -272,12 +324,21 @@ class HardpyPlugin:
                     "not available or HardPy user is not authorized"
                 )
                 self._reporter.set_alert(msg)
-                self._reporter.update_db_by_doc()
+                self._reporter.flush_db()
                 exit(msg, ExitCode.INTERNAL_ERROR)
 
         # testrun entrypoint
         self._reporter.start()
         self._reporter.update_db_by_doc()
+
+        if self._workers > 1:
+            is_continue = session.config.option.continue_on_collection_errors
+            if session.testsfailed and not is_continue:
+                msg = f"{session.testsfailed} errors during collection"
+                raise session.Interrupted(msg)
+            scheduler = ParallelScheduler(session, self._workers, self._dependencies)
+            scheduler.run()
+            return True
         return None
 
     def pytest_runtest_setup(self, item: Item) -> None:
@@ -286,7 +347,7 @@ class HardpyPlugin:
             self._log.error(f"Test module name for test {item.name} not found.")
             return
 
-        node_info = NodeInfo(item)
+        node_info = NodeInfo.from_item(item)
 
         status = TestStatus.RUN
         is_skip_test = self._is_critical_not_passed or self._is_skip_test(node_info)
@@ -301,14 +362,15 @@ class HardpyPlugin:
 
         self._reporter.set_module_status(node_info.module_id, status)
         self._reporter.set_case_status(node_info.module_id, node_info.case_id, status)
-        self._reporter.update_db_by_doc()
+        # case boundary, the operator panel must show the actual case status
+        self._reporter.flush_db()
 
         if is_skip_test:
             skip(f"Test {item.nodeid} is skipped")
 
     def pytest_runtest_call(self, item: Item) -> None:
         """Call the test item."""
-        node_info = NodeInfo(item)
+        node_info = NodeInfo.from_item(item)
         self._reporter.set_case_attempt(node_info.module_id, node_info.case_id, 1)
         self._reporter.update_db_by_doc()
 
@@ -318,7 +380,7 @@ class HardpyPlugin:
             return
 
         # failure item
-        node_info = NodeInfo(item)
+        node_info = NodeInfo.from_item(item)
         attempt = node_info.attempt
         module_id = node_info.module_id
         case_id = node_info.case_id
@@ -387,7 +449,7 @@ class HardpyPlugin:
 
         if None not in self._results[module_id].values():
             self._collect_module_result(module_id)
-        self._reporter.update_db_by_doc()
+        self._reporter.flush_db()
         return None
 
     # Fixture
@@ -413,6 +475,15 @@ class HardpyPlugin:
         """
         return copy.deepcopy(self._start_args)
 
+    @fixture(scope="session")
+    def hardpy_slot(self) -> str | None:
+        """Get DUT slot of the test run in the multi-slot mode.
+
+        Returns:
+            str | None: DUT slot, None in the single-slot mode
+        """
+        return self._slot
+
     # Not hooks
 
     def _stop_handler(self, signum: int, frame: Any) -> None:  # noqa: ANN401, ARG002
@@ -2,37 +2,64 @@
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 from __future__ import annotations
 
+import mimetypes
+from base64 import b64decode
+from contextlib import contextmanager
 from dataclasses import dataclass
 from inspect import stack
 from os import environ
-from time import sleep
+from time import monotonic
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from pycouchdb.exceptions import NotFound
 from pydantic import ValidationError
 
+from hardpy.common.config import ConfigManager
 from hardpy.pytest_hardpy.db import (
+    AttachmentStore,
     Chart,
     DatabaseField as DF,  # noqa: N817
     Instrument,
+    MeasurementBatch,
     NumericMeasurement,
     ResultRunStore,
     RunStore,
     StringMeasurement,
     SubUnit,
 )
+from hardpy.pytest_hardpy.db.attachment_store import DEFAULT_CONTENT_TYPE
+from hardpy.pytest_hardpy.parallel_scheduler import get_current_test
 from hardpy.pytest_hardpy.reporter import RunnerReporter
 from hardpy.pytest_hardpy.utils import (
+    ChartDecimation,
     DialogBox,
     DuplicateParameterError,
     HTMLComponent,
     ImageComponent,
+    InstrumentLock,
     TestStandNumberError,
 )
+from hardpy.pytest_hardpy.utils.chart_decimation import decimate
+from hardpy.pytest_hardpy.utils.measurement_column import (
+    encode_column,
+    get_measurement_count,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Generator, Iterable, Mapping
+
+# maximum duration of a single changes feed request in seconds
+_CHANGES_FEED_TIMEOUT = 30
+
+# maximum number of points of the chart data series in the statestore
+_CHART_MAX_POINTS = 5000
+
+# run artifact key of the instrument lock statistics
+_INSTRUMENT_LOCKS_KEY = "instrument_locks"
+
+# instrument lock statistics of the current test run by the lock key
+_instrument_lock_stats: dict[str, dict[str, int | float]] = {}
 
 
 @dataclass
@@ -387,6 +414,10 @@ def set_case_artifact(data: dict) -> None:
     Artifact saves only in RunStore database
     because state in StateStore and case artifact must be separated.
 
+    Binary values (bytes) are stored in the attachments database
+    and are replaced by the attachment reference with the
+    `attachment_id`, `content_type` and `size` keys.
+
     Args:
         data (dict): data
     """
@@ -401,7 +432,7 @@ def set_case_artifact(data: dict) -> None:
             DF.ARTIFACT,
             stand_key,
         )
-        reporter.set_doc_value(key, stand_value, runstore_only=True)
+        reporter.set_doc_value(key, _attach_blobs(stand_value), runstore_only=True)
     reporter.update_db_by_doc()
 
 
@@ -411,6 +442,10 @@ def set_module_artifact(data: dict) -> None:
     Artifact saves only in RunStore database
     because state in StateStore and module artifact must be separated.
 
+    Binary values (bytes) are stored in the attachments database
+    and are replaced by the attachment reference with the
+    `attachment_id`, `content_type` and `size` keys.
+
     Args:
         data (dict): data
     """
@@ -423,7 +458,7 @@ def set_module_artifact(data: dict) -> None:
             DF.ARTIFACT,
             artifact_key,
         )
-        reporter.set_doc_value(key, artifact_value, runstore_only=True)
+        reporter.set_doc_value(key, _attach_blobs(artifact_value), runstore_only=True)
     reporter.update_db_by_doc()
 
 
@@ -433,6 +468,10 @@ def set_run_artifact(data: dict) -> None:
     Artifact saves only in RunStore database
     because state in StateStore and run artifact must be separated.
 
+    Binary values (bytes) are stored in the attachments database
+    and are replaced by the attachment reference with the
+    `attachment_id`, `content_type` and `size` keys.
+
     Args:
         data (dict): data
     """
@@ -442,7 +481,7 @@ def set_run_artifact(data: dict) -> None:
             DF.ARTIFACT,
             artifact_key,
         )
-        reporter.set_doc_value(key, artifact_value, runstore_only=True)
+        reporter.set_doc_value(key, _attach_blobs(artifact_value), runstore_only=True)
     reporter.update_db_by_doc()
 
 
@@ -488,6 +527,53 @@ def set_instrument(instrument: Instrument) -> int:
     return len(instruments) - 1
 
 
+@contextmanager
+def instrument_lock(
+    instrument: Instrument | str,
+    timeout: float | None = None,
+) -> Generator[None, None, None]:
+    """Lock the shared test stand instrument.
+
+    Tests of different DUT slots and pytest processes of the test stand
+    wait for each other to use the same instrument. The instrument is
+    identified by its name and number. The lock is reentrant.
+
+    The lock statistics are stored in the `instrument_locks` run artifact
+    of the RunStore database by the instrument key: number of locks,
+    total and maximum waiting time and total holding time in seconds.
+
+    Args:
+        instrument (Instrument | str): instrument or instrument name
+        timeout (float | None): maximum waiting time in seconds,
+            if None, wait until the instrument is released
+
+    Yields:
+        None: the instrument is locked
+
+    Raises:
+        InstrumentLockTimeoutError: if the instrument is not released within the timeout
+        ValueError: if the instrument has no name
+    """
+    if isinstance(instrument, str):
+        name, number = instrument, None
+    else:
+        name, number = instrument.name, instrument.number
+    if not name:
+        msg = "Instrument name is required for the instrument lock"
+        raise ValueError(msg)
+
+    lock_dir = ConfigManager().tests_path / ".hardpy" / "locks"
+    lock = InstrumentLock(lock_dir, name, number)
+    wait_time = lock.acquire(timeout)
+    start_time = monotonic()
+    try:
+        yield
+    finally:
+        hold_time = monotonic() - start_time
+        lock.release()
+        _update_instrument_lock_stats(lock.key, wait_time, hold_time)
+
+
 def set_process_name(name: str) -> None:
     """Set process name to document.
 
@@ -546,6 +632,27 @@ def set_case_measurement(measurement: NumericMeasurement | StringMeasurement) ->
     Returns:
         int: measurement index from measurements list
     """
+    return set_case_measurements([measurement])
+
+
+def set_case_measurements(
+    measurements: MeasurementBatch
+    | Iterable[NumericMeasurement | StringMeasurement | MeasurementBatch],
+) -> int:
+    """Add several measurements to document with one document update.
+
+    The measurement batch is stored as a single entry with the packed values,
+    each value of the batch is a separate measurement of the report.
+
+    Args:
+        measurements (MeasurementBatch | Iterable): measurement batch or
+            measurement objects and batches
+
+    Returns:
+        int: index of the first added measurement from measurements list
+    """
+    if isinstance(measurements, MeasurementBatch):
+        measurements = [measurements]
     current_test = _get_current_test()
     reporter = RunnerReporter()
 
@@ -557,20 +664,38 @@ def set_case_measurement(measurement: NumericMeasurement | StringMeasurement) ->
         DF.MEASUREMENTS,
     )
 
-    measurements = reporter.get_field(key) or []
-    measurements.append({k: v for k, v in vars(measurement).items() if v is not None})
-
-    reporter.set_doc_value(key, measurements)
+    case_measurements = reporter.get_field(key) or []
+    index = get_measurement_count(case_measurements)
+    for measurement in measurements:
+        if isinstance(measurement, MeasurementBatch):
+            case_measurements.append(measurement.to_dict())
+        else:
+            case_measurements.append(
+                {k: v for k, v in vars(measurement).items() if v is not None},
+            )
+
+    reporter.set_doc_value(key, case_measurements)
     reporter.update_db_by_doc()
 
-    return len(measurements) - 1
+    return index
 
 
-def set_case_chart(chart: Chart) -> None:
+def set_case_chart(
+    chart: Chart,
+    max_points: int | None = _CHART_MAX_POINTS,
+    decimation: ChartDecimation = ChartDecimation.LTTB,
+) -> None:
     """Add chart to document.
 
+    The runstore contains the full data series packed to the compressed columns.
+    The statestore, displayed by the operator panel, contains the data series
+    decimated to the maximum number of points.
+
     Args:
         chart (Chart): chart object
+        max_points (int | None): maximum number of points of each data series
+            in the statestore, the data series are not decimated if None
+        decimation (ChartDecimation): decimation method
     """
     if not chart.x_data or not chart.y_data:
         msg = "x_data and y_data must be set"
@@ -592,15 +717,35 @@ def set_case_chart(chart: Chart) -> None:
 
     chart_dict = {k: v for k, v in vars(chart).items() if v is not None}
 
-    reporter.set_doc_value(key, chart_dict)
+    run_chart = {
+        **chart_dict,
+        DF.X_DATA: [encode_column(series) for series in chart.x_data],
+        DF.Y_DATA: [encode_column(series) for series in chart.y_data],
+    }
+    state_chart = dict(chart_dict)
+    if max_points is not None:
+        series = [
+            decimate(x_data, y_data, max_points, decimation)
+            for x_data, y_data in zip(chart.x_data, chart.y_data, strict=True)
+        ]
+        state_chart[DF.X_DATA] = [x_data for x_data, _ in series]
+        state_chart[DF.Y_DATA] = [y_data for _, y_data in series]
+
+    reporter.set_doc_value(key, run_chart, runstore_only=True)
+    reporter.set_doc_value(key, state_chart, statestore_only=True)
     reporter.update_db_by_doc()
 
 
-def run_dialog_box(dialog_box_data: DialogBox) -> Any:  # noqa: ANN401
+def run_dialog_box(
+    dialog_box_data: DialogBox,
+    timeout: float | None = None,
+) -> Any:  # noqa: ANN401
     """Display a dialog box.
 
     Args:
         dialog_box_data (DialogBox): Data for creating the dialog box.
+        timeout (float | None): Maximum time in seconds to wait for the operator
+            response. If None, wait until the operator responds.
 
         DialogBox attributes:
 
@@ -625,6 +770,7 @@ def run_dialog_box(dialog_box_data: DialogBox) -> Any:  # noqa: ANN401
 
     Raises:
         ValueError: If the 'message' argument is empty.
+        TimeoutError: If the operator did not respond within the timeout.
     """
     if not dialog_box_data.dialog_text:
         msg = "The 'dialog_text' argument cannot be empty."
@@ -640,12 +786,14 @@ def run_dialog_box(dialog_box_data: DialogBox) -> Any:  # noqa: ANN401
     )
     _cleanup_widget(reporter, key)
 
-    reporter.set_doc_value(key, dialog_box_data.to_dict(), statestore_only=True)
-    reporter.update_db_by_doc()
-
-    input_dbx_data = _get_operator_data()
+    dialog_box = _attach_images(dialog_box_data.to_dict())
+    reporter.set_doc_value(key, dialog_box, statestore_only=True)
+    reporter.flush_db()
 
-    _cleanup_widget(reporter, key)
+    try:
+        input_dbx_data = _get_operator_data(timeout)
+    finally:
+        _cleanup_widget(reporter, key)
     return dialog_box_data.widget.convert_data(input_dbx_data)
 
 
@@ -686,13 +834,13 @@ def set_operator_message(  # noqa: PLR0913
         DF.MSG: msg,
         DF.TITLE: title,
         DF.VISIBLE: True,
-        DF.IMAGE: image.to_dict() if image else None,
+        DF.IMAGE: _attach_images(image.to_dict()) if image else None,
         DF.HTML: html.to_dict() if html else None,
         DF.ID: str(uuid4()),
         DF.FONT_SIZE: int(font_size),
     }
     reporter.set_doc_value(key, msg_data, statestore_only=True)
-    reporter.update_db_by_doc()
+    reporter.flush_db()
 
     if block:
         is_msg_visible = _get_operator_data()
@@ -727,7 +875,8 @@ def get_current_attempt() -> int:
 
 
 def _get_current_test() -> CurrentTestInfo:
-    current_node = environ.get("PYTEST_CURRENT_TEST")
+    # PYTEST_CURRENT_TEST is shared by the parallel scheduler threads
+    current_node = get_current_test() or environ.get("PYTEST_CURRENT_TEST")
 
     if current_node is None:
         reporter = RunnerReporter()
@@ -753,27 +902,93 @@ def _get_current_test() -> CurrentTestInfo:
     return CurrentTestInfo(module_id=module_id, case_id=case_id)
 
 
-def _get_operator_data() -> str:
+def _get_operator_data(timeout: float | None = None) -> str:
     """Get operator panel data.
 
+    The statestore document is read again only after it is changed in the database.
+
+    Args:
+        timeout (float | None): maximum waiting time in seconds,
+            if None, wait until the data is received
+
     Returns:
         str: operator panel data
+
+    Raises:
+        TimeoutError: if the data is not received within the timeout
     """
     reporter = RunnerReporter()
 
-    data = ""
     key = reporter.generate_key(DF.OPERATOR_DATA, DF.DIALOG)
-    while not data:
+    deadline = None if timeout is None else monotonic() + timeout
+    # the sequence is obtained before reading the document
+    # so that no change is missed between reading and waiting
+    since = reporter.get_statestore_seq()
+    while True:
         reporter.update_doc_by_db()
 
         data = reporter.get_field(key)
         if data:
             reporter.set_doc_value(key, "", statestore_only=True)
-            break
-        sleep(0.1)
+            return data
+
+        wait_time = _CHANGES_FEED_TIMEOUT
+        if deadline is not None:
+            wait_time = min(wait_time, deadline - monotonic())
+            if wait_time <= 0:
+                msg = f"No operator response within {timeout} seconds"
+                raise TimeoutError(msg)
+        since = reporter.wait_statestore_change(since, wait_time)
+
+
+def _update_instrument_lock_stats(key: str, wait_time: float, hold_time: float) -> None:
+    stats = _instrument_lock_stats.setdefault(
+        key,
+        {"count": 0, "wait_time": 0.0, "max_wait_time": 0.0, "hold_time": 0.0},
+    )
+    stats["count"] += 1
+    stats["wait_time"] = round(stats["wait_time"] + wait_time, 3)
+    stats["max_wait_time"] = round(max(stats["max_wait_time"], wait_time), 3)
+    stats["hold_time"] = round(stats["hold_time"] + hold_time, 3)
+
+    reporter = RunnerReporter()
+    artifact_key = reporter.generate_key(DF.ARTIFACT, _INSTRUMENT_LOCKS_KEY)
+    lock_stats = {name: dict(value) for name, value in _instrument_lock_stats.items()}
+    reporter.set_doc_value(artifact_key, lock_stats, runstore_only=True)
+    reporter.update_db_by_doc()
+
+
+def _attach_images(data: Any) -> Any:  # noqa: ANN401
+    # the image data is replaced by the attachment id in the statestore
+    if isinstance(data, list):
+        return [_attach_images(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    data = {key: _attach_images(value) for key, value in data.items()}
+    if isinstance(data.get(DF.BASE64), str):
+        address = data.get(DF.ADDRESS) or ""
+        content_type = mimetypes.guess_type(address)[0] or DEFAULT_CONTENT_TYPE
+        image_data = b64decode(data[DF.BASE64])
+        data[DF.ATTACHMENT_ID] = AttachmentStore().put(image_data, content_type)
+        data[DF.BASE64] = None
     return data
 
 
+def _attach_blobs(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, bytes | bytearray | memoryview):
+        data = bytes(value)
+        return {
+            DF.ATTACHMENT_ID: AttachmentStore().put(data),
+            DF.CONTENT_TYPE: DEFAULT_CONTENT_TYPE,
+            DF.SIZE: len(data),
+        }
+    if isinstance(value, dict):
+        return {key: _attach_blobs(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_attach_blobs(item) for item in value]
+    return value
+
+
 def _cleanup_widget(reporter: RunnerReporter, key: str) -> None:
     reporter.set_doc_value(key, {}, statestore_only=True)
     reporter.update_db_by_doc()
@@ -6,88 +6,187 @@ import signal
 import subprocess
 import sys
 from platform import system
+from threading import RLock, Thread
+from time import sleep
 
 from hardpy.common.config import ConfigManager
-from hardpy.pytest_hardpy.db import DatabaseField as DF  # noqa: N817
+from hardpy.pytest_hardpy.db import (
+    BaseStore,
+    DatabaseField as DF,  # noqa: N817
+    StateStore,
+)
 from hardpy.pytest_hardpy.reporter import RunnerReporter
+from hardpy.pytest_hardpy.run_queue import RunInfo, RunQueue
+from hardpy.pytest_hardpy.utils import CollectionCache
+from hardpy.pytest_hardpy.warm_runner import WarmRunner
+
+# interval of the pytest subprocess checks while the run queue is not empty
+_QUEUE_POLL_INTERVAL = 0.1
 
 
 class PyTestWrapper:
-    """Wrapper for pytest subprocess."""
+    """Wrapper for pytest subprocess.
+
+    In the multi-slot mode each DUT slot has its own pytest subprocess
+    and its own statestore and runstore documents. Functions without
+    the slot argument are applied to all slots.
+
+    The runs added to the run queue are started as soon as
+    the DUT slot becomes free.
+    """
 
     def __init__(self) -> None:
-        self._proc = None
+        self._procs: dict[str | None, subprocess.Popen] = {}
+        self._slot_statestores: dict[str, BaseStore] = {}
         self._reporter = RunnerReporter()
+        self._lock = RLock()
+        self._run_queue = RunQueue()
+        self._runs: dict[str | None, RunInfo] = {}
+        self._queue_thread: Thread | None = None
         self.python_executable = sys.executable
 
         # Make sure test structure is stored in DB
         # before clients come in
         self._config_manager = ConfigManager()
         self.config = self._config_manager.config
+        self.slots: list[str | None] = [None]
+        slots = self.config.frontend.slots
+        if slots > 1:
+            self.slots = [str(slot) for slot in range(1, slots + 1)]
         self.collect(is_clear_database=True)
 
-    def start(self, start_args: dict | None = None) -> bool:
+        self._warm_runners: dict[str | None, WarmRunner] = {}
+        if self.config.frontend.warm_runner:
+            for slot in self.slots:
+                warm_runner = WarmRunner(
+                    self.python_executable,
+                    self._config_manager.tests_path,
+                )
+                warm_runner.prepare()
+                self._warm_runners[slot] = warm_runner
+
+    def start(self, start_args: dict | None = None, slot: str | None = None) -> bool:
         """Start pytest subprocess.
 
+        Args:
+            start_args (dict | None): start arguments
+            slot (str | None): DUT slot, all free slots if None
+
         Returns:
             bool: True if pytest was started
+
+        Raises:
+            ValueError: if the slot is unknown
         """
         if self.python_executable is None:
             return False
 
-        if self.is_running():
-            return False
+        is_started = False
+        with self._lock:
+            for slot_id in self._get_slots(slot):
+                if self._is_slot_running(slot_id):
+                    continue
+                run = RunInfo(start_args=start_args or {}, slot=slot_id)
+                self._start_run(run)
+                is_started = True
+        return is_started
 
-        cmd = [
-            self.python_executable,
-            "-m",
-            "pytest",
-            "--hardpy-db-url",
-            self.config.database.url,
-            "--hardpy-tests-name",
-            self.config.tests_name,
-            "--sc-address",
-            self.config.stand_cloud.address,
-        ]
-        if self.config.stand_cloud.connection_only:
-            cmd.append("--sc-connection-only")
-        cmd.append("--hardpy-pt")
-        if start_args:
-            for key, value in start_args.items():
-                arg_str = f"{key}={value}"
-                cmd.extend(["--hardpy-start-arg", arg_str])
+    def enqueue(self, start_args: dict | None = None, slot: str | None = None) -> str:
+        """Add test run to the run queue.
 
-        if system() == "Windows":
-            self._proc = subprocess.Popen(  # noqa: S603
-                cmd,
-                cwd=self._config_manager.tests_path,
-                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
-            )
-        if system() == "Linux":
-            self._proc = subprocess.Popen(  # noqa: S603
-                cmd,
-                cwd=self._config_manager.tests_path,
-            )
+        The run is started immediately if the DUT slot is free,
+        otherwise it is started after the previous runs.
 
-        return True
+        Args:
+            start_args (dict | None): start arguments
+            slot (str | None): DUT slot, any free slot if None
+
+        Returns:
+            str: run id
+
+        Raises:
+            ValueError: if the slot is unknown
+        """
+        self._get_slots(slot)
+        with self._lock:
+            run = self._run_queue.add(start_args, slot)
+            self._start_queued_runs()
+            if self._queue_thread is None or not self._queue_thread.is_alive():
+                self._queue_thread = Thread(target=self._process_queue, daemon=True)
+                self._queue_thread.start()
+        return run.run_id
+
+    def clear_queue(self, slot: str | None = None) -> int:
+        """Remove the queued test runs.
+
+        Args:
+            slot (str | None): DUT slot, all runs if None
+
+        Returns:
+            int: number of removed runs
+
+        Raises:
+            ValueError: if the slot is unknown
+        """
+        self._get_slots(slot)
+        with self._lock:
+            return self._run_queue.clear(slot)
 
-    def stop(self) -> bool:
+    @property
+    def queue_depth(self) -> int:
+        """Get number of the queued test runs.
+
+        Returns:
+            int: run queue depth
+        """
+        return self._run_queue.depth
+
+    def get_queue_info(self) -> dict:
+        """Get the run queue info.
+
+        Returns:
+            dict: queue depth, queued runs and the last runs
+                with the waiting and execution times in seconds
+        """
+        with self._lock:
+            self._update_runs()
+            return self._run_queue.get_info()
+
+    def stop(self, slot: str | None = None) -> bool:
         """Stop pytest subprocess.
 
+        The queued runs of the stopped slots are removed from the run queue.
+
+        Args:
+            slot (str | None): DUT slot, all slots if None
+
         Returns:
             bool: True if pytest was running and stopped
+
+        Raises:
+            ValueError: if the slot is unknown
         """
-        if self.is_running() and self._proc:
-            if system() == "Linux":
-                self._proc.terminate()
-            elif system() == "Windows":
-                self._proc.send_signal(signal.CTRL_BREAK_EVENT)  # type: ignore
-            return True
-        return False
+        is_stopped = False
+        with self._lock:
+            self._run_queue.clear(slot)
+            for slot_id in self._get_slots(slot):
+                proc = self._procs.get(slot_id)
+                if proc is None or not self._is_slot_running(slot_id):
+                    continue
+                if system() == "Linux":
+                    proc.terminate()
+                elif system() == "Windows":
+                    proc.send_signal(signal.CTRL_BREAK_EVENT)  # type: ignore
+                is_stopped = True
+        return is_stopped
 
     def collect(self, *, is_clear_database: bool = False) -> bool:
         """Perform pytest collection.
 
+        If the test files and the configuration files are not changed
+        since the last collection, the collected tests are loaded
+        from the collection cache without running pytest.
+
         Args:
             is_clear_database (bool): indicates whether database
                                       should be cleared. Defaults to False.
@@ -101,52 +200,84 @@ class PyTestWrapper:
         if self.is_running():
             return False
 
-        args = [
-            "-m",
-            "pytest",
-            "--collect-only",
-            "--hardpy-db-url",
-            self.config.database.url,
-            "--hardpy-tests-name",
-            self.config.tests_name,
-            "--hardpy-pt",
-        ]
+        for slot in self.slots:
+            if self._load_collection_cache(slot):
+                continue
+
+            args = [
+                "-m",
+                "pytest",
+                "--collect-only",
+                "--hardpy-collection-cache",
+                "--hardpy-db-url",
+                self.config.database.url,
+                "--hardpy-tests-name",
+                self.config.tests_name,
+                "--hardpy-pt",
+            ]
+            if slot is not None:
+                args.extend(["--hardpy-slot", slot])
 
-        if is_clear_database:
-            args.append("--hardpy-clear-database")
+            if is_clear_database:
+                args.append("--hardpy-clear-database")
 
-        subprocess.Popen(  # noqa: S603
-            [self.python_executable, *args],
-            cwd=self._config_manager.tests_path,
-        )
+            subprocess.Popen(  # noqa: S603
+                [self.python_executable, *args],
+                cwd=self._config_manager.tests_path,
+            )
         return True
 
-    def send_data(self, data: str) -> bool:
+    def send_data(self, data: str, slot: str | None = None) -> bool:
         """Send data to pytest subprocess.
 
         Args:
             data (str): Data to be sent. Can be dialog
                         box output or operator message visibility.
+            slot (str | None): DUT slot
 
         Returns:
             bool: True if dialog box was confirmed/closed, else False
         """
         try:
-            self._reporter.update_doc_by_db()
+            statestore = self._get_statestore(slot)
+            statestore.update_doc()
             key = self._reporter.generate_key(DF.OPERATOR_DATA, DF.DIALOG)
-            self._reporter.set_doc_value(key, data, statestore_only=True)
-            self._reporter.update_db_by_doc()
+            statestore.update_doc_value(key, data)
+            statestore.flush()
         except Exception:  # noqa: BLE001
             return False
         return True
 
-    def is_running(self) -> bool | None:
+    def is_running(self, slot: str | None = None) -> bool:
         """Check if pytest is running.
 
+        Args:
+            slot (str | None): DUT slot, any slot if None
+
+        Returns:
+            bool: True if pytest subprocess of the slot is running
+
+        Raises:
+            ValueError: if the slot is unknown
+        """
+        return any(self._is_slot_running(slot_id) for slot_id in self._get_slots(slot))
+
+    def get_doc_id(self, slot: str | None = None) -> str:
+        """Get statestore and runstore document id.
+
+        Args:
+            slot (str | None): DUT slot, the first slot if None
+
         Returns:
-            bool | None: True if self._proc is not None
+            str: document id
+
+        Raises:
+            ValueError: if the slot is unknown
         """
-        return self._proc and self._proc.poll() is None
+        if slot is None:
+            slot = self.slots[0]
+        self._get_slots(slot)
+        return self.config.get_doc_id(slot)
 
     def get_config(self) -> dict:
         """Get HardPy configuration.
@@ -156,3 +287,112 @@ class PyTestWrapper:
         """
         config_manager = ConfigManager()
         return config_manager.config.model_dump()
+
+    def _start_run(self, run: RunInfo) -> None:
+        self._update_runs()
+        self._start_slot(run.slot, run.start_args)
+        self._run_queue.start(run)
+        self._runs[run.slot] = run
+
+    def _start_queued_runs(self) -> None:
+        self._update_runs()
+        free_slots = [slot for slot in self.slots if not self._is_slot_running(slot)]
+        while free_slots:
+            run = self._run_queue.pop_next(free_slots)
+            if run is None:
+                return
+            self._start_run(run)
+            free_slots.remove(run.slot)
+
+    def _update_runs(self) -> None:
+        for slot, run in list(self._runs.items()):
+            proc = self._procs.get(slot)
+            exit_code = None if proc is None else proc.poll()
+            if proc is None or exit_code is not None:
+                self._run_queue.finish(run, exit_code)
+                del self._runs[slot]
+
+    def _process_queue(self) -> None:
+        while True:
+            sleep(_QUEUE_POLL_INTERVAL)
+            with self._lock:
+                if self._run_queue.depth == 0:
+                    self._update_runs()
+                    self._queue_thread = None
+                    return
+                self._start_queued_runs()
+
+    def _start_slot(self, slot: str | None, start_args: dict | None) -> None:
+        args = [
+            "--hardpy-db-url",
+            self.config.database.url,
+            "--hardpy-tests-name",
+            self.config.tests_name,
+            "--sc-address",
+            self.config.stand_cloud.address,
+        ]
+        if self.config.stand_cloud.connection_only:
+            args.append("--sc-connection-only")
+        if slot is not None:
+            args.extend(["--hardpy-slot", slot])
+        args.append("--hardpy-pt")
+        if start_args:
+            for key, value in start_args.items():
+                arg_str = f"{key}={value}"
+                args.extend(["--hardpy-start-arg", arg_str])
+
+        warm_runner = self._warm_runners.get(slot)
+        if warm_runner is not None:
+            proc = warm_runner.start(args)
+            # the next run uses a new warm process
+            warm_runner.prepare()
+            if proc is not None:
+                self._procs[slot] = proc
+                return
+
+        cmd = [self.python_executable, "-m", "pytest", *args]
+        if system() == "Windows":
+            self._procs[slot] = subprocess.Popen(  # noqa: S603
+                cmd,
+                cwd=self._config_manager.tests_path,
+                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
+            )
+        if system() == "Linux":
+            self._procs[slot] = subprocess.Popen(  # noqa: S603
+                cmd,
+                cwd=self._config_manager.tests_path,
+            )
+
+    def _is_slot_running(self, slot: str | None) -> bool:
+        proc = self._procs.get(slot)
+        return proc is not None and proc.poll() is None
+
+    def _get_slots(self, slot: str | None) -> list[str | None]:
+        if slot is None:
+            return self.slots
+        if slot not in self.slots:
+            msg = f"Unknown DUT slot: {slot}"
+            raise ValueError(msg)
+        return [slot]
+
+    def _get_statestore(self, slot: str | None) -> BaseStore:
+        if slot is None and self.slots == [None]:
+            return StateStore()
+        doc_id = self.get_doc_id(slot)
+        if doc_id not in self._slot_statestores:
+            self._slot_statestores[doc_id] = BaseStore("statestore", doc_id)
+        return self._slot_statestores[doc_id]
+
+    def _load_collection_cache(self, slot: str | None) -> bool:
+        collection_cache = CollectionCache(self._config_manager.tests_path, slot)
+        doc = collection_cache.load()
+        if doc is None:
+            return False
+        try:
+            statestore = self._get_statestore(slot)
+            for key, value in doc.items():
+                statestore.update_doc_value(key, value)
+            statestore.flush()
+        except Exception:  # noqa: BLE001
+            return False
+        return True
@@ -62,10 +62,29 @@ class BaseReporter:
         self.set_doc_value(DF.ALERT, alert, statestore_only=True)
 
     def update_db_by_doc(self) -> None:
-        """Update database by current document."""
+        """Update database by current document.
+
+        The write is deferred until the end of the flush interval.
+        """
         self._statestore.update_db()
         self._runstore.update_db()
 
+    def flush_db(self) -> None:
+        """Write all pending document changes to the database immediately."""
+        self._statestore.flush()
+        self._runstore.flush()
+
+    def get_db_stats(self) -> dict[str, dict[str, int]]:
+        """Get database request counters of the statestore and runstore.
+
+        Returns:
+            dict[str, dict[str, int]]: counters by database name
+        """
+        return {
+            "statestore": self._statestore.stats,
+            "runstore": self._runstore.stats,
+        }
+
     def update_doc_by_db(self) -> None:
         """Update document by current database."""
         self._statestore.update_doc()
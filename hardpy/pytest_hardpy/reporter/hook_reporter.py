@@ -2,8 +2,8 @@
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 from __future__ import annotations
 
-from copy import deepcopy
 from logging import getLogger
+from threading import Lock
 from time import time
 
 from natsort import natsorted
@@ -23,6 +23,8 @@ class HookReporter(BaseReporter):
             self._statestore.clear()
             self._runstore.clear()
         self._log = getLogger(__name__)
+        # the parallel test modules report the failures concurrently
+        self._caused_dut_failure_lock = Lock()
 
     def init_doc(self, doc_name: str) -> None:
         """Initialize document.
@@ -122,6 +124,31 @@ class HookReporter(BaseReporter):
         self.set_doc_value(key, item_statestore, statestore_only=True)
         self.set_doc_value(key, item_runstore, runstore_only=True)
 
+    def add_cases(self, nodes_info: list[NodeInfo]) -> None:
+        """Add collected test cases to document.
+
+        The module and case tree is built in memory and set to the document once.
+        Outdated modules and cases are removed from the StateStore document,
+        cases keep the collection order and modules are sorted by id.
+
+        Args:
+            nodes_info (list[NodeInfo]): nodes info in collection order
+        """
+        key = DF.MODULES
+
+        item_statestore = self._statestore.get_field(key)
+        item_runstore = self._runstore.get_field(key)
+
+        nodes: dict[str, list[str]] = {}
+        for node_info in nodes_info:
+            self._init_case(item_statestore, node_info, is_only_statestore=True)
+            self._init_case(item_runstore, node_info, is_only_runstore=True)
+            nodes.setdefault(node_info.module_id, []).append(node_info.case_id)
+
+        ordered_statestore = self._order_modules(item_statestore, nodes)
+        self.set_doc_value(key, ordered_statestore, statestore_only=True)
+        self.set_doc_value(key, item_runstore, runstore_only=True)
+
     def set_case_status(self, module_id: str, case_id: str, status: TestStatus) -> None:
         """Set test case status.
 
@@ -241,16 +268,23 @@ class HookReporter(BaseReporter):
         key = self.generate_key(DF.MODULES, module_id, DF.CASES, case_id, DF.START_TIME)
         return self._statestore.get_field(key)
 
-    def set_caused_dut_failure_id(self, module_id: str, case_id: str) -> None:
-        """Set caused DUT failure id.
+    def set_caused_dut_failure_id(self, module_id: str, case_id: str) -> bool:
+        """Set caused DUT failure id if it is not set yet.
 
         Args:
             module_id (str): module id
             case_id (str): case id
+
+        Returns:
+            bool: True if the id is set, False if the id of other failure is kept
         """
         key = self.generate_key(DF.CAUSED_DUT_FAILURE_ID)
         failure_id = f"{module_id}::{case_id}"
-        self.set_doc_value(key, failure_id)
+        with self._caused_dut_failure_lock:
+            if self._statestore.get_field(key) is not None:
+                return False
+            self.set_doc_value(key, failure_id)
+        return True
 
     def get_caused_dut_failure_id(self) -> str | None:
         """Get caused DUT failure id.
@@ -290,6 +324,14 @@ class HookReporter(BaseReporter):
         key = self.generate_key(DF.ERROR_CODE)
         self.set_doc_value(key, None)
 
+    def get_statestore_doc(self) -> dict:
+        """Get statestore document fields.
+
+        Returns:
+            dict: statestore document without the id and revision
+        """
+        return self._statestore.get_doc_fields()
+
     def update_node_order(self, nodes: dict) -> None:
         """Update node order.
 
@@ -297,13 +339,9 @@ class HookReporter(BaseReporter):
             nodes (dict): modules and cases.
         """
         key = DF.MODULES
-        old_modules = self._statestore.get_field(key)
-        modules_copy = deepcopy(old_modules)
-
-        rm_outdated_nodes = self._remove_outdate_node(old_modules, modules_copy, nodes)
-        updated_case_order = self._update_case_order(rm_outdated_nodes, nodes)
-        updated_module_order = self._update_module_order(updated_case_order)
-        self.set_doc_value(key, updated_module_order, statestore_only=True)
+        modules = self._statestore.get_field(key)
+        ordered_modules = self._order_modules(modules, nodes)
+        self.set_doc_value(key, ordered_modules, statestore_only=True)
 
     def _set_time(self, key: str) -> None:
         current_time = self._statestore.get_field(key)
@@ -357,36 +395,8 @@ class HookReporter(BaseReporter):
             case_default[DF.DIALOG_BOX] = {}
         item[node_info.module_id][DF.CASES][node_info.case_id] = case_default
 
-    def _remove_outdate_node(
-        self,
-        old_modules: dict,
-        new_modules: dict,
-        nodes: dict,
-    ) -> dict:
-        """Remove outdated nodes from StateStore database.
-
-        Args:
-            old_modules (dict): list of modules and cases.
-            new_modules (dict): list of modules and cases.
-            nodes (dict): modules and cases.
-
-        Returns:
-            dict: list of modules and cases.
-        """
-        for module_id, module in old_modules.items():
-            # remove outdated modules
-            if module_id not in nodes:
-                new_modules.pop(module_id)
-                continue
-            # remove outdated cases in module
-            for case_id in module[DF.CASES]:
-                if case_id not in nodes[module_id]:
-                    new_modules[module_id][DF.CASES].pop(case_id)
-
-        return new_modules
-
-    def _update_case_order(self, modules: dict, nodes: dict) -> dict:
-        """Update test order for StateStore database.
+    def _order_modules(self, modules: dict, nodes: dict) -> dict:
+        """Remove outdated nodes and sort modules and cases.
 
         Args:
             modules (dict): list of modules and cases.
@@ -395,34 +405,15 @@ class HookReporter(BaseReporter):
         Returns:
             dict: list of modules and cases.
         """
-        for module_id, module in modules.items():
-            nodes_order = nodes.get(module_id, [])
-            modules_order = list(module.get(DF.CASES).keys())
-            if nodes_order != modules_order:
-                # sort cases in module
-                sorted_cases = {}
-                for case_name in nodes_order:
-                    case_data = module[DF.CASES].get(case_name, {})
-                    sorted_cases[case_name] = case_data
-                module[DF.CASES] = sorted_cases
-
-        return modules
-
-    def _update_module_order(self, modules: dict) -> dict:
-        """Update test order for StateStore database.
-
-        Args:
-            modules (dict): list of modules and cases.
-
-        Returns:
-            dict: list of modules and cases.
-        """
-        sorted_modules = natsorted(modules.items(), key=lambda item: item[0])
-
+        module_ids = natsorted(module_id for module_id in modules if module_id in nodes)
         new_modules = {}
-        for module_id, module in sorted_modules:
-            new_modules[module_id] = module  # noqa: PERF403
-
+        for module_id in module_ids:
+            module = modules[module_id]
+            cases = module[DF.CASES]
+            module[DF.CASES] = {
+                case_id: cases.get(case_id, {}) for case_id in nodes[module_id]
+            }
+            new_modules[module_id] = module
         return new_modules
 
     def _get_module_name(self, node_info: NodeInfo) -> str:
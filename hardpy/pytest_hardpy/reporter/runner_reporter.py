@@ -25,3 +25,23 @@ class RunnerReporter(BaseReporter, metaclass=SingletonMeta):
             Any: field value
         """
         return self._statestore.get_field(key)
+
+    def get_statestore_seq(self) -> str:
+        """Get the current update sequence of the statestore database.
+
+        Returns:
+            str: database update sequence
+        """
+        return self._statestore.get_update_seq()
+
+    def wait_statestore_change(self, since: str, timeout: float) -> str:
+        """Wait for the statestore document change.
+
+        Args:
+            since (str): database update sequence
+            timeout (float): maximum waiting time in seconds
+
+        Returns:
+            str: last database update sequence
+        """
+        return self._statestore.wait_doc_change(since, timeout)
@@ -5,6 +5,10 @@ from hardpy.pytest_hardpy.result.report_loader.couchdb_loader import CouchdbLoad
 from hardpy.pytest_hardpy.result.report_loader.stand_cloud_loader import (
     StandCloudLoader,
 )
+from hardpy.pytest_hardpy.result.report_loader.stand_cloud_outbox import (
+    StandCloudOutbox,
+    StandCloudUploader,
+)
 from hardpy.pytest_hardpy.result.report_reader.couchdb_reader import CouchdbReader
 from hardpy.pytest_hardpy.result.report_reader.stand_cloud_reader import (
     StandCloudReader,
@@ -14,5 +18,7 @@ __all__ = [
     "CouchdbLoader",
     "CouchdbReader",
     "StandCloudLoader",
+    "StandCloudOutbox",
     "StandCloudReader",
+    "StandCloudUploader",
 ]
@@ -9,6 +9,8 @@ from dataclasses import dataclass
 import requests
 from urllib3 import disable_warnings
 
+from hardpy.pytest_hardpy.db.backend import CouchdbConnectionManager
+
 
 @dataclass
 class CouchdbConfig:
@@ -44,6 +46,17 @@ class CouchdbConfig:
         if self.connection_str:
             return self.connection_str
 
+        # the protocol is detected once for each host
+        protocol = CouchdbConnectionManager().get_protocol(
+            self.host,
+            self.port,
+            self._detect_protocol,
+        )
+        uri = f"{self.host}:{self.port!s}" if protocol == "http" else f"{self.host}"
+        credentials = f"{self.user}:{self.password}"
+        return f"{protocol}://{credentials}@{uri}/"
+
+    def _detect_protocol(self) -> str:
         # TODO(xorialexandrov): Modify connection string creating based on protocol.
         #       Some problems with http and https, different ports, local
         #       and cloud databases.
@@ -51,10 +64,8 @@ class CouchdbConfig:
 
         if protocol == "http":
             host_url = f"http://{self.host}:{self.port}"
-            uri = f"{self.host}:{self.port!s}"
         elif protocol == "https":
             host_url = f"https://{self.host}"
-            uri = f"{self.host}"
 
         try:
             response = requests.get(host_url, timeout=5)
@@ -71,8 +82,7 @@ class CouchdbConfig:
             raise RuntimeError(msg) from exc
         # fmt: on
 
-        credentials = f"{self.user}:{self.password}"
-        return f"{protocol}://{credentials}@{uri}/"
+        return protocol
 
     def _get_protocol(self) -> str:
         success = 200
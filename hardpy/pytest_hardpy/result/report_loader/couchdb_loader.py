@@ -1,16 +1,25 @@
 # Copyright (c) 2024 Everypin
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 from logging import getLogger
 from uuid import uuid4
 
-from pycouchdb import Server as DbServer
 from pycouchdb.client import Database
 from pycouchdb.exceptions import Conflict
+from requests.exceptions import RequestException
 
+from hardpy.pytest_hardpy.db.backend import CouchdbConnectionManager
 from hardpy.pytest_hardpy.db.schema import ResultRunStore
 from hardpy.pytest_hardpy.result.couchdb_config import CouchdbConfig
 
+# number of reports saved by one bulk request
+_BULK_BATCH_SIZE = 500
+# number of concurrent bulk requests
+_BULK_WORKERS = 4
+
 
 class CouchdbLoader:
     """CouchDB report generator."""
@@ -18,7 +27,7 @@ class CouchdbLoader:
     def __init__(self, config: CouchdbConfig) -> None:
         self._log = getLogger(__name__)
         self._config: CouchdbConfig = config
-        self._db_srv = DbServer(config.connection_string)
+        self._db_srv = CouchdbConnectionManager().get_server(config.connection_string)
         self._db: Database = self._init_db()
 
     def load(self, report: ResultRunStore) -> bool:
@@ -40,6 +49,46 @@ class CouchdbLoader:
         self._log.debug(f"Report saved with id: {report_id}")
         return True
 
+    def load_many(
+        self,
+        reports: list[ResultRunStore],
+        batch_size: int = _BULK_BATCH_SIZE,
+        workers: int = _BULK_WORKERS,
+    ) -> dict[str, str]:
+        """Load reports to the report database by bulk requests.
+
+        Reports are split into batches, each batch is saved by one
+        `_bulk_docs` request. Batches are saved concurrently.
+        The reports of a batch are saved independently, so a conflict
+        of one report does not prevent saving the others.
+        If the request of a batch fails, all reports of the batch are not saved.
+
+        Reports keep their document id, so the report loaded again
+        is reported as a conflict. The report without the id gets a new one.
+
+        Args:
+            reports (list[ResultRunStore]): reports
+            batch_size (int): number of reports in one request
+            workers (int): number of concurrent requests
+
+        Returns:
+            dict[str, str]: errors of the not saved reports by report id,
+                empty if all reports are saved
+        """
+        docs = [
+            self._schema_to_dict(report, report.id or self._get_report_id(report))
+            for report in reports
+        ]
+        batches = [docs[i : i + batch_size] for i in range(0, len(docs), batch_size)]
+        errors: dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            for batch_errors in executor.map(self._save_batch, batches):
+                errors.update(batch_errors)
+        for report_id, error in errors.items():
+            self._log.error(f"Error while saving report {report_id}: {error}")
+        self._log.debug(f"Reports saved: {len(docs) - len(errors)} of {len(docs)}")
+        return errors
+
     def _init_db(self) -> Database:
         try:
             return self._db_srv.create(self._config.db_name)  # type: ignore
@@ -47,6 +96,29 @@ class CouchdbLoader:
             # database is already created
             return self._db_srv.database(self._config.db_name)
 
+    def _save_batch(self, docs: list[dict]) -> dict[str, str]:
+        resource = self._db.resource("_bulk_docs")
+        try:
+            response = resource.session.post(
+                resource.base_url,
+                data=json.dumps({"docs": docs}).encode("utf-8"),
+                headers={
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                },
+                timeout=resource.timeout,
+            )
+        except RequestException as exc:
+            # the other batches are saved independently
+            return {doc["_id"]: str(exc) for doc in docs}
+        if response.status_code != HTTPStatus.CREATED:
+            return {doc["_id"]: response.text for doc in docs}
+        return {
+            result["id"]: f"{result['error']}, {result.get('reason', '')}"
+            for result in response.json()
+            if "error" in result
+        }
+
     def _get_report_id(self, report: ResultRunStore) -> str:
         timestamp = report.stop_time
         device_serial_number = report.dut.serial_number
@@ -43,6 +43,22 @@ class StandCloudLoader:
         Returns:
             Response: StandCloud load response, must be 201
 
+        Raises:
+            StandCloudError: if report not uploaded to StandCloud
+        """
+        # the summary is stored only in the local reports
+        return self.load_data(report.model_dump(exclude={"summary"}), timeout)
+
+    def load_data(self, report_data: dict, timeout: int = 20) -> Response:
+        """Load report data to the StandCloud.
+
+        Args:
+            report_data (dict): report data, the dumped ResultRunStore report
+            timeout (int, optional): post timeout in seconds. Defaults to 20.
+
+        Returns:
+            Response: StandCloud load response, must be 201
+
         Raises:
             StandCloudError: if report not uploaded to StandCloud
         """
@@ -51,7 +67,7 @@ class StandCloudLoader:
         try:
             resp = api.post(
                 verify=self._verify_ssl,
-                json=report.model_dump(),
+                json=report_data,
                 timeout=timeout,
             )
         except RuntimeError as exc:
@@ -0,0 +1,232 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import json
+from http import HTTPStatus
+from logging import getLogger
+from threading import Event, Thread
+from time import time_ns
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from requests.exceptions import RequestException
+
+from hardpy.common.config import ConfigManager
+from hardpy.common.stand_cloud.exception import StandCloudError
+from hardpy.pytest_hardpy.result.report_loader.stand_cloud_loader import (
+    StandCloudLoader,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from hardpy.pytest_hardpy.db.schema import ResultRunStore
+
+# maximum number of reports uploaded in one upload cycle
+_BATCH_SIZE = 10
+# interval of the outbox checks in seconds
+_CHECK_INTERVAL = 5
+# maximum delay between the upload attempts after errors in seconds
+_MAX_BACKOFF = 300
+# response statuses after which the report upload is repeated
+_RETRY_STATUSES = frozenset(
+    {
+        HTTPStatus.UNAUTHORIZED,
+        HTTPStatus.FORBIDDEN,
+        HTTPStatus.REQUEST_TIMEOUT,
+        HTTPStatus.TOO_MANY_REQUESTS,
+    },
+)
+
+
+class StandCloudOutbox:
+    """Local outbox of the StandCloud reports.
+
+    Reports are stored as JSON files in the outbox directory and
+    are removed only after the StandCloud accepts them. Reports rejected
+    by the StandCloud are moved to the `rejected` subdirectory.
+    The outbox survives restarts of the test stand, so no report is lost
+    while the network is down.
+
+    Args:
+        outbox_path (Path | None): outbox directory,
+            the `.hardpy/outbox` directory of the tests directory if None
+    """
+
+    def __init__(self, outbox_path: Path | None = None) -> None:
+        self._log = getLogger(__name__)
+        if outbox_path is None:
+            outbox_path = ConfigManager().tests_path / ".hardpy" / "outbox"
+        self._path = outbox_path
+        self._rejected_path = outbox_path / "rejected"
+
+    @property
+    def backlog(self) -> int:
+        """Get number of the reports waiting for upload.
+
+        Returns:
+            int: number of reports
+        """
+        return len(self.get_reports())
+
+    @property
+    def rejected(self) -> int:
+        """Get number of the reports rejected by the StandCloud.
+
+        Returns:
+            int: number of reports
+        """
+        if not self._rejected_path.exists():
+            return 0
+        return sum(1 for _ in self._rejected_path.glob("*.json"))
+
+    def put(self, report: ResultRunStore) -> Path:
+        """Add report to the outbox.
+
+        Args:
+            report (ResultRunStore): report
+
+        Returns:
+            Path: report file
+        """
+        self._path.mkdir(parents=True, exist_ok=True)
+        # the file names keep the order of the reports
+        report_path = self._path / f"{time_ns():020d}_{uuid4().hex}.json"
+        tmp_path = report_path.with_suffix(".tmp")
+        report_data = report.model_dump(exclude={"summary"})
+        tmp_path.write_text(json.dumps(report_data), encoding="utf-8")
+        tmp_path.replace(report_path)
+        return report_path
+
+    def get_reports(self, limit: int | None = None) -> list[Path]:
+        """Get report files in the upload order.
+
+        Args:
+            limit (int | None): maximum number of reports
+
+        Returns:
+            list[Path]: report files
+        """
+        if not self._path.exists():
+            return []
+        return sorted(self._path.glob("*.json"))[:limit]
+
+    def upload(
+        self,
+        loader: StandCloudLoader,
+        batch_size: int = _BATCH_SIZE,
+        timeout: int = 20,
+    ) -> int:
+        """Upload the oldest reports to the StandCloud.
+
+        Args:
+            loader (StandCloudLoader): StandCloud loader
+            batch_size (int): maximum number of uploaded reports
+            timeout (int): post timeout of each report in seconds
+
+        Returns:
+            int: number of uploaded reports
+
+        Raises:
+            StandCloudError: if the StandCloud is unavailable
+        """
+        uploaded = 0
+        for report_path in self.get_reports(batch_size):
+            try:
+                report_data = json.loads(report_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                self._reject(report_path, str(exc))
+                continue
+            try:
+                response = loader.load_data(report_data, timeout)
+            except RequestException as exc:
+                raise StandCloudError(str(exc)) from exc
+            status_code = response.status_code
+            if status_code == HTTPStatus.CREATED:
+                report_path.unlink()
+                uploaded += 1
+            elif status_code in _RETRY_STATUSES or status_code >= 500:  # noqa: PLR2004
+                msg = f"status code {status_code}, {response.text}"
+                raise StandCloudError(msg)
+            else:
+                self._reject(report_path, f"status code {status_code}, {response.text}")
+        return uploaded
+
+    def _reject(self, report_path: Path, reason: str) -> None:
+        self._log.error(f"Report {report_path.name} is rejected: {reason}")
+        self._rejected_path.mkdir(parents=True, exist_ok=True)
+        report_path.replace(self._rejected_path / report_path.name)
+
+
+class StandCloudUploader:
+    """Background uploader of the StandCloud outbox reports.
+
+    The uploader sends the outbox reports in batches. After an upload error
+    the uploader waits with an exponential backoff up to 5 minutes.
+
+    Args:
+        outbox (StandCloudOutbox): report outbox
+        address (str | None): StandCloud address,
+            the value is taken from the hardpy.toml if None
+    """
+
+    def __init__(self, outbox: StandCloudOutbox, address: str | None = None) -> None:
+        self._log = getLogger(__name__)
+        self._outbox = outbox
+        self._address = address
+        self._stop_event = Event()
+        self._thread: Thread | None = None
+        self._last_error: str | None = None
+
+    @property
+    def status(self) -> dict:
+        """Get uploader status.
+
+        Returns:
+            dict: outbox backlog, number of rejected reports and the last upload error
+        """
+        return {
+            "backlog": self._outbox.backlog,
+            "rejected": self._outbox.rejected,
+            "last_error": self._last_error,
+        }
+
+    def start(self) -> None:
+        """Start the background upload."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = Thread(target=self._upload, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background upload."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _upload(self) -> None:
+        loader: StandCloudLoader | None = None
+        backoff = 0
+        delay = 0
+        while not self._stop_event.wait(delay):
+            if self._outbox.backlog == 0:
+                delay = _CHECK_INTERVAL
+                continue
+            try:
+                if loader is None:
+                    loader = StandCloudLoader(self._address)
+                self._outbox.upload(loader)
+            except Exception as exc:  # noqa: BLE001
+                self._last_error = str(exc)
+                self._log.warning(f"StandCloud reports are not uploaded: {exc}")
+                # a new connection is created after the error
+                loader = None
+                backoff = min(max(backoff * 2, _CHECK_INTERVAL), _MAX_BACKOFF)
+                delay = backoff
+                continue
+            self._last_error = None
+            backoff = 0
+            delay = 0
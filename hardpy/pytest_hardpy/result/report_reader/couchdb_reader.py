@@ -2,21 +2,40 @@
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from logging import getLogger
 from typing import TYPE_CHECKING
 
-from pycouchdb import Server as DbServer
-from pycouchdb.exceptions import NotFound
+from pycouchdb.exceptions import GenericError, NotFound
 
 from hardpy.pytest_hardpy.db import DatabaseField as DF  # noqa: N817
+from hardpy.pytest_hardpy.db.backend import CouchdbConnectionManager
 from hardpy.pytest_hardpy.utils.const import TestStatus
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pycouchdb.client import Database
 
     from hardpy.pytest_hardpy.result.couchdb_config import CouchdbConfig
 
+# design document of the report indexes
+_INDEX_DESIGN_DOC = "hardpy_report"
+# report field of the DUT serial number
+_SERIAL_NUMBER_FIELD = f"{DF.DUT.value}.{DF.SERIAL_NUMBER.value}"
+# indexed report fields by index name
+_INDEXES = {
+    "start_time": [DF.START_TIME],
+    "stop_time": [DF.STOP_TIME],
+    "status": [DF.STATUS],
+    "serial_number": [_SERIAL_NUMBER_FIELD],
+}
+# number of reports requested by one query
+_PAGE_SIZE = 1000
+# report fields of the report info
+_INFO_FIELDS = ["_id", DF.STATUS, DF.START_TIME, DF.STOP_TIME, DF.SUMMARY]
+
 
 @dataclass
 class ReportInfo:
@@ -31,14 +50,20 @@ class ReportInfo:
 
 
 class CouchdbReader:
-    """CouchDB report info reader."""
+    """CouchDB report info reader.
+
+    Report queries use the Mango indexes of the report start time, stop time,
+    status and DUT serial number. The indexes are created by the first query
+    in the `_design/hardpy_report` design document. Query results are read
+    by pages with the bookmark of the previous page.
+    """
 
     def __init__(self, config: CouchdbConfig) -> None:
         self._log = getLogger(__name__)
         self._config = config
-        self._db_srv = DbServer(config.connection_string)
+        self._db_srv = CouchdbConnectionManager().get_server(config.connection_string)
         self._db: Database = self._init_db()
-        self._doc_id = "doc"
+        self._is_indexed = False
 
     def get_report_total_count(self) -> int:
         """Get the total number of reports in the database.
@@ -46,7 +71,12 @@ class CouchdbReader:
         Returns:
             int: total number of reports
         """
-        return sum(1 for _ in self._db.all())
+        _, result = self._db.resource.get("_all_docs", params={"limit": 0})
+        _, design_docs = self._db.resource.get(
+            "_all_docs",
+            params={"startkey": '"_design/"', "endkey": '"_design0"'},
+        )
+        return result["total_rows"] - len(design_docs["rows"])
 
     def get_report_count_in_timeframe(self, start_time: int, end_time: int) -> int:
         """Get the number of reports in the database within the specified timeframe.
@@ -61,19 +91,31 @@ class CouchdbReader:
         Returns:
             int: number of reports
         """
-        if start_time < 0 or end_time < 0:
-            msg = "Start time and end time must be positive values"
-            raise ValueError(msg)
-        return sum(
-            1
-            for report in self._db.all()
-            if self._is_in_timeframe(
-                self._get_start_time_from_db(report[self._doc_id]),  # type: ignore
-                self._get_stop_time_from_db(report[self._doc_id]),  # type: ignore
-                start_time,
-                end_time,
-            )
-        )
+        return self.get_report_count(start_time=start_time, end_time=end_time)
+
+    def get_report_count(
+        self,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        status: str | None = None,
+        serial_number: str | None = None,
+    ) -> int:
+        """Get the number of reports matching all the given conditions.
+
+        Args:
+            start_time (int | None): minimum report start time
+            end_time (int | None): maximum report stop time
+            status (str | None): report status
+            serial_number (str | None): DUT serial number
+
+        Raises:
+            ValueError: if start time or end time is negative
+
+        Returns:
+            int: number of reports
+        """
+        selector = self._get_selector(start_time, end_time, status, serial_number)
+        return sum(1 for _ in self._find(selector, fields=["_id"]))
 
     def get_report_status(self, report_name: str) -> str:
         """Get the status of a report by its name.
@@ -96,12 +138,7 @@ class CouchdbReader:
         Returns:
             List[ReportInfo]: list of report information
         """
-        reports_info = []
-        reports = self._db.all()
-        for report in reports:
-            report_info = self._get_single_report_info(report)
-            reports_info.append(report_info)
-        return reports_info
+        return list(self.iter_report_infos())
 
     def get_report_infos_in_timeframe(
         self,
@@ -120,19 +157,83 @@ class CouchdbReader:
         Returns:
             List[ReportInfo]: list of report information
         """
-        if start_time < 0 or end_time < 0:
-            msg = "Start time and end time must be positive values"
-            raise ValueError(msg)
+        return list(self.iter_report_infos(start_time=start_time, end_time=end_time))
+
+    def iter_reports(  # noqa: PLR0913
+        self,
+        *,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        status: str | None = None,
+        serial_number: str | None = None,
+        fields: list[str] | None = None,
+        page_size: int = _PAGE_SIZE,
+    ) -> Iterator[dict]:
+        """Iterate over report documents matching all the given conditions.
+
+        Reports are requested by pages, so only one page is kept in memory.
 
-        reports_info = []
-        reports = self._db.all()
-        for report in reports:
-            start_t_db = self._get_start_time_from_db(report[self._doc_id])
-            stop_t_db = self._get_stop_time_from_db(report[self._doc_id])
-            if self._is_in_timeframe(start_t_db, stop_t_db, start_time, end_time):  # type: ignore
-                report_info = self._get_single_report_info(report)
-                reports_info.append(report_info)
-        return reports_info
+        Args:
+            start_time (int | None): minimum report start time
+            end_time (int | None): maximum report stop time
+            status (str | None): report status
+            serial_number (str | None): DUT serial number
+            fields (list[str] | None): requested document fields,
+                nested fields are separated by dots, all fields if None
+            page_size (int): number of reports requested by one query
+
+        Raises:
+            ValueError: if start time or end time is negative
+
+        Yields:
+            dict: report document
+        """
+        selector = self._get_selector(start_time, end_time, status, serial_number)
+        yield from self._find(selector, fields=fields, page_size=page_size)
+
+    def iter_report_infos(  # noqa: PLR0913
+        self,
+        *,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        status: str | None = None,
+        serial_number: str | None = None,
+        failed_case: bool = True,
+        page_size: int = _PAGE_SIZE,
+    ) -> Iterator[ReportInfo]:
+        """Iterate over information about reports matching all the given conditions.
+
+        Reports are requested by pages, so only one page is kept in memory.
+
+        Args:
+            start_time (int | None): minimum report start time
+            end_time (int | None): maximum report stop time
+            status (str | None): report status
+            serial_number (str | None): DUT serial number
+            failed_case (bool): get the first failed test case of the reports
+                without the summary, if False, the failed test case of these
+                reports is None
+            page_size (int): number of reports requested by one query
+
+        Raises:
+            ValueError: if start time or end time is negative
+
+        Yields:
+            ReportInfo: report information
+        """
+        reports = self.iter_reports(
+            start_time=start_time,
+            end_time=end_time,
+            status=status,
+            serial_number=serial_number,
+            fields=_INFO_FIELDS,
+            page_size=page_size,
+        )
+        for report_doc in reports:
+            if DF.SUMMARY not in report_doc and failed_case:
+                # the reports saved before the summary was added
+                report_doc = self._db.get(report_doc["_id"])  # noqa: PLW2901
+            yield self._get_single_report_info(report_doc)
 
     def _init_db(self) -> Database:
         try:
@@ -142,21 +243,88 @@ class CouchdbReader:
             msg = "Error initializing database"
             raise RuntimeError(msg) from exc
 
+    def _init_indexes(self) -> None:
+        for name, fields in _INDEXES.items():
+            index = {
+                "index": {"fields": fields},
+                "ddoc": _INDEX_DESIGN_DOC,
+                "name": name,
+                "type": "json",
+            }
+            try:
+                self._db.resource.post("_index", data=json.dumps(index).encode("utf-8"))
+            except GenericError as exc:
+                # queries work without indexes, but read all reports
+                self._log.warning(f"Report index {name} is not created: {exc}")
+        self._is_indexed = True
+
+    def _get_selector(
+        self,
+        start_time: int | None,
+        end_time: int | None,
+        status: str | None,
+        serial_number: str | None,
+    ) -> dict:
+        if (start_time is not None and start_time < 0) or (
+            end_time is not None and end_time < 0
+        ):
+            msg = "Start time and end time must be positive values"
+            raise ValueError(msg)
+        selector: dict = {}
+        if start_time is not None:
+            selector[DF.START_TIME] = {"$gte": start_time}
+        if end_time is not None:
+            selector[DF.STOP_TIME] = {"$lte": end_time}
+        if status is not None:
+            selector[DF.STATUS] = status
+        if serial_number is not None:
+            selector[_SERIAL_NUMBER_FIELD] = serial_number
+        if not selector:
+            selector["_id"] = {"$gt": None}
+        return selector
+
+    def _find(
+        self,
+        selector: dict,
+        fields: list[str] | None = None,
+        page_size: int = _PAGE_SIZE,
+    ) -> Iterator[dict]:
+        if not self._is_indexed:
+            self._init_indexes()
+        query: dict = {"selector": selector, "limit": page_size}
+        if fields is not None:
+            query["fields"] = fields
+        while True:
+            _, result = self._db.resource.post(
+                "_find",
+                data=json.dumps(query).encode("utf-8"),
+            )
+            docs = result["docs"]
+            for doc in docs:
+                if not doc["_id"].startswith("_design/"):
+                    yield doc
+            if len(docs) < page_size:
+                return
+            # the next page starts after the bookmark of the last page
+            query["bookmark"] = result["bookmark"]
+
     def _get_start_time_from_db(self, doc: dict) -> str:
         return doc[DF.START_TIME]
 
     def _get_stop_time_from_db(self, doc: dict) -> str:
         return doc[DF.STOP_TIME]
 
-    def _get_single_report_info(self, report: dict) -> ReportInfo:
+    def _get_single_report_info(self, report_doc: dict) -> ReportInfo:
         first_failed_test_name = None
         first_failed_test_id = None
-        report_doc = report[self._doc_id]
-        for module_info in report_doc[DF.MODULES].values():
-            for case_name, case_info in module_info[DF.CASES].items():
-                if case_info[DF.STATUS] == TestStatus.FAILED:
-                    first_failed_test_name = case_info[DF.NAME]
-                    first_failed_test_id = case_name
+        summary = report_doc.get(DF.SUMMARY)
+        if summary is not None:
+            first_failed_test_name = summary[DF.FIRST_FAILED_CASE_NAME]
+            first_failed_test_id = summary[DF.FIRST_FAILED_CASE_ID]
+        else:
+            first_failed_test_name, first_failed_test_id = self._find_failed_case(
+                report_doc.get(DF.MODULES, {}),
+            )
         return ReportInfo(
             name=report_doc["_id"],
             status=report_doc[DF.STATUS],
@@ -166,11 +334,9 @@ class CouchdbReader:
             first_failed_test_id=first_failed_test_id,
         )
 
-    def _is_in_timeframe(
-        self,
-        start: int,
-        end: int,
-        timeframe_start: int,
-        timeframe_end: int,
-    ) -> bool:
-        return timeframe_start <= start and end <= timeframe_end
+    def _find_failed_case(self, modules: dict) -> tuple[str | None, str | None]:
+        for module_info in modules.values():
+            for case_name, case_info in module_info[DF.CASES].items():
+                if case_info[DF.STATUS] == TestStatus.FAILED:
+                    return case_info[DF.NAME], case_name
+        return None, None
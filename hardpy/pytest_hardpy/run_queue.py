@@ -0,0 +1,163 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from time import monotonic
+from uuid import uuid4
+
+# number of the finished runs stored for the run statistics
+_RUN_HISTORY_SIZE = 100
+
+
+@dataclass
+class RunInfo:
+    """Test run of the run queue.
+
+    Args:
+        start_args (dict): start arguments
+        slot (str | None): DUT slot, any free slot if None
+    """
+
+    start_args: dict
+    slot: str | None = None
+    run_id: str = field(default_factory=lambda: uuid4().hex)
+    enqueue_time: float = field(default_factory=monotonic)
+    start_time: float | None = None
+    stop_time: float | None = None
+    exit_code: int | None = None
+
+    @property
+    def status(self) -> str:
+        """Get run status.
+
+        Returns:
+            str: `queued`, `running` or `finished`
+        """
+        if self.start_time is None:
+            return "queued"
+        if self.stop_time is None:
+            return "running"
+        return "finished"
+
+    def to_dict(self) -> dict:
+        """Get run info with the waiting and execution times.
+
+        Returns:
+            dict: run info, times are in seconds
+        """
+        now = monotonic()
+        start_time = now if self.start_time is None else self.start_time
+        exec_time = None
+        if self.start_time is not None:
+            stop_time = now if self.stop_time is None else self.stop_time
+            exec_time = round(stop_time - self.start_time, 3)
+        return {
+            "run_id": self.run_id,
+            "status": self.status,
+            "slot": self.slot,
+            "start_args": self.start_args,
+            "wait_time": round(start_time - self.enqueue_time, 3),
+            "exec_time": exec_time,
+            "exit_code": self.exit_code,
+        }
+
+
+class RunQueue:
+    """Queue of the test runs.
+
+    The queued runs are started in the queue order. The run without
+    the DUT slot is started in the first free slot, the run with the DUT slot
+    waits for this slot. The queue stores the statistics of the last runs.
+    """
+
+    def __init__(self) -> None:
+        self._queue: deque[RunInfo] = deque()
+        self._history: deque[RunInfo] = deque(maxlen=_RUN_HISTORY_SIZE)
+
+    @property
+    def depth(self) -> int:
+        """Get number of the queued runs.
+
+        Returns:
+            int: queue depth
+        """
+        return len(self._queue)
+
+    def add(self, start_args: dict | None = None, slot: str | None = None) -> RunInfo:
+        """Add run to the queue.
+
+        Args:
+            start_args (dict | None): start arguments
+            slot (str | None): DUT slot, any free slot if None
+
+        Returns:
+            RunInfo: queued run
+        """
+        run = RunInfo(start_args=start_args or {}, slot=slot)
+        self._queue.append(run)
+        return run
+
+    def pop_next(self, free_slots: list[str | None]) -> RunInfo | None:
+        """Get the next run that can be started in the free slots.
+
+        Args:
+            free_slots (list[str | None]): free DUT slots
+
+        Returns:
+            RunInfo | None: run with the DUT slot to start, or None if there is no run
+        """
+        for run in self._queue:
+            if run.slot is None and free_slots:
+                run.slot = free_slots[0]
+            elif run.slot not in free_slots:
+                continue
+            self._queue.remove(run)
+            return run
+        return None
+
+    def start(self, run: RunInfo) -> None:
+        """Mark run as started.
+
+        Args:
+            run (RunInfo): started run
+        """
+        run.start_time = monotonic()
+        self._history.append(run)
+
+    def finish(self, run: RunInfo, exit_code: int | None) -> None:
+        """Mark run as finished.
+
+        Args:
+            run (RunInfo): finished run
+            exit_code (int | None): pytest exit code
+        """
+        run.stop_time = monotonic()
+        run.exit_code = exit_code
+
+    def clear(self, slot: str | None = None) -> int:
+        """Remove runs from the queue.
+
+        Args:
+            slot (str | None): DUT slot, all runs if None
+
+        Returns:
+            int: number of removed runs
+        """
+        runs = [run for run in self._queue if slot is None or run.slot == slot]
+        for run in runs:
+            self._queue.remove(run)
+        return len(runs)
+
+    def get_info(self) -> dict:
+        """Get queued runs and statistics of the last runs.
+
+        Returns:
+            dict: queue depth, queued runs and last runs
+        """
+        return {
+            "queue_depth": self.depth,
+            "queue": [run.to_dict() for run in self._queue],
+            "runs": [run.to_dict() for run in self._history],
+        }
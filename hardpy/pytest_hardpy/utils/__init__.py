@@ -1,7 +1,9 @@
 # Copyright (c) 2024 Everypin
 # GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
 
+from hardpy.pytest_hardpy.utils.collection_cache import CollectionCache
 from hardpy.pytest_hardpy.utils.const import (
+    ChartDecimation,
     ChartType,
     ComparisonOperation,
     Group,
@@ -23,17 +25,21 @@ from hardpy.pytest_hardpy.utils.dialog_box import (
 from hardpy.pytest_hardpy.utils.exception import (
     DuplicateParameterError,
     ImageError,
+    InstrumentLockTimeoutError,
     TestStandNumberError,
     WidgetInfoError,
 )
+from hardpy.pytest_hardpy.utils.instrument_lock import InstrumentLock
 from hardpy.pytest_hardpy.utils.machineid import machine_id
 from hardpy.pytest_hardpy.utils.node_info import NodeInfo
 from hardpy.pytest_hardpy.utils.progress_calculator import ProgressCalculator
 
 __all__ = [
     "BaseWidget",
+    "ChartDecimation",
     "ChartType",
     "CheckboxWidget",
+    "CollectionCache",
     "ComparisonOperation",
     "DialogBox",
     "DuplicateParameterError",
@@ -41,6 +47,8 @@ __all__ = [
     "HTMLComponent",
     "ImageComponent",
     "ImageError",
+    "InstrumentLock",
+    "InstrumentLockTimeoutError",
     "MeasurementType",
     "MultistepWidget",
     "NodeInfo",
@@ -0,0 +1,136 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from hardpy.pytest_hardpy.utils.const import ChartDecimation
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is the optional dependency
+    np = None
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# minimum number of the decimated points, the first and the last points are kept
+_MIN_POINTS = 3
+
+
+def to_series(data: Sequence[float]) -> Sequence[float]:
+    """Convert NumPy array of the chart data series to a list.
+
+    Args:
+        data (Sequence[float]): data series or NumPy array
+
+    Returns:
+        Sequence[float]: data series, the other data is not changed
+
+    Raises:
+        ValueError: if the NumPy array is not numeric
+    """
+    if np is None or not isinstance(data, np.ndarray):
+        return data
+    if data.dtype == np.bool_ or not np.issubdtype(data.dtype, np.number):
+        msg = f"Chart data must be int or float, got {data.dtype} array"
+        raise ValueError(msg)
+    return data.ravel().tolist()
+
+
+def decimate(
+    x_data: list[float],
+    y_data: list[float],
+    max_points: int,
+    method: ChartDecimation = ChartDecimation.LTTB,
+) -> tuple[list[float], list[float]]:
+    """Decimate chart data series to the maximum number of points.
+
+    The series with the maximum number of points or less is not changed.
+    The points are selected by the NumPy arrays if NumPy is installed.
+
+    Args:
+        x_data (list[float]): X data sorted in ascending order
+        y_data (list[float]): Y data
+        max_points (int): maximum number of points
+        method (ChartDecimation): decimation method
+
+    Returns:
+        tuple[list[float], list[float]]: decimated X and Y data
+    """
+    if len(x_data) <= max(max_points, _MIN_POINTS):
+        return x_data, y_data
+    if ChartDecimation(method) == ChartDecimation.MIN_MAX:
+        indices = _min_max_indices(y_data, max_points)
+    else:
+        indices = _lttb_indices(x_data, y_data, max_points)
+    return [x_data[i] for i in indices], [y_data[i] for i in indices]
+
+
+def _get_bucket_bounds(size: int, bucket_count: int) -> list[int]:
+    # buckets of the points between the first and the last points
+    step = (size - 2) / bucket_count
+    return [int(i * step) + 1 for i in range(bucket_count)] + [size - 1]
+
+
+def _lttb_indices(
+    x_data: list[float],
+    y_data: list[float],
+    max_points: int,
+) -> list[int]:
+    bounds = _get_bucket_bounds(len(x_data), max(max_points, _MIN_POINTS) - 2)
+    if np is not None:
+        x = np.asarray(x_data, dtype=float)
+        y = np.asarray(y_data, dtype=float)
+    else:
+        x = x_data
+        y = y_data
+    indices = [0]
+    last = 0
+    for bucket in range(len(bounds) - 1):
+        start, stop = bounds[bucket], bounds[bucket + 1]
+        # the average point of the next bucket, the last point for the last bucket
+        next_start = stop
+        next_stop = bounds[bucket + 2] if bucket + 2 < len(bounds) else len(x_data)
+        if np is not None:
+            avg_x = x[next_start:next_stop].mean()
+            avg_y = y[next_start:next_stop].mean()
+            areas = np.abs(
+                (x[last] - avg_x) * (y[start:stop] - y[last])
+                - (x[last] - x[start:stop]) * (avg_y - y[last]),
+            )
+            last = start + int(areas.argmax())
+        else:
+            count = next_stop - next_start
+            avg_x = sum(x[next_start:next_stop]) / count
+            avg_y = sum(y[next_start:next_stop]) / count
+            last = max(
+                range(start, stop),
+                key=lambda i, a=last, ax=avg_x, ay=avg_y: abs(
+                    (x[a] - ax) * (y[i] - y[a]) - (x[a] - x[i]) * (ay - y[a]),
+                ),
+            )
+        indices.append(last)
+    indices.append(len(x_data) - 1)
+    return indices
+
+
+def _min_max_indices(y_data: list[float], max_points: int) -> list[int]:
+    bounds = _get_bucket_bounds(len(y_data), max((max_points - 2) // 2, 1))
+    y = np.asarray(y_data, dtype=float) if np is not None else y_data
+    indices = [0]
+    for bucket in range(len(bounds) - 1):
+        start, stop = bounds[bucket], bounds[bucket + 1]
+        if start == stop:
+            continue
+        if np is not None:
+            min_index = start + int(y[start:stop].argmin())
+            max_index = start + int(y[start:stop].argmax())
+        else:
+            bucket_range = range(start, stop)
+            min_index = min(bucket_range, key=y.__getitem__)
+            max_index = max(bucket_range, key=y.__getitem__)
+        # the points keep the order of the series
+        indices.extend(sorted({min_index, max_index}))
+    indices.append(len(y_data) - 1)
+    return indices
@@ -0,0 +1,118 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import json
+import os
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+from logging import getLogger
+from pathlib import Path
+
+from hardpy.pytest_hardpy.utils.machineid import machine_id
+
+# configuration files that affect the test collection
+_CONFIG_FILES = frozenset(
+    {"hardpy.toml", "pytest.ini", "pyproject.toml", "tox.ini", "setup.cfg"},
+)
+
+
+class CollectionCache:
+    """Cache of the collected test tree.
+
+    The statestore document after the test collection is stored in
+    the `.hardpy/collection_cache.json` file of the tests directory together
+    with the fingerprint of the collection inputs. The fingerprint contains
+    the modification times and sizes of the python files, including test files
+    and `conftest.py`, and of the configuration files, such as `pytest.ini`
+    and `hardpy.toml`. The cached document is valid until the fingerprint changes.
+
+    The fingerprint is calculated when the cache object is created,
+    so the cache must be created before the test collection.
+
+    Each DUT slot has its own cache file, so the slots collected
+    at the same time do not write the same file.
+
+    Args:
+        tests_path (Path): tests directory
+        slot (str | None): DUT slot
+    """
+
+    def __init__(self, tests_path: Path, slot: str | None = None) -> None:
+        self._log = getLogger(__name__)
+        self._tests_path = tests_path
+        file_name = f"collection_cache_{slot}.json" if slot else "collection_cache.json"
+        self._cache_path = tests_path / ".hardpy" / file_name
+        self._fingerprint = self._calculate_fingerprint()
+
+    @property
+    def fingerprint(self) -> str:
+        """Get fingerprint of the collection inputs.
+
+        Returns:
+            str: fingerprint
+        """
+        return self._fingerprint
+
+    def load(self) -> dict | None:
+        """Load the cached statestore document.
+
+        Returns:
+            dict | None: statestore document fields, or None if the cache
+                is missing or outdated
+        """
+        try:
+            cache = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if cache.get("fingerprint") != self._fingerprint:
+            return None
+        return cache.get("doc")
+
+    def save(self, doc: dict) -> None:
+        """Save the statestore document after the test collection.
+
+        Args:
+            doc (dict): statestore document fields
+        """
+        cache = {"fingerprint": self._fingerprint, "doc": doc}
+        tmp_path = self._cache_path.with_suffix(".tmp")
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+            tmp_path.replace(self._cache_path)
+        except OSError as exc:
+            self._log.warning(f"Collection cache is not saved: {exc}")
+
+    def _calculate_fingerprint(self) -> str:
+        try:
+            hardpy_version = version("hardpy")
+        except PackageNotFoundError:
+            hardpy_version = ""
+        fingerprint = sha256(f"{hardpy_version}:{machine_id()}".encode())
+        for path, mtime, size in sorted(self._get_input_files()):
+            fingerprint.update(f"\n{path}:{mtime}:{size}".encode())
+        return fingerprint.hexdigest()
+
+    def _get_input_files(self) -> list[tuple[str, int, int]]:
+        files = []
+        for root, dir_names, file_names in os.walk(self._tests_path):
+            root_path = Path(root)
+            # hidden directories, caches and virtual environments are skipped
+            dir_names[:] = [
+                name
+                for name in dir_names
+                if not name.startswith((".", "__pycache__"))
+                and not (root_path / name / "pyvenv.cfg").exists()
+            ]
+            for name in file_names:
+                if not name.endswith(".py") and name not in _CONFIG_FILES:
+                    continue
+                path = root_path / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                rel_path = path.relative_to(self._tests_path).as_posix()
+                files.append((rel_path, stat.st_mtime_ns, stat.st_size))
+        return files
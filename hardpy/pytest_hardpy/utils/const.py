@@ -89,3 +89,13 @@ class ChartType(str, Enum):
     LINE_LOG_X = "line_log_x"
     LINE_LOG_Y = "line_log_y"
     LOG_X_Y = "log_x_y"
+
+
+class ChartDecimation(str, Enum):
+    """Chart data decimation method."""
+
+    LTTB = "lttb"
+    """Largest triangle three buckets"""
+
+    MIN_MAX = "min_max"
+    """Minimum and maximum points of each bucket"""
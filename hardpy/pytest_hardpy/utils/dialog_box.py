@@ -8,11 +8,16 @@ from ast import literal_eval
 from copy import deepcopy
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Final
 from uuid import uuid4
 
 from hardpy.pytest_hardpy.utils.exception import ImageError, WidgetInfoError
 
+# maximum number of the encoded images kept in memory
+_IMAGE_CACHE_SIZE = 64
+
 
 class WidgetType(Enum):
     """Dialog box widget type."""
@@ -260,7 +265,11 @@ class MultistepWidget(IWidget):
 
 
 class ImageComponent:
-    """Image component."""
+    """Image component.
+
+    The encoded images are cached by the file path, modification time
+    and size, so the same image file is read and encoded once.
+    """
 
     def __init__(
         self,
@@ -287,15 +296,16 @@ class ImageComponent:
             raise WidgetInfoError(msg)
 
         try:
-            with open(address, "rb") as file:  # noqa: PTH123
-                file_data = file.read()
+            path = Path(address).resolve()
+            stat = path.stat()
+            image_base64 = _encode_image(path, stat.st_mtime_ns, stat.st_size)
         except FileNotFoundError as exc:
             msg = "The image address is invalid"
             raise ImageError(msg) from exc
         self.address = address
         self.width = width
         self.border = border
-        self.base64 = base64.b64encode(file_data).decode("utf-8")
+        self.base64 = image_base64
 
     def to_dict(self) -> dict:
         """Convert ImageComponent to dictionary.
@@ -311,6 +321,12 @@ class ImageComponent:
         }
 
 
+@lru_cache(maxsize=_IMAGE_CACHE_SIZE)
+def _encode_image(path: Path, mtime_ns: int, size: int) -> str:  # noqa: ARG001
+    # the modification time and size are the cache key of the changed file
+    return base64.b64encode(path.read_bytes()).decode("utf-8")
+
+
 class HTMLComponent:
     """HTML component."""
 
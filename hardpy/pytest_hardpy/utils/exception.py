@@ -38,3 +38,10 @@ class ImageError(HardpyError):
 
     def __init__(self, message: str) -> None:
         super().__init__(message)
+
+
+class InstrumentLockTimeoutError(HardpyError):
+    """The instrument lock is not acquired within the timeout."""
+
+    def __init__(self, key: str, timeout: float | None) -> None:
+        super().__init__(f"Instrument {key} is not released within {timeout} seconds")
@@ -0,0 +1,154 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import re
+import sys
+from dataclasses import dataclass, field
+from threading import Lock, RLock
+from time import monotonic, sleep
+from typing import IO, TYPE_CHECKING
+
+from hardpy.pytest_hardpy.utils.exception import InstrumentLockTimeoutError
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+# polling interval of the busy lock file in seconds
+_POLL_INTERVAL = 0.01
+
+
+@dataclass
+class _LockState:
+    thread_lock: RLock = field(default_factory=RLock)
+    depth: int = 0
+    file: IO[bytes] | None = None
+
+
+# lock states of the current process by the lock key
+_lock_states: dict[str, _LockState] = {}
+_lock_states_lock = Lock()
+
+
+class InstrumentLock:
+    """Lock of the shared test stand instrument.
+
+    The lock excludes the simultaneous use of the instrument by tests
+    of different DUT slots, pytest processes and threads of the test stand.
+    The lock is the `<key>.lock` file of the lock directory locked
+    by the operating system, so the lock is released when
+    the pytest process is stopped.
+
+    The lock is reentrant in the thread that owns it.
+
+    Args:
+        lock_dir (Path): lock file directory
+        name (str): instrument name
+        number (int | None): instrument number
+    """
+
+    def __init__(self, lock_dir: Path, name: str, number: int | None = None) -> None:
+        self._key = name if number is None else f"{name}_{number}"
+        file_name = re.sub(r"[^\w.-]", "_", self._key)
+        self._path = lock_dir / f"{file_name}.lock"
+        with _lock_states_lock:
+            self._state = _lock_states.setdefault(self._key, _LockState())
+
+    @property
+    def key(self) -> str:
+        """Get lock key.
+
+        Returns:
+            str: instrument name with the instrument number
+        """
+        return self._key
+
+    def acquire(self, timeout: float | None = None) -> float:
+        """Acquire the instrument lock.
+
+        Args:
+            timeout (float | None): maximum waiting time in seconds,
+                if None, wait until the lock is acquired
+
+        Returns:
+            float: waiting time in seconds
+
+        Raises:
+            InstrumentLockTimeoutError: if the lock is not acquired within the timeout
+        """
+        start_time = monotonic()
+        deadline = None if timeout is None else start_time + timeout
+        state = self._state
+        if not state.thread_lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise InstrumentLockTimeoutError(self._key, timeout)
+        if state.depth == 0:
+            try:
+                state.file = self._lock_file(deadline)
+            except BaseException:
+                state.thread_lock.release()
+                raise
+            if state.file is None:
+                state.thread_lock.release()
+                raise InstrumentLockTimeoutError(self._key, timeout)
+        state.depth += 1
+        return monotonic() - start_time
+
+    def release(self) -> None:
+        """Release the instrument lock."""
+        state = self._state
+        state.depth -= 1
+        if state.depth == 0 and state.file is not None:
+            self._unlock_file(state.file)
+            state.file = None
+        state.thread_lock.release()
+
+    def __enter__(self) -> Self:
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.release()
+
+    def _lock_file(self, deadline: float | None) -> IO[bytes] | None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        file = self._path.open("a+b")
+        while not self._try_lock(file):
+            if deadline is not None and monotonic() >= deadline:
+                file.close()
+                return None
+            sleep(_POLL_INTERVAL)
+        return file
+
+    def _try_lock(self, file: IO[bytes]) -> bool:
+        try:
+            if sys.platform == "win32":
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+    def _unlock_file(self, file: IO[bytes]) -> None:
+        try:
+            if sys.platform == "win32":
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        finally:
+            file.close()
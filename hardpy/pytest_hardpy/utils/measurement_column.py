@@ -0,0 +1,397 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import sys
+import zlib
+from array import array
+from base64 import b64decode, b64encode
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from hardpy.pytest_hardpy.utils.const import ComparisonOperation as CompOp
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is the optional dependency
+    np = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+# key of the packed values of the measurement series
+VALUES_KEY = "values"
+# key of the packed results of the measurement series
+RESULTS_KEY = "results"
+# array type codes of the integer and float values and the results
+_INT_DTYPE = "q"
+_FLOAT_DTYPE = "d"
+_RESULT_DTYPE = "B"
+# little-endian NumPy types of the array type codes
+_NUMPY_DTYPES = {_INT_DTYPE: "<i8", _FLOAT_DTYPE: "<f8", _RESULT_DTYPE: "u1"}
+# zlib level of the packed values, the higher levels are slower
+# and do not compress the float values much better
+_COMPRESS_LEVEL = 1
+# operations with the comparison value
+_COMPARISON_OPERATIONS = frozenset(
+    {CompOp.EQ, CompOp.NE, CompOp.GT, CompOp.LT, CompOp.GE, CompOp.LE},
+)
+# operations with the lower and upper limits
+_RANGE_OPERATIONS = frozenset(
+    {
+        CompOp.GTLT,
+        CompOp.GELE,
+        CompOp.GELT,
+        CompOp.GTLE,
+        CompOp.LTGT,
+        CompOp.LEGE,
+        CompOp.LEGT,
+        CompOp.LTGE,
+    },
+)
+# conditions of the operations, the bitwise operators
+# evaluate both the single values and the NumPy arrays
+_CONDITIONS: dict[CompOp, Callable] = {
+    CompOp.EQ: lambda v, cv, _lo, _hi: v == cv,
+    CompOp.NE: lambda v, cv, _lo, _hi: v != cv,
+    CompOp.GT: lambda v, cv, _lo, _hi: v > cv,
+    CompOp.LT: lambda v, cv, _lo, _hi: v < cv,
+    CompOp.GE: lambda v, cv, _lo, _hi: v >= cv,
+    CompOp.LE: lambda v, cv, _lo, _hi: v <= cv,
+    CompOp.GTLT: lambda v, _cv, lo, hi: (v > lo) & (v < hi),
+    CompOp.GELE: lambda v, _cv, lo, hi: (v >= lo) & (v <= hi),
+    CompOp.GELT: lambda v, _cv, lo, hi: (v >= lo) & (v < hi),
+    CompOp.GTLE: lambda v, _cv, lo, hi: (v > lo) & (v <= hi),
+    CompOp.LTGT: lambda v, _cv, lo, hi: (v < lo) | (v > hi),
+    CompOp.LEGE: lambda v, _cv, lo, hi: (v <= lo) | (v >= hi),
+    CompOp.LEGT: lambda v, _cv, lo, hi: (v <= lo) | (v > hi),
+    CompOp.LTGE: lambda v, _cv, lo, hi: (v < lo) | (v >= hi),
+}
+
+
+def check_operation_requirements(
+    operation: CompOp | None,
+    comparison_value: float | None,
+    lower_limit: float | None,
+    upper_limit: float | None,
+) -> None:
+    """Check numeric measurement fields required by the operation.
+
+    Args:
+        operation (CompOp | None): comparison operation
+        comparison_value (float | None): value to compare against
+        lower_limit (float | None): lower limit for range operations
+        upper_limit (float | None): upper limit for range operations
+
+    Raises:
+        ValueError: if the required field is not set
+    """
+    if operation in _COMPARISON_OPERATIONS and comparison_value is None:
+        msg = f"Comparison_value required for {operation} operation"
+        raise ValueError(msg)
+    if operation in _RANGE_OPERATIONS and (lower_limit is None or upper_limit is None):
+        msg = "lower_limit and upper_limit required for range operations"
+        raise ValueError(msg)
+
+
+def check_condition(
+    value: float,
+    operation: CompOp | None,
+    comparison_value: float | None,
+    lower_limit: float | None,
+    upper_limit: float | None,
+) -> bool:
+    """Evaluate the numeric measurement value based on the operation.
+
+    Args:
+        value (float): measurement value
+        operation (CompOp | None): comparison operation
+        comparison_value (float | None): value to compare against
+        lower_limit (float | None): lower limit for range operations
+        upper_limit (float | None): upper limit for range operations
+
+    Returns:
+        bool: measurement result
+    """
+    condition = _CONDITIONS.get(operation)
+    if condition is None:
+        return False
+    return bool(condition(value, comparison_value, lower_limit, upper_limit))
+
+
+def check_conditions(
+    values: Sequence[float],
+    operation: CompOp | None,
+    comparison_value: float | None,
+    lower_limit: float | None,
+    upper_limit: float | None,
+) -> Sequence[bool]:
+    """Evaluate the numeric measurement values based on the operation.
+
+    The NumPy array values are compared in one pass over the array.
+
+    Args:
+        values (Sequence[float]): measurement values or NumPy array
+        operation (CompOp | None): comparison operation
+        comparison_value (float | None): value to compare against
+        lower_limit (float | None): lower limit for range operations
+        upper_limit (float | None): upper limit for range operations
+
+    Returns:
+        Sequence[bool]: measurement results, the NumPy array for the NumPy array values
+    """
+    condition = _CONDITIONS.get(operation)
+    if np is not None and isinstance(values, np.ndarray):
+        if condition is None:
+            return np.zeros(len(values), dtype=bool)
+        results = condition(values, comparison_value, lower_limit, upper_limit)
+        return np.asarray(results, dtype=bool)
+    if condition is None:
+        return [False] * len(values)
+    return [
+        bool(condition(value, comparison_value, lower_limit, upper_limit))
+        for value in values
+    ]
+
+
+def to_values(values: Iterable[float]) -> Sequence[float]:
+    """Get numeric measurement values as a column.
+
+    The values are the NumPy array of 64-bit integers or floats
+    if NumPy is installed, otherwise the list.
+
+    Args:
+        values (Iterable[float]): measurement values or NumPy array
+
+    Returns:
+        Sequence[float]: measurement values
+
+    Raises:
+        ValueError: if any value is not a number
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        if values.dtype.kind not in "iuf":
+            msg = f"Measurement values must be int or float, got {values.dtype} array"
+            raise ValueError(msg)
+        return _to_array(values.ravel())
+    values = list(values)
+    for value in values:
+        if isinstance(value, bool) or not isinstance(value, int | float):
+            msg = f"Measurement value must be int or float, got {value!r}"
+            raise ValueError(msg)  # noqa: TRY004
+    if np is None:
+        return values
+    return _to_array(values)
+
+
+def join_values(columns: Iterable[Sequence]) -> Sequence:
+    """Join the measurement values or results columns.
+
+    Args:
+        columns (Iterable[Sequence]): columns of the `to_values` or
+            `check_conditions` functions
+
+    Returns:
+        Sequence: joined column
+    """
+    columns = [column for column in columns if len(column)]
+    if np is None:
+        return list(chain.from_iterable(columns))
+    if not columns:
+        return np.empty(0)
+    return np.concatenate(columns)
+
+
+def to_list(column: Sequence) -> list:
+    """Get values of the column as a list.
+
+    Args:
+        column (Sequence): list or NumPy array
+
+    Returns:
+        list: column values
+    """
+    if np is not None and isinstance(column, np.ndarray):
+        return column.tolist()
+    return list(column)
+
+
+def all_results(results: Sequence[bool]) -> bool:
+    """Check that all measurement results pass.
+
+    Args:
+        results (Sequence[bool]): list or NumPy array of the results
+
+    Returns:
+        bool: True if all results pass
+    """
+    if np is not None and isinstance(results, np.ndarray):
+        return bool(results.all())
+    return all(results)
+
+
+def pack_column(values: Iterable[float], dtype: str | None = None) -> dict:
+    """Pack numeric values to the compressed bytes.
+
+    Integer values are packed as 64-bit integers, other values
+    as 64-bit floats in the little-endian byte order.
+    The NumPy arrays are packed without the conversion to Python objects.
+    The packed bytes are compressed by zlib.
+
+    Args:
+        values (Iterable[float]): numeric values or NumPy array
+        dtype (str | None): array type code, selected by the values if None
+
+    Returns:
+        dict: column with the `dtype`, `count` and `data` bytes keys
+    """
+    if np is None or not isinstance(values, np.ndarray):
+        values = list(values)
+    if dtype is None:
+        dtype = _INT_DTYPE if _is_int_column(values) else _FLOAT_DTYPE
+    try:
+        packed = _pack(values, dtype)
+    except OverflowError:
+        dtype = _FLOAT_DTYPE
+        packed = _pack(values, dtype)
+    return {
+        "dtype": dtype,
+        "count": len(values),
+        "data": zlib.compress(packed, _COMPRESS_LEVEL),
+    }
+
+
+def unpack_column(dtype: str, data: bytes) -> list[float]:
+    """Unpack numeric values of the compressed bytes.
+
+    Args:
+        dtype (str): array type code of the values
+        data (bytes): compressed values
+
+    Returns:
+        list[float]: numeric values
+    """
+    packed = array(dtype)
+    packed.frombytes(zlib.decompress(data))
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tolist()
+
+
+def encode_column(values: Iterable[float], dtype: str | None = None) -> dict:
+    """Pack numeric values to the compact column.
+
+    The packed values are encoded to base64,
+    so the column is stored in a JSON document.
+
+    Args:
+        values (Iterable[float]): numeric values or NumPy array
+        dtype (str | None): array type code, selected by the values if None
+
+    Returns:
+        dict: column with the `dtype`, `count` and `data` keys
+    """
+    column = pack_column(values, dtype)
+    column["data"] = b64encode(column["data"]).decode("ascii")
+    return column
+
+
+def decode_column(column: dict) -> list[float]:
+    """Unpack numeric values of the column.
+
+    Args:
+        column (dict): column with the `dtype`, `count` and `data` keys
+
+    Returns:
+        list[float]: numeric values
+    """
+    return unpack_column(column["dtype"], b64decode(column["data"]))
+
+
+def encode_results(results: Sequence[bool]) -> dict:
+    """Pack measurement results to the compact column.
+
+    Args:
+        results (Sequence[bool]): measurement results or NumPy array
+
+    Returns:
+        dict: column with the `dtype`, `count` and `data` keys
+    """
+    return encode_column(results, _RESULT_DTYPE)
+
+
+def expand_measurements(measurements: list) -> list:
+    """Expand the measurement series to the single measurements.
+
+    Args:
+        measurements (list): case measurements with the measurement series
+
+    Returns:
+        list: case measurements, each series value is a single measurement
+    """
+    if not any(_is_series(measurement) for measurement in measurements):
+        return measurements
+    expanded = []
+    for measurement in measurements:
+        if not _is_series(measurement):
+            expanded.append(measurement)
+            continue
+        fields = {
+            key: value
+            for key, value in measurement.items()
+            if key not in (VALUES_KEY, RESULTS_KEY, "result") and value is not None
+        }
+        values = decode_column(measurement[VALUES_KEY])
+        if RESULTS_KEY not in measurement:
+            expanded.extend({**fields, "value": value} for value in values)
+            continue
+        # the results are checked once when the series is stored
+        results = decode_column(measurement[RESULTS_KEY])
+        expanded.extend(
+            {**fields, "value": value, "result": bool(result)}
+            for value, result in zip(values, results, strict=True)
+        )
+    return expanded
+
+
+def get_measurement_count(measurements: list) -> int:
+    """Get number of the single measurements of the case.
+
+    Args:
+        measurements (list): case measurements with the measurement series
+
+    Returns:
+        int: number of measurements, each series value is a single measurement
+    """
+    return sum(
+        measurement[VALUES_KEY]["count"] if _is_series(measurement) else 1
+        for measurement in measurements
+    )
+
+
+def _is_series(measurement: object) -> bool:
+    return isinstance(measurement, dict) and VALUES_KEY in measurement
+
+
+def _is_int_column(values: Sequence[float]) -> bool:
+    if np is not None and isinstance(values, np.ndarray):
+        return values.dtype.kind in "iu" and np.can_cast(values.dtype, np.int64)
+    return all(type(value) is int for value in values)
+
+
+def _to_array(values: Sequence[float]) -> np.ndarray:
+    # the integers out of the 64-bit range are converted to floats
+    array_values = np.asarray(values)
+    if _is_int_column(array_values):
+        return array_values.astype(np.int64, copy=False)
+    return array_values.astype(np.float64, copy=False)
+
+
+def _pack(values: Sequence[float], dtype: str) -> bytes:
+    # the values are packed in the little-endian byte order
+    if np is not None and isinstance(values, np.ndarray):
+        return values.astype(_NUMPY_DTYPES[dtype], copy=False).tobytes()
+    packed = array(dtype, values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import re
-from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple
 
+from pytest import StashKey
+
 from hardpy.pytest_hardpy.utils.const import Group
 
 if TYPE_CHECKING:
@@ -26,10 +27,19 @@ class TestDependencyInfo(NamedTuple):
 class NodeInfo:
     """Test node info."""
 
-    def __init__(self, item: Item) -> None:
-        self._item = item
-        self._log = getLogger(__name__)
+    __slots__ = (
+        "_attempt",
+        "_case_group",
+        "_case_id",
+        "_case_name",
+        "_critical",
+        "_dependency",
+        "_module_group",
+        "_module_id",
+        "_module_name",
+    )
 
+    def __init__(self, item: Item) -> None:
         self._case_name = self._get_human_name(
             item.own_markers,
             "case_name",
@@ -53,6 +63,25 @@ class NodeInfo:
         self._module_id = Path(item.parent.nodeid).stem  # type: ignore
         self._case_id = item.name
 
+    @classmethod
+    def from_item(cls, item: Item) -> NodeInfo:
+        """Get node info of the test item.
+
+        Node info is created once and cached in the item stash,
+        so the markers are parsed only at the first call.
+
+        Args:
+            item (Item): test item
+
+        Returns:
+            NodeInfo: node info
+        """
+        node_info = item.stash.get(_node_info_key, None)
+        if node_info is None:
+            node_info = cls(item)
+            item.stash[_node_info_key] = node_info
+        return node_info
+
     @property
     def module_id(self) -> str:
         """Get module id.
@@ -251,3 +280,6 @@ class NodeInfo:
                 raise ValueError(msg)
 
         return Group.MAIN
+
+
+_node_info_key = StashKey[NodeInfo]()
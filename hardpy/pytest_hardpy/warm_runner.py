@@ -0,0 +1,116 @@
+# Copyright (c) 2025 Everypin
+# GNU General Public License v3.0 (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+from logging import getLogger
+from platform import system
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hardpy.pytest_hardpy.utils import CollectionCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class WarmRunner:
+    """Warm pytest process for the test runs.
+
+    The warm process is started in advance. It imports pytest,
+    the HardPy plugin, the test modules and `conftest.py` files
+    by the test collection and waits for the run arguments.
+    The test run starts without the interpreter and import startup time.
+    A new warm process is prepared for the next run.
+
+    If the test files or the configuration files are changed
+    after the warm process is started, the warm process is stopped
+    and the test run must be started by the cold pytest process.
+
+    Args:
+        python_executable (str): python executable
+        tests_path (Path): tests directory
+    """
+
+    def __init__(self, python_executable: str, tests_path: Path) -> None:
+        self._log = getLogger(__name__)
+        self._python_executable = python_executable
+        self._tests_path = tests_path
+        self._proc: subprocess.Popen | None = None
+        self._fingerprint = ""
+
+    def prepare(self) -> None:
+        """Start the warm process if it is not started."""
+        if self._proc is not None and self._proc.poll() is None:
+            return
+        self._fingerprint = CollectionCache(self._tests_path).fingerprint
+        cmd = [self._python_executable, "-m", "hardpy.pytest_hardpy.warm_runner"]
+        if system() == "Windows":
+            self._proc = subprocess.Popen(  # noqa: S603
+                cmd,
+                cwd=self._tests_path,
+                stdin=subprocess.PIPE,
+                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
+            )
+        if system() == "Linux":
+            self._proc = subprocess.Popen(  # noqa: S603
+                cmd,
+                cwd=self._tests_path,
+                stdin=subprocess.PIPE,
+            )
+
+    def start(self, args: list[str]) -> subprocess.Popen | None:
+        """Start the test run in the warm process.
+
+        Args:
+            args (list[str]): pytest arguments
+
+        Returns:
+            subprocess.Popen | None: pytest process, or None if the warm process
+                is not ready or the test sources are changed
+        """
+        proc, self._proc = self._proc, None
+        if proc is None or proc.poll() is not None or proc.stdin is None:
+            return None
+        if CollectionCache(self._tests_path).fingerprint != self._fingerprint:
+            self._log.debug("Test sources are changed, warm process is stopped")
+            proc.terminate()
+            return None
+        try:
+            proc.stdin.write(json.dumps(args).encode() + b"\n")
+            proc.stdin.close()
+        except OSError:
+            proc.terminate()
+            return None
+        return proc
+
+    def stop(self) -> None:
+        """Stop the warm process."""
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.terminate()
+        self._proc = None
+
+
+def main() -> None:
+    """Import the test modules and run pytest with the received arguments."""
+    # collection imports the test modules and conftest.py files,
+    # the `addopts` of pytest.ini are dropped, so the HardPy plugin
+    # enabled by `--hardpy-pt` does not change the database of the current run
+    with redirect_stdout(StringIO()):
+        pytest.main(
+            ["--collect-only", "-q", "-p", "no:cacheprovider", "-o", "addopts="],
+        )
+
+    line = sys.stdin.readline()
+    if not line:
+        return
+    sys.exit(pytest.main(json.loads(line)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Test collection benchmark of the HardPy plugin.  # noqa: INP001
+# Generates a test suite with parametrized test cases and measures
+# the pytest collection time with and without the HardPy plugin.
+# The memory database backend is used, so CouchDB is not required.
+# Usage:
+# python scripts/benchmark_collection.py --cases 100 500 1000 2000
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+CASES_IN_MODULE = 100
+
+_TEST_MODULE = """
+import pytest
+
+import hardpy
+
+pytestmark = pytest.mark.module_name("Module {module}")
+
+
+@pytest.mark.case_name("Parametrized case")
+@pytest.mark.parametrize("value", range({cases}))
+def test_case(value):
+    hardpy.set_message(str(value))
+"""
+
+
+def _create_tests(path: Path, cases: int) -> None:
+    for module, start in enumerate(range(0, cases, CASES_IN_MODULE)):
+        module_cases = min(CASES_IN_MODULE, cases - start)
+        test_module = _TEST_MODULE.format(module=module, cases=module_cases)
+        (path / f"test_{module}.py").write_text(test_module)
+
+
+def _collect(path: Path, *args: str) -> float:
+    start = perf_counter()
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", *args],
+        cwd=path,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return perf_counter() - start
+
+
+def main() -> None:
+    """Run collection benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", type=int, nargs="+", default=[100, 500, 1000, 2000])
+    args = parser.parse_args()
+
+    print(f"{'cases':>8} {'pytest, s':>10} {'hardpy, s':>10}")  # noqa: T201
+    for cases in args.cases:
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir)
+            _create_tests(path, cases)
+            pytest_time = _collect(path, "-p", "no:cacheprovider")
+            hardpy_time = _collect(
+                path,
+                "-p",
+                "no:cacheprovider",
+                "--hardpy-pt",
+                "--hardpy-db-backend",
+                "memory",
+            )
+        print(f"{cases:>8} {pytest_time:>10.2f} {hardpy_time:>10.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import time
 from typing import TYPE_CHECKING
 
@@ -226,3 +227,51 @@ def test_hardpy_run_and_api_start_args_incorrect(project_dir_with_args: Path):
     finally:
         server_process.terminate()
         server_process.wait(timeout=10)
+
+
+@pytest.mark.manual
+def test_hardpy_import_reports(project_dir: Path):
+    """Test that hardpy import-reports loads the report directory."""
+    reports_dir = project_dir / "reports"
+    reports_dir.mkdir()
+    for i in range(3):
+        report = {
+            "_id": f"report_import_{i}",
+            "_rev": "1-0",
+            "status": "passed",
+            "stop_time": int(time.time()),
+            "start_time": int(time.time()),
+            "name": "import",
+            "test_stand": {},
+            "dut": {"serial_number": f"import_{i}"},
+            "process": {},
+        }
+        (reports_dir / f"report_{i}.json").write_text(json.dumps(report))
+    (reports_dir / "invalid.json").write_text("{}")
+
+    server = HardPyServer(project_dir)
+    result = server.run_command(
+        ["hardpy", "import-reports", str(reports_dir)],
+        cwd=str(project_dir),
+    )
+    assert result.returncode == 0, f"Command failed: {result.stderr.decode()}"
+    output = result.stdout.decode()
+    assert "Report invalid.json is skipped" in output
+    assert "Imported 3 of 3 reports." in output
+
+    result = server.run_command(
+        ["hardpy", "import-reports", str(reports_dir)],
+        cwd=str(project_dir),
+    )
+    assert "Imported 0 of 3 reports." in result.stdout.decode()
+
+
+@pytest.mark.manual
+def test_hardpy_import_reports_batch_size(project_dir: Path):
+    """Test that hardpy import-reports rejects the zero batch size."""
+    server = HardPyServer(project_dir)
+    result = server.run_command(
+        ["hardpy", "import-reports", str(project_dir), "--batch-size", "0"],
+        cwd=str(project_dir),
+    )
+    assert result.returncode != 0
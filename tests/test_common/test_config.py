@@ -25,10 +25,16 @@ db_default_user = "dev"
 db_default_password = "dev"
 db_default_host = "localhost"
 db_default_port = 5984
+db_default_flush_interval_ms = 50
+db_default_partial_update = False
+db_default_backend = "couchdb"
+db_default_sqlite_path = ".hardpy/database.sqlite3"
 db_default_url = f"http://{db_default_user}:{db_default_password}@{db_default_host}:{db_default_port}/"
 frontend_default_host = "localhost"
 frontend_default_port = 8000
 frontend_default_language = "en"
+frontend_default_warm_runner = False
+frontend_default_slots = 1
 stand_cloud_default_addr = ""
 db_default_doc_id = f"{frontend_default_host}_{frontend_default_port}"
 
@@ -67,6 +73,10 @@ def test_database_config():
     assert config.password == db_default_password
     assert config.host == db_default_host
     assert config.port == db_default_port
+    assert config.flush_interval_ms == db_default_flush_interval_ms
+    assert config.partial_update == db_default_partial_update
+    assert config.backend == db_default_backend
+    assert config.sqlite_path == db_default_sqlite_path
     assert config.doc_id == ""  # default before HardPyConfig init
     assert config.url == db_default_url
 
@@ -76,6 +86,8 @@ def test_frontend_config():
     assert config.host == frontend_default_host
     assert config.port == frontend_default_port
     assert config.language == frontend_default_language
+    assert config.warm_runner == frontend_default_warm_runner
+    assert config.slots == frontend_default_slots
 
 
 def test_stand_cloud_config():
@@ -99,6 +111,7 @@ def test_hardpy_config():
     assert config.database.port == db_default_port
     assert config.database.url == db_default_url
     assert config.database.doc_id == db_default_doc_id
+    assert config.get_doc_id("2") == f"{db_default_doc_id}_2"
     assert config.frontend.host == frontend_default_host
     assert config.frontend.port == frontend_default_port
     assert config.frontend.language == frontend_default_language
@@ -0,0 +1,96 @@
+from collections.abc import Iterator
+from pathlib import Path
+from threading import Timer
+
+import pytest
+from fastapi.testclient import TestClient
+
+from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy import pytest_wrapper
+from hardpy.pytest_hardpy.db.backend import SqliteBackend
+
+DB_URL = "/api/db/statestore"
+
+
+@pytest.fixture
+def backend(tmp_path: Path) -> SqliteBackend:
+    return SqliteBackend(tmp_path / "database.sqlite3", "statestore")
+
+
+@pytest.fixture
+def client(
+    monkeypatch: pytest.MonkeyPatch,
+    backend: SqliteBackend,
+) -> Iterator[TestClient]:
+    # the operator panel collects the tests on start, the tests are not needed here
+    monkeypatch.setattr(pytest_wrapper.PyTestWrapper, "collect", lambda *_, **__: False)
+    monkeypatch.setenv("DEBUG_FRONTEND", "1")
+    from hardpy.hardpy_panel import api  # noqa: PLC0415
+
+    monkeypatch.setattr(ConfigManager().config.database, "backend", "sqlite")
+    monkeypatch.setattr(api.app.state, "sqlite_backends", {"statestore": backend})
+    with TestClient(api.app) as test_client:
+        yield test_client
+
+
+def test_database_document(client: TestClient, backend: SqliteBackend):
+    doc = backend.save({"_id": "current", "status": "ready"})
+
+    response = client.get(f"{DB_URL}/current")
+    assert response.status_code == 200
+    assert response.json() == doc
+
+    assert client.get(f"{DB_URL}/missing").status_code == 404
+    assert client.get("/api/db/unknown/current").status_code == 404
+
+
+def test_database_all_docs(client: TestClient, backend: SqliteBackend):
+    doc_1 = backend.save({"_id": "current_1", "status": "ready"})
+    doc_2 = backend.save({"_id": "current_2", "status": "run"})
+
+    response = client.get(f"{DB_URL}/_all_docs", params={"include_docs": "true"})
+    assert response.status_code == 200
+    assert response.json() == {
+        "total_rows": 2,
+        "offset": 0,
+        "rows": [
+            {
+                "id": doc["_id"],
+                "key": doc["_id"],
+                "value": {"rev": doc["_rev"]},
+                "doc": doc,
+            }
+            for doc in (doc_1, doc_2)
+        ],
+    }
+
+    response = client.get(f"{DB_URL}/_all_docs")
+    assert "doc" not in response.json()["rows"][0]
+
+
+def test_database_changes_longpoll(client: TestClient, backend: SqliteBackend):
+    doc = backend.save({"_id": "current", "status": "ready"})
+    since = client.get(DB_URL).json()["update_seq"]
+
+    # the document is changed while the longpoll request waits for changes
+    timer = Timer(0.3, backend.save, [{**doc, "status": "run"}])
+    timer.start()
+    response = client.get(
+        f"{DB_URL}/_changes",
+        params={"since": since, "feed": "longpoll", "include_docs": "true"},
+    )
+    timer.join()
+    assert response.status_code == 200
+    changes = response.json()
+    assert [result["id"] for result in changes["results"]] == ["current"]
+    assert changes["results"][0]["doc"]["status"] == "run"
+    assert changes["last_seq"] == changes["results"][0]["seq"]
+    assert changes["last_seq"] != since
+
+
+def test_database_changes_doc_ids(client: TestClient, backend: SqliteBackend):
+    backend.save({"_id": "current", "status": "ready"})
+    backend.save({"_id": "other", "status": "ready"})
+
+    response = client.post(f"{DB_URL}/_changes", json={"doc_ids": ["other"]})
+    assert [result["id"] for result in response.json()["results"]] == ["other"]
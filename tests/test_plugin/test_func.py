@@ -628,6 +628,26 @@ def test_run_artifact(pytester: Pytester, hardpy_opts: list[str]):
     result.assert_outcomes(passed=1)
 
 
+def test_binary_run_artifact(pytester: Pytester, hardpy_opts: list[str]):
+    pytester.makepyfile(
+        f"""
+        {func_test_header}
+        def test_binary_run_artifact(request):
+            data = uuid4().bytes * 100
+            hardpy.set_run_artifact({{"first": data, "second": {{"data": data}}}})
+            report = hardpy.get_current_report()
+            first = report.artifact["first"]
+            second = report.artifact["second"]["data"]
+            assert first == second
+            assert first["size"] == len(data)
+            assert first["content_type"] == "application/octet-stream"
+            assert hardpy.AttachmentStore().read(first["attachment_id"]) == data
+    """,
+    )
+    result = pytester.runpytest(*hardpy_opts)
+    result.assert_outcomes(passed=1)
+
+
 def test_empty_run_artifact_data(pytester: Pytester, hardpy_opts: list[str]):
     pytester.makepyfile(
         f"""
@@ -799,6 +819,55 @@ def test_non_block_operator_message(pytester: Pytester, hardpy_opts: list[str]):
     result.assert_outcomes(passed=1)
 
 
+def test_operator_message_image(pytester: Pytester, hardpy_opts: list[str]):
+    image_data = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+    (pytester.path / "image.png").write_bytes(image_data)
+    pytester.makepyfile(
+        f"""
+        {func_test_header}
+        from hardpy.pytest_hardpy.db import StateStore
+        from hardpy.pytest_hardpy.db.base_store import create_backend
+
+        def test_operator_message_image():
+            image = hardpy.ImageComponent(address="image.png")
+            hardpy.set_operator_message(msg="a", image=image, block=False)
+            state_image = StateStore().get_field("operator_msg.image")
+            assert state_image["base64"] is None
+            attachment_id = state_image["attachment_id"]
+            chunks, content_type = hardpy.AttachmentStore().get(attachment_id)
+            assert b"".join(chunks) == {image_data!r}
+            assert content_type == "image/png"
+
+            image = hardpy.ImageComponent(address="image.png", width=50)
+            hardpy.set_operator_message(msg="b", image=image, block=False)
+            state_image = StateStore().get_field("operator_msg.image")
+            assert state_image["attachment_id"] == attachment_id
+
+            # the image is stored again after the attachments database is cleared
+            create_backend("attachments").delete(attachment_id)
+            hardpy.set_operator_message(msg="c", image=image, block=False)
+            assert hardpy.AttachmentStore().read(attachment_id) == {image_data!r}
+    """,
+    )
+    result = pytester.runpytest(*hardpy_opts)
+    result.assert_outcomes(passed=1)
+
+
+def test_dialog_box_timeout(pytester: Pytester, hardpy_opts: list[str]):
+    pytester.makepyfile(
+        f"""
+        {func_test_header}
+        @pytest.mark.timeout(5)
+        def test_dialog_box_timeout():
+            dbx = hardpy.DialogBox(dialog_text="a")
+            with pytest.raises(TimeoutError):
+                hardpy.run_dialog_box(dbx, timeout=0.5)
+    """,
+    )
+    result = pytester.runpytest(*hardpy_opts)
+    result.assert_outcomes(passed=1)
+
+
 def test_incorrect_couchdbconfig_data(pytester: Pytester, hardpy_opts: list[str]):
     pytester.makepyfile(
         f"""
@@ -1171,6 +1240,52 @@ def test_numeric_measurement(pytester: Pytester, hardpy_opts: list[str]):
     result.assert_outcomes(passed=1)
 
 
+def test_measurement_batch(pytester: Pytester, hardpy_opts: list[str]):
+    pytester.makepyfile(
+        f"""
+        {func_test_header}
+        def test_measurement(request):
+            node = NodeInfo(request.node)
+            module_id = node.module_id
+            case_id = node.case_id
+
+            meas1 = hardpy.NumericMeasurement(value=1)
+            index_1 = hardpy.set_case_measurement(meas1)
+            assert index_1 == 0
+
+            batch = hardpy.MeasurementBatch(
+                name="voltage",
+                unit="V",
+                operation=hardpy.ComparisonOperation.GELE,
+                lower_limit=1,
+                upper_limit=3,
+                values=[1, 2.5, 4],
+            )
+            meas2 = hardpy.StringMeasurement(value="a")
+            index_2 = hardpy.set_case_measurements([batch, meas2])
+            assert index_2 == 1
+            assert not batch.result
+
+            meas3 = hardpy.NumericMeasurement(value=3)
+            index_3 = hardpy.set_case_measurement(meas3)
+            assert index_3 == 5
+
+            report = hardpy.get_current_report()
+            measurements = report.modules[module_id].cases[case_id].measurements
+            assert len(measurements) == 6
+            assert measurements[index_1].value == meas1.value
+            batch_measurements = measurements[index_2:index_2 + len(batch)]
+            assert [meas.value for meas in batch_measurements] == batch.values
+            assert [meas.result for meas in batch_measurements] == batch.results
+            assert all(meas.unit == "V" for meas in batch_measurements)
+            assert measurements[4].value == meas2.value
+            assert measurements[index_3].value == meas3.value
+    """,
+    )
+    result = pytester.runpytest(*hardpy_opts)
+    result.assert_outcomes(passed=1)
+
+
 def test_string_measurement(pytester: Pytester, hardpy_opts: list[str]):
     pytester.makepyfile(
         f"""
@@ -1274,6 +1389,38 @@ def test_set_case_chart(pytester: Pytester, hardpy_opts: list[str]):
     result.assert_outcomes(passed=1)
 
 
+def test_set_case_chart_decimation(pytester: Pytester, hardpy_opts: list[str]):
+    pytester.makepyfile(
+        f"""
+        {func_test_header}
+        from hardpy.pytest_hardpy.db import StateStore
+
+        def test_set_case_chart_decimation(request):
+            node = NodeInfo(request.node)
+            module_id = node.module_id
+            case_id = node.case_id
+
+            x_data = list(range(1000))
+            y_data = [x * 0.5 for x in x_data]
+            chart = hardpy.Chart(marker_name=[None], x_data=[x_data], y_data=[y_data])
+            hardpy.set_case_chart(chart, max_points=100)
+
+            report = hardpy.get_current_report()
+            chart_data = report.modules[module_id].cases[case_id].chart
+            assert chart_data.x_data == [x_data]
+            assert chart_data.y_data == [y_data]
+
+            key = ".".join(["modules", module_id, "cases", case_id, "chart"])
+            state_chart = StateStore().get_field(key)
+            assert len(state_chart["x_data"][0]) == 100
+            assert state_chart["x_data"][0][0] == 0
+            assert state_chart["x_data"][0][-1] == 999
+    """,
+    )
+    result = pytester.runpytest(*hardpy_opts)
+    result.assert_outcomes(passed=1)
+
+
 def test_get_current_attempt(pytester: Pytester, hardpy_opts: list):
     pytester.makepyfile(
         f"""{func_test_header}
@@ -1291,3 +1438,29 @@ def test_get_current_attempt(pytester: Pytester, hardpy_opts: list):
     )
     result = pytester.runpytest(*hardpy_opts)
     result.assert_outcomes(passed=2)
+
+
+def test_instrument_lock_stats(pytester: Pytester, hardpy_opts: list[str]):
+    pytester.makepyfile(
+        f"""
+        {func_test_header}
+        def test_instrument_lock_stats():
+            instrument = hardpy.Instrument(name=str(uuid4())[:6], number=2)
+            key = f"{{instrument.name}}_2"
+            with hardpy.instrument_lock(instrument):
+                with hardpy.instrument_lock(instrument, timeout=0.1):
+                    pass
+
+            report = hardpy.get_current_report()
+            stats = report.artifact["instrument_locks"][key]
+            assert stats["count"] == 2
+            assert stats["wait_time"] >= 0
+            assert stats["hold_time"] >= 0
+
+            with pytest.raises(ValueError):
+                with hardpy.instrument_lock(hardpy.Instrument()):
+                    pass
+    """,
+    )
+    result = pytester.runpytest(*hardpy_opts)
+    result.assert_outcomes(passed=1)
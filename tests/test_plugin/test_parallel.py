@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pytest import Pytester
+
+parallel_opts = ["--hardpy-workers", "2"]
+
+
+def test_parallel_modules(pytester: Pytester, hardpy_opts: list):
+    pytester.makeconftest(
+        """
+        import threading
+
+        import pytest
+
+        started = threading.Barrier(2, timeout=10)
+
+        @pytest.fixture(scope="session")
+        def session_counter():
+            return []
+        """,
+    )
+    pytester.makepyfile(
+        test_1="""
+        import hardpy
+        from conftest import started
+
+        def test_a(session_counter):
+            session_counter.append(1)
+            started.wait()
+            hardpy.set_case_artifact({"module": "test_1"})
+            report = hardpy.get_current_report()
+            artifact = report.modules["test_1"].cases["test_a"].artifact
+            assert artifact == {"module": "test_1"}
+    """,
+    )
+    pytester.makepyfile(
+        test_2="""
+        import hardpy
+        from conftest import started
+
+        def test_a(session_counter):
+            session_counter.append(2)
+            started.wait()
+            hardpy.set_case_artifact({"module": "test_2"})
+
+        def test_b(session_counter):
+            assert sorted(session_counter) == [1, 2]
+    """,
+    )
+    result = pytester.runpytest(*hardpy_opts, *parallel_opts)
+    result.assert_outcomes(passed=3)
+
+
+def test_parallel_dependency(pytester: Pytester, hardpy_opts: list):
+    pytester.makepyfile(
+        test_1="""
+        import time
+
+        def test_a():
+            time.sleep(0.5)
+            assert False
+    """,
+    )
+    pytester.makepyfile(
+        test_2="""
+        import pytest
+
+        @pytest.mark.dependency("test_1::test_a")
+        def test_a():
+            assert True
+
+        def test_b():
+            assert True
+    """,
+    )
+    result = pytester.runpytest(*hardpy_opts, *parallel_opts)
+    result.assert_outcomes(passed=1, failed=1, skipped=1)
+
+
+def test_parallel_critical(pytester: Pytester, hardpy_opts: list):
+    pytester.makepyfile(
+        test_1="""
+        import pytest
+
+        @pytest.mark.critical
+        def test_a():
+            assert False
+    """,
+    )
+    pytester.makepyfile(
+        test_2="""
+        def test_a():
+            assert True
+    """,
+    )
+    result = pytester.runpytest(*hardpy_opts, *parallel_opts)
+    result.assert_outcomes(failed=1, skipped=1)
+
+
+def test_parallel_groups(pytester: Pytester, hardpy_opts: list):
+    pytester.makepyfile(
+        test_1="""
+        import pytest
+
+        order = []
+
+        @pytest.mark.case_group("teardown")
+        def test_a():
+            assert order == ["setup", "main"]
+
+        def test_b():
+            order.append("main")
+
+        @pytest.mark.case_group("setup")
+        def test_c():
+            order.append("setup")
+    """,
+    )
+    result = pytester.runpytest(*hardpy_opts, *parallel_opts)
+    result.assert_outcomes(passed=3)
+
+
+def test_parallel_caused_dut_failure_id(pytester: Pytester, hardpy_opts: list):
+    pytester.makeconftest(
+        """
+        import pytest
+        import hardpy
+
+        def finish_executing():
+            report = hardpy.get_current_report()
+            assert report.caused_dut_failure_id == "test_2::test_a"
+
+        @pytest.fixture(scope="session", autouse=True)
+        def actions_after(post_run_functions: list):
+            post_run_functions.append(finish_executing)
+            yield
+        """,
+    )
+    pytester.makepyfile(
+        test_1="""
+        import pytest
+
+        # the last attempt fails after the failure of the other module
+        @pytest.mark.attempt(2)
+        def test_a():
+            assert False
+    """,
+    )
+    pytester.makepyfile(
+        test_2="""
+        import time
+
+        def test_a():
+            time.sleep(0.3)
+            assert False
+    """,
+    )
+    result = pytester.runpytest(*hardpy_opts, *parallel_opts)
+    result.assert_outcomes(failed=2)
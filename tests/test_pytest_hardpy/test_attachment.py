@@ -0,0 +1,32 @@
+from pathlib import Path
+
+import pytest
+from pycouchdb.exceptions import NotFound
+
+from hardpy.pytest_hardpy.db.backend import (
+    IStoreBackend,
+    MemoryBackend,
+    SqliteBackend,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> IStoreBackend:
+    if request.param == "memory":
+        return MemoryBackend(f"attachments_{tmp_path.name}")
+    return SqliteBackend(tmp_path / "database.sqlite3", "attachments")
+
+
+def test_put_attachment(backend: IStoreBackend):
+    data = bytes(range(256)) * 1000
+    assert backend.put_attachment("id", data, "image/png")
+    assert not backend.put_attachment("id", b"other", "text/plain")
+
+    chunks, content_type = backend.get_attachment("id")
+    assert b"".join(chunks) == data
+    assert content_type == "image/png"
+
+
+def test_missing_attachment(backend: IStoreBackend):
+    with pytest.raises(NotFound):
+        backend.get_attachment("missing")
@@ -0,0 +1,197 @@
+from collections.abc import Callable
+from time import sleep
+from uuid import uuid4
+
+import pytest
+from pycouchdb.exceptions import Conflict, NotFound
+
+from hardpy.common.config import ConfigManager
+from hardpy.pytest_hardpy.db import base_store
+from hardpy.pytest_hardpy.db.backend import MemoryBackend
+from hardpy.pytest_hardpy.db.base_store import BaseStore
+
+DOC_ID = "current"
+
+
+class CountingBackend(MemoryBackend):
+    """Memory backend with the request counters and the injected conflicts."""
+
+    def __init__(self, db_name: str) -> None:
+        super().__init__(db_name)
+        self.db_name = db_name
+        self.saves = 0
+        self.save_conflicts = 0
+        self.patches: list[dict] = []
+        self.patch_errors: list[Exception] = []
+
+    def save(self, doc: dict) -> dict:  # noqa: D102
+        self.saves += 1
+        if self.save_conflicts:
+            self.save_conflicts -= 1
+            msg = "Document update conflict."
+            raise Conflict(msg)
+        return super().save(doc)
+
+    def patch(self, doc_id: str, changes: dict) -> tuple[str, str]:  # noqa: D102
+        self.patches.append(changes)
+        if self.patch_errors:
+            raise self.patch_errors.pop()
+        return super().patch(doc_id, changes)
+
+
+StoreFactory = Callable[..., BaseStore]
+
+
+@pytest.fixture
+def backend() -> CountingBackend:
+    return CountingBackend(f"base_store_{uuid4().hex}")
+
+
+@pytest.fixture
+def create_store(
+    monkeypatch: pytest.MonkeyPatch,
+    backend: CountingBackend,
+) -> StoreFactory:
+    monkeypatch.setattr(base_store, "create_backend", lambda *_args: backend)
+
+    def _create_store(
+        flush_interval_ms: int = 0,
+        partial_update: bool = False,
+    ) -> BaseStore:
+        database = ConfigManager().config.database
+        monkeypatch.setattr(database, "flush_interval_ms", flush_interval_ms)
+        monkeypatch.setattr(database, "partial_update", partial_update)
+        return BaseStore("base_store", DOC_ID)
+
+    return _create_store
+
+
+def test_update_db_coalesced(create_store: StoreFactory, backend: CountingBackend):
+    store = create_store(flush_interval_ms=100)
+    for index in range(3):
+        store.update_doc_value("user", f"user_{index}")
+        store.update_db()
+    assert backend.saves == 0
+
+    sleep(0.5)
+    assert backend.saves == 1
+    assert backend.get(DOC_ID)["user"] == "user_2"
+
+
+def test_flush(create_store: StoreFactory, backend: CountingBackend):
+    store = create_store(flush_interval_ms=100)
+    store.update_doc_value("user", "user_1")
+    store.update_db()
+    store.flush()
+    assert backend.saves == 1
+    assert backend.get(DOC_ID)["user"] == "user_1"
+
+    # the flush cancels the timer of the written changes
+    sleep(0.3)
+    assert backend.saves == 1
+
+
+def test_zero_flush_interval(create_store: StoreFactory, backend: CountingBackend):
+    store = create_store(flush_interval_ms=0)
+    store.update_doc_value("user", "user_1")
+    store.update_db()
+    assert backend.saves == 1
+    store.update_doc_value("user", "user_2")
+    store.update_db()
+    assert backend.saves == 2
+    assert backend.get(DOC_ID)["user"] == "user_2"
+
+
+def test_patch_changed_keys(create_store: StoreFactory, backend: CountingBackend):
+    store = create_store(partial_update=True)
+    # the new document is saved completely
+    store.update_db()
+    assert backend.saves == 1
+
+    store.update_doc_value("modules", {"test_a": {"status": "ready"}})
+    store.update_doc_value("modules.test_a.status", "run")
+    store.update_doc_value("alert", "alert")
+    store.update_db()
+    assert backend.saves == 1
+    assert backend.patches == [
+        {"alert": "alert", "modules": {"test_a": {"status": "run"}}},
+    ]
+    assert backend.get(DOC_ID)["modules"] == {"test_a": {"status": "run"}}
+
+
+def test_patch_concurrent_writer(create_store: StoreFactory, backend: CountingBackend):
+    store = create_store(partial_update=True)
+    store.update_db()
+    MemoryBackend(backend.db_name).patch(DOC_ID, {"alert": "other"})
+
+    store.update_doc_value("user", "user_1")
+    store.update_db()
+    # the document is read completely, the changes of the other writer are kept
+    store.update_doc()
+    assert store.get_field("alert") == "other"
+    assert store.get_field("user") == "user_1"
+    assert store.stats["not_modified"] == 0
+
+
+@pytest.mark.parametrize("error", [Conflict, NotFound])
+def test_patch_error_fallback(
+    error: type[Exception],
+    create_store: StoreFactory,
+    backend: CountingBackend,
+):
+    store = create_store(partial_update=True)
+    store.update_db()
+    backend.patch_errors.append(error("patch error"))
+
+    store.update_doc_value("user", "user_1")
+    store.update_db()
+    assert len(backend.patches) == 1
+    assert backend.saves == 2
+    assert backend.get(DOC_ID)["user"] == "user_1"
+
+
+def test_conflict_merge(create_store: StoreFactory, backend: CountingBackend):
+    store = create_store()
+    store.update_db()
+    MemoryBackend(backend.db_name).patch(DOC_ID, {"alert": "other"})
+    backend.save_conflicts = 2
+
+    store.update_doc_value("user", "user_1")
+    store.update_db()
+    # the changes are merged to the document of the other writer
+    assert store.stats["conflicts"] == 2
+    assert store.stats["retries"] == 2
+    assert backend.saves == 4
+    doc = backend.get(DOC_ID)
+    assert doc["alert"] == "other"
+    assert doc["user"] == "user_1"
+
+
+def test_conflict_retries_exhausted(
+    monkeypatch: pytest.MonkeyPatch,
+    create_store: StoreFactory,
+    backend: CountingBackend,
+):
+    monkeypatch.setattr(base_store, "_CONFLICT_RETRIES", 2)
+    store = create_store()
+    store.update_db()
+    backend.save_conflicts = 3
+
+    store.update_doc_value("user", "user_1")
+    with pytest.raises(Conflict):
+        store.update_db()
+    assert store.stats["conflicts"] == 3
+    assert store.stats["retries"] == 2
+
+
+def test_not_modified(create_store: StoreFactory, backend: CountingBackend):
+    store = create_store()
+    store.update_db()
+    store.update_doc()
+    store.update_doc()
+    assert store.stats["not_modified"] == 2
+
+    MemoryBackend(backend.db_name).patch(DOC_ID, {"alert": "other"})
+    store.update_doc()
+    assert store.get_field("alert") == "other"
+    assert store.stats["not_modified"] == 2
@@ -0,0 +1,79 @@
+import math
+
+import pytest
+
+from hardpy import Chart, ChartDecimation
+from hardpy.pytest_hardpy.db.schema.v1 import Chart as ChartModel
+from hardpy.pytest_hardpy.utils import chart_decimation
+from hardpy.pytest_hardpy.utils.chart_decimation import decimate
+from hardpy.pytest_hardpy.utils.measurement_column import encode_column
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def use_numpy(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(chart_decimation, "np", None)
+
+
+@pytest.mark.usefixtures("use_numpy")
+def test_short_series():
+    x_data = [1, 2, 3]
+    y_data = [4, 5, 6]
+    for method in ChartDecimation:
+        assert decimate(x_data, y_data, 3, method) == (x_data, y_data)
+        assert decimate(x_data, y_data, 1, method) == (x_data, y_data)
+
+
+@pytest.mark.usefixtures("use_numpy")
+@pytest.mark.parametrize("method", list(ChartDecimation))
+def test_decimate(method: ChartDecimation):
+    x_data = list(range(10000))
+    y_data = [math.sin(x / 100) for x in x_data]
+    y_data[5000] = 10
+
+    dec_x, dec_y = decimate(x_data, y_data, 100, method)
+    assert len(dec_x) == len(dec_y)
+    assert len(dec_x) <= 100
+    assert dec_x[0] == x_data[0]
+    assert dec_x[-1] == x_data[-1]
+    assert dec_x == sorted(dec_x)
+    assert all(y_data[x] == y for x, y in zip(dec_x, dec_y, strict=True))
+    # the peak is kept
+    assert 10 in dec_y
+
+
+def test_lttb_numpy_python():
+    pytest.importorskip("numpy")
+    x_data = [x / 10 for x in range(5000)]
+    y_data = [math.sin(x) * x for x in x_data]
+    numpy_data = decimate(x_data, y_data, 300, ChartDecimation.LTTB)
+    np = chart_decimation.np
+    chart_decimation.np = None
+    try:
+        python_data = decimate(x_data, y_data, 300, ChartDecimation.LTTB)
+    finally:
+        chart_decimation.np = np
+    assert numpy_data == python_data
+
+
+def test_numpy_series():
+    np = pytest.importorskip("numpy")
+    chart = Chart(marker_name=[None], x_data=[np.arange(3)], y_data=[np.ones(3)])
+    chart.add_series(np.array([1, 2]), np.array([0.5, 1.5]))
+    assert chart.x_data == [[0, 1, 2], [1, 2]]
+    assert chart.y_data == [[1.0, 1.0, 1.0], [0.5, 1.5]]
+
+    with pytest.raises(ValueError, match="must be int or float"):
+        chart.add_series(np.array(["a"]), np.array(["b"]))
+
+
+def test_packed_series():
+    chart = ChartModel(
+        marker_name=["a", "b"],
+        x_data=[encode_column([1, 2, 3]), [1, 2]],
+        y_data=[encode_column([0.5, 1.5, 2.5]), [3, 4]],
+    )
+    assert chart.x_data == [[1, 2, 3], [1, 2]]
+    assert chart.y_data == [[0.5, 1.5, 2.5], [3, 4]]
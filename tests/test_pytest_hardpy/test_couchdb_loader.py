@@ -0,0 +1,59 @@
+from collections.abc import Iterator
+from uuid import uuid4
+
+import pytest
+
+from hardpy.pytest_hardpy.db.backend import CouchdbConnectionManager
+from hardpy.pytest_hardpy.db.schema import ResultRunStore
+from hardpy.pytest_hardpy.result import CouchdbLoader
+from hardpy.pytest_hardpy.result.couchdb_config import CouchdbConfig
+
+
+def _report(report_id: str) -> ResultRunStore:
+    return ResultRunStore.model_validate(
+        {
+            "_id": report_id,
+            "_rev": "1-0",
+            "status": "passed",
+            "stop_time": 1,
+            "start_time": 0,
+            "name": "import",
+            "test_stand": {},
+            "dut": {},
+            "process": {},
+        },
+    )
+
+
+@pytest.fixture
+def couchdb_config() -> Iterator[CouchdbConfig]:
+    config = CouchdbConfig(db_name=f"report_{uuid4().hex}")
+    yield config
+    server = CouchdbConnectionManager().get_server(config.connection_string)
+    if config.db_name in server:
+        server.delete(config.db_name)
+
+
+def test_load_many_conflict(couchdb_config: CouchdbConfig):
+    loader = CouchdbLoader(couchdb_config)
+    assert loader.load_many([_report("report_1")]) == {}
+
+    reports = [_report(f"report_{i}") for i in range(4)]
+    errors = loader.load_many(reports, batch_size=2, workers=2)
+    # the reports keep their ids, so the loaded report is a conflict
+    assert list(errors) == ["report_1"]
+    assert errors["report_1"].startswith("conflict")
+
+    errors = loader.load_many(reports, batch_size=2, workers=2)
+    assert sorted(errors) == [f"report_{i}" for i in range(4)]
+
+
+def test_load_many_failed_batch(couchdb_config: CouchdbConfig):
+    loader = CouchdbLoader(couchdb_config)
+    server = CouchdbConnectionManager().get_server(couchdb_config.connection_string)
+    server.delete(couchdb_config.db_name)
+
+    # each report of the failed batches is reported
+    reports = [_report(f"report_{i}") for i in range(3)]
+    errors = loader.load_many(reports, batch_size=2)
+    assert sorted(errors) == ["report_0", "report_1", "report_2"]
@@ -1,3 +1,7 @@
+import os
+import shutil
+from pathlib import Path
+
 import hardpy
 from hardpy.pytest_hardpy.utils.dialog_box import BaseWidget
 from hardpy.pytest_hardpy.utils.exception import WidgetInfoError
@@ -93,6 +97,20 @@ def test_image_widget_icon():
     assert True
 
 
+def test_image_widget_cache(tmp_path: Path):
+    image_path = tmp_path / "test.png"
+    shutil.copy(f"{assets_path}test.png", image_path)
+    first_image = hardpy.ImageComponent(address=str(image_path))
+    second_image = hardpy.ImageComponent(address=str(image_path), width=50)
+    assert first_image.base64 is second_image.base64
+
+    image_path.write_bytes(b"changed image")
+    stat = image_path.stat()
+    os.utime(image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    changed_image = hardpy.ImageComponent(address=str(image_path))
+    assert changed_image.base64 == "Y2hhbmdlZCBpbWFnZQ=="
+
+
 def test_image_widget_with_empty_data():
     try:
         hardpy.ImageComponent()  # type: ignore
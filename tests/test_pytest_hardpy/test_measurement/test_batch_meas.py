@@ -0,0 +1,165 @@
+import pytest
+
+from hardpy import (
+    ComparisonOperation as CompOp,
+    MeasurementBatch,
+    NumericMeasurement,
+)
+from hardpy.pytest_hardpy.db.schema.v1 import CaseRunStore
+from hardpy.pytest_hardpy.utils import measurement_column
+from hardpy.pytest_hardpy.utils.measurement_column import (
+    RESULTS_KEY,
+    decode_column,
+    encode_column,
+    encode_results,
+    get_measurement_count,
+)
+
+
+def test_column_round_trip():
+    int_values = [0, -1, 2**40, 7]
+    int_column = encode_column(int_values)
+    assert int_column["dtype"] == "q"
+    assert int_column["count"] == len(int_values)
+    assert decode_column(int_column) == int_values
+
+    float_values = [0.1, 2, -3.5, 1e300]
+    float_column = encode_column(float_values)
+    assert float_column["dtype"] == "d"
+    assert decode_column(float_column) == float_values
+
+    big_values = [2**70, 1]
+    assert decode_column(encode_column(big_values)) == [float(2**70), 1.0]
+    assert MeasurementBatch(values=big_values).values == [float(2**70), 1.0]
+
+
+def test_batch_values():
+    batch = MeasurementBatch(name="voltage", unit="V", values=[1, 2])
+    batch.append(3.5)
+    batch.extend([4])
+    assert batch.values == [1, 2, 3.5, 4]
+    assert len(batch) == 4
+    assert batch.result is None
+    assert batch.results is None
+
+    with pytest.raises(ValueError, match="must be int or float"):
+        batch.append("5")
+    with pytest.raises(ValueError, match="must be int or float"):
+        batch.append(True)
+
+
+def test_batch_result():
+    batch = MeasurementBatch(
+        operation=CompOp.GELE,
+        lower_limit=1,
+        upper_limit=3,
+        values=[1, 2, 3],
+    )
+    assert batch.result
+    batch.append(4)
+    assert batch.results == [True, True, True, False]
+    assert not batch.result
+
+
+def test_batch_requirements():
+    with pytest.raises(ValueError, match="Comparison_value required"):
+        MeasurementBatch(operation=CompOp.EQ)
+    with pytest.raises(ValueError, match="upper_limit required"):
+        MeasurementBatch(operation=CompOp.GTLT, lower_limit=1)
+
+
+def test_batch_expansion():
+    batch = MeasurementBatch(
+        name="current",
+        unit="A",
+        operation=CompOp.LT,
+        comparison_value=2,
+        values=[0.5, 1.5, 2.5],
+    )
+    measurements = [{"type": "numeric", "value": 10}, batch.to_dict()]
+    assert get_measurement_count(measurements) == 4
+
+    case = CaseRunStore(
+        status="passed",
+        stop_time=None,
+        start_time=None,
+        name="case",
+        group="main",
+        measurements=measurements,
+    )
+    assert len(case.measurements) == 4
+    assert case.measurements[0].value == 10
+    assert [meas.value for meas in case.measurements[1:]] == batch.values
+    assert [meas.result for meas in case.measurements[1:]] == batch.results
+    for meas in case.measurements[1:]:
+        assert meas.name == "current"
+        assert meas.unit == "A"
+        assert meas.operation == CompOp.LT
+        assert meas.comparison_value == 2
+
+
+def test_batch_stored_results():
+    batch = MeasurementBatch(operation=CompOp.GT, comparison_value=0, values=[1, 2])
+    series = batch.to_dict()
+    assert decode_column(series[RESULTS_KEY]) == [1, 1]
+    assert RESULTS_KEY not in MeasurementBatch(values=[1]).to_dict()
+
+    # the report uses the stored results instead of checking the values again
+    series[RESULTS_KEY] = encode_results([True, False])
+    case = CaseRunStore(
+        status="failed",
+        stop_time=None,
+        start_time=None,
+        name="case",
+        group="main",
+        measurements=[series],
+    )
+    assert [meas.result for meas in case.measurements] == [True, False]
+
+
+def test_batch_keyword_arguments():
+    with pytest.raises(TypeError):
+        MeasurementBatch("voltage", "V", CompOp.EQ, 1)  # type: ignore[misc]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("operation", list(CompOp))
+def test_batch_operations(
+    operation: CompOp,
+    use_numpy: bool,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(measurement_column, "np", None)
+    values = [-1, 0, 0.5, 1, 1.5, 2, 2.5, 3]
+    limits = {"comparison_value": 1, "lower_limit": 0, "upper_limit": 2}
+
+    batch = MeasurementBatch(operation=operation, values=values, **limits)
+    expected = [
+        NumericMeasurement(value=value, operation=operation, **limits).result
+        for value in values
+    ]
+    assert batch.results == expected
+    assert batch.result == all(expected)
+
+
+def test_batch_numpy_values():
+    np = pytest.importorskip("numpy")
+    batch = MeasurementBatch(operation=CompOp.GE, comparison_value=1)
+    batch.extend(np.arange(3))
+    batch.extend(np.array([1.5, 2.5]))
+    assert batch.values == [0, 1, 2, 1.5, 2.5]
+    assert batch.results == [False, True, True, True, True]
+
+    assert decode_column(batch.to_dict()["values"]) == [0, 1, 2, 1.5, 2.5]
+
+    int_batch = MeasurementBatch(values=np.arange(3, dtype=np.int32))
+    assert int_batch.to_dict()["values"]["dtype"] == "q"
+    assert int_batch.values == [0, 1, 2]
+
+    with pytest.raises(ValueError, match="must be int or float"):
+        batch.extend(np.array(["1"]))
+    with pytest.raises(ValueError, match="must be int or float"):
+        batch.extend(np.array([True]))
@@ -0,0 +1,43 @@
+from hardpy.pytest_hardpy.run_queue import RunQueue
+
+
+def test_run_queue_order():
+    run_queue = RunQueue()
+    first = run_queue.add({"serial_number": "1"})
+    second = run_queue.add({"serial_number": "2"}, slot="2")
+    third = run_queue.add({"serial_number": "3"})
+    assert run_queue.depth == 3
+
+    assert run_queue.pop_next([]) is None
+    assert run_queue.pop_next(["1"]) is first
+    assert first.slot == "1"
+    assert run_queue.pop_next(["1"]) is third
+    assert run_queue.pop_next(["2"]) is second
+    assert run_queue.depth == 0
+
+
+def test_run_queue_times():
+    run_queue = RunQueue()
+    run = run_queue.add({"serial_number": "1"})
+    assert run_queue.get_info()["queue"][0]["status"] == "queued"
+
+    run_queue.start(run_queue.pop_next([None]))
+    run_queue.finish(run, 0)
+    info = run_queue.get_info()
+    assert info["queue_depth"] == 0
+    run_info = info["runs"][0]
+    assert run_info["run_id"] == run.run_id
+    assert run_info["status"] == "finished"
+    assert run_info["wait_time"] >= 0
+    assert run_info["exec_time"] >= 0
+    assert run_info["exit_code"] == 0
+
+
+def test_run_queue_clear():
+    run_queue = RunQueue()
+    run_queue.add(slot="1")
+    run_queue.add(slot="2")
+    run_queue.add()
+    assert run_queue.clear("1") == 1
+    assert run_queue.clear() == 2
+    assert run_queue.depth == 0
@@ -1,3 +1,8 @@
+from hardpy.pytest_hardpy.db import ResultRunStore
+from hardpy.pytest_hardpy.db.schema.v1 import ResultRunStore as ResultRunStoreV1
+from hardpy.pytest_hardpy.db.schema.v2 import ResultRunStore as ResultRunStoreV2
+
+
 def test_schema_version():
     """Check last schema version.
 
@@ -6,10 +11,68 @@ def test_schema_version():
 
     Update the schema version in this test after creating a new version.
     """
-    from hardpy.pytest_hardpy.db import ResultRunStore
-    from hardpy.pytest_hardpy.db.schema.v1 import ResultRunStore as ResultRunStoreV1
-
     actual_schema = ResultRunStore
-    last_schema = ResultRunStoreV1
+    last_schema = ResultRunStoreV2
 
     assert actual_schema == last_schema
+    assert actual_schema.__version__ == ResultRunStoreV1.__version__ + 1
+
+
+def test_report_summary():
+    def case(status: str, measurement_results: list[bool]) -> dict:
+        return {
+            "status": status,
+            "stop_time": 1,
+            "start_time": 0,
+            "name": f"Case {status}",
+            "group": "main",
+            "measurements": [
+                {"type": "numeric", "value": 1, "result": result}
+                for result in measurement_results
+            ],
+        }
+
+    report = ResultRunStore.model_validate(
+        {
+            "_id": "current",
+            "_rev": "1-0",
+            "status": "failed",
+            "stop_time": 130,
+            "start_time": 100,
+            "name": "Tests",
+            "test_stand": {},
+            "dut": {},
+            "process": {},
+            "modules": {
+                "test_1": {
+                    "status": "passed",
+                    "stop_time": 1,
+                    "start_time": 0,
+                    "name": "Module 1",
+                    "group": "main",
+                    "cases": {"test_a": case("passed", [True, True])},
+                },
+                "test_2": {
+                    "status": "failed",
+                    "stop_time": 1,
+                    "start_time": 0,
+                    "name": "Module 2",
+                    "group": "main",
+                    "cases": {
+                        "test_a": case("failed", [True, False]),
+                        "test_b": case("failed", [False]),
+                        "test_c": case("skipped", []),
+                    },
+                },
+            },
+        },
+    )
+    summary = report.summary
+    assert summary is not None
+    assert summary.first_failed_module_id == "test_2"
+    assert summary.first_failed_case_id == "test_a"
+    assert summary.first_failed_case_name == "Case failed"
+    assert summary.case_count == {"passed": 1, "failed": 2, "skipped": 1}
+    assert summary.duration == 30
+    assert summary.measurement_count == 5
+    assert summary.failed_measurement_count == 2
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hardpy.common.stand_cloud.exception import StandCloudError
+from hardpy.pytest_hardpy.result.report_loader.stand_cloud_outbox import (
+    StandCloudOutbox,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _Report:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def model_dump(self, **_kwargs: object) -> dict:
+        return {"name": self.name}
+
+
+class _Response:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.text = ""
+
+
+class _Loader:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.reports: list[dict] = []
+
+    def load_data(self, report_data: dict, _timeout: int) -> _Response:
+        self.reports.append(report_data)
+        return _Response(self.status_code)
+
+
+def test_outbox_upload(tmp_path: Path):
+    outbox = StandCloudOutbox(tmp_path)
+    for name in ("1", "2", "3"):
+        outbox.put(_Report(name))  # type: ignore
+    assert outbox.backlog == 3
+
+    loader = _Loader(HTTPStatus.CREATED)
+    assert outbox.upload(loader, batch_size=2) == 2  # type: ignore
+    assert loader.reports == [{"name": "1"}, {"name": "2"}]
+    assert outbox.backlog == 1
+
+
+def test_outbox_retry(tmp_path: Path):
+    outbox = StandCloudOutbox(tmp_path)
+    outbox.put(_Report("1"))  # type: ignore
+
+    with pytest.raises(StandCloudError):
+        outbox.upload(_Loader(HTTPStatus.SERVICE_UNAVAILABLE))  # type: ignore
+    assert outbox.backlog == 1
+    assert outbox.rejected == 0
+
+
+def test_outbox_reject(tmp_path: Path):
+    outbox = StandCloudOutbox(tmp_path)
+    outbox.put(_Report("1"))  # type: ignore
+    outbox.put(_Report("2"))  # type: ignore
+
+    assert outbox.upload(_Loader(HTTPStatus.UNPROCESSABLE_ENTITY)) == 0  # type: ignore
+    assert outbox.backlog == 0
+    assert outbox.rejected == 2
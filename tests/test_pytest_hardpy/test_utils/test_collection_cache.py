@@ -0,0 +1,33 @@
+import os
+from pathlib import Path
+
+from hardpy.pytest_hardpy.utils import CollectionCache
+
+
+def test_collection_cache(tmp_path: Path):
+    test_file = tmp_path / "test_module.py"
+    test_file.write_text("def test_one():\n    pass\n")
+    doc = {"name": "tests", "modules": {"test_module": {"cases": {}}}}
+
+    assert CollectionCache(tmp_path).load() is None
+    CollectionCache(tmp_path).save(doc)
+    assert CollectionCache(tmp_path).load() == doc
+
+    stat = test_file.stat()
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert CollectionCache(tmp_path).load() is None
+
+
+def test_collection_cache_ignores_hidden_dirs(tmp_path: Path):
+    CollectionCache(tmp_path).save({"name": "tests"})
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "module.py").write_text("")
+    assert CollectionCache(tmp_path).load() == {"name": "tests"}
+
+
+def test_collection_cache_slots(tmp_path: Path):
+    CollectionCache(tmp_path, "1").save({"name": "slot 1"})
+    CollectionCache(tmp_path, "2").save({"name": "slot 2"})
+    assert CollectionCache(tmp_path, "1").load() == {"name": "slot 1"}
+    assert CollectionCache(tmp_path, "2").load() == {"name": "slot 2"}
+    assert CollectionCache(tmp_path).load() is None
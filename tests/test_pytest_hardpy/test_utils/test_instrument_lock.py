@@ -0,0 +1,49 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from hardpy.pytest_hardpy.utils import InstrumentLock, InstrumentLockTimeoutError
+
+lock_holder = """
+import sys
+from pathlib import Path
+
+from hardpy.pytest_hardpy.utils import InstrumentLock
+
+with InstrumentLock(Path(sys.argv[1]), "dmm", 1):
+    print("locked", flush=True)
+    sys.stdin.readline()
+"""
+
+
+def test_instrument_lock_reentrant(tmp_path: Path):
+    lock = InstrumentLock(tmp_path, "dmm")
+    with lock, InstrumentLock(tmp_path, "dmm"):
+        assert lock.key == "dmm"
+    assert (tmp_path / "dmm.lock").exists()
+
+
+def test_instrument_lock_between_processes(tmp_path: Path):
+    proc = subprocess.Popen(
+        [sys.executable, "-c", lock_holder, str(tmp_path)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert proc.stdout.readline().strip() == "locked"
+        lock = InstrumentLock(tmp_path, "dmm", 1)
+        with pytest.raises(InstrumentLockTimeoutError):
+            lock.acquire(timeout=0.1)
+        with InstrumentLock(tmp_path, "dmm", 2):
+            pass
+
+        proc.stdin.write("\n")
+        proc.stdin.flush()
+        assert lock.acquire(timeout=10) >= 0
+        lock.release()
+    finally:
+        proc.stdin.close()
+        proc.wait()
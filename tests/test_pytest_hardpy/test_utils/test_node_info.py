@@ -0,0 +1,21 @@
+from pytest import Pytester
+
+from hardpy.pytest_hardpy.utils import NodeInfo
+
+
+def test_node_info_from_item(pytester: Pytester):
+    item = pytester.getitem(
+        """
+        import pytest
+
+        @pytest.mark.case_name("Case")
+        @pytest.mark.attempt(3)
+        def test_func():
+            pass
+    """,
+    )
+    node_info = NodeInfo.from_item(item)
+    assert node_info.case_id == "test_func"
+    assert node_info.case_name == "Case"
+    assert node_info.attempt == 3
+    assert NodeInfo.from_item(item) is node_info
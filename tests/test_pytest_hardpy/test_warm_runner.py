@@ -0,0 +1,45 @@
+import os
+import sys
+from pathlib import Path
+
+from hardpy.pytest_hardpy.db.backend import SqliteBackend
+from hardpy.pytest_hardpy.warm_runner import WarmRunner
+
+
+def test_warm_runner(tmp_path: Path):
+    (tmp_path / "test_module.py").write_text("def test_one():\n    pass\n")
+    warm_runner = WarmRunner(sys.executable, tmp_path)
+    warm_runner.prepare()
+    proc = warm_runner.start(["-q", "-p", "no:cacheprovider"])
+    assert proc is not None
+    assert proc.wait(timeout=60) == 0
+
+
+def test_warm_runner_changed_sources(tmp_path: Path):
+    test_file = tmp_path / "test_module.py"
+    test_file.write_text("def test_one():\n    pass\n")
+    warm_runner = WarmRunner(sys.executable, tmp_path)
+    warm_runner.prepare()
+    stat = test_file.stat()
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert warm_runner.start(["-q"]) is None
+
+
+def test_warm_runner_database_unchanged(tmp_path: Path):
+    (tmp_path / "test_module.py").write_text("def test_one():\n    pass\n")
+    (tmp_path / "pytest.ini").write_text(
+        "[pytest]\naddopts = --hardpy-pt --hardpy-db-backend sqlite\n",
+    )
+    sqlite_path = tmp_path / ".hardpy" / "database.sqlite3"
+    sqlite_path.parent.mkdir()
+    backends = [SqliteBackend(sqlite_path, name) for name in ("statestore", "runstore")]
+    for backend in backends:
+        backend.save({"_id": "localhost_8000", "status": "passed"})
+    docs = [backend.get_all_docs() for backend in backends]
+
+    warm_runner = WarmRunner(sys.executable, tmp_path)
+    warm_runner.prepare()
+    proc = warm_runner.start(["--collect-only", "-q", "-o", "addopts="])
+    assert proc is not None
+    assert proc.wait(timeout=60) == 0
+    assert [backend.get_all_docs() for backend in backends] == docs